@@ -0,0 +1,40 @@
+"""default_dns_logs_created_at
+
+Revision ID: a1b2c3d4e5f7
+Revises: f2a3b4c5d6e7
+Create Date: 2026-10-16 17:00:00.000000
+
+Give ``dns_logs.created_at`` a server-side ``DEFAULT now()``. Until now the
+application sent the ingest time on every row: the ORM used a Python-side
+default, and the bulk path wrote an explicit ``now()`` column in its
+INSERT ... SELECT.
+
+The column is kept rather than dropped. It is not a duplicate of
+``timestamp``. ``timestamp`` is when NextDNS resolved the query, while
+``created_at`` is when this instance ingested it, and ``/logs`` returns
+both. A backfill after an outage makes the two differ by hours.
+
+Changing a column default only touches the catalog. It does not rewrite
+the table, and the lock is held only briefly.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1b2c3d4e5f7"
+down_revision: Union[str, Sequence[str], None] = "f2a3b4c5d6e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Default created_at to the insert time on the server."""
+    op.execute("ALTER TABLE dns_logs ALTER COLUMN created_at SET DEFAULT now()")
+
+
+def downgrade() -> None:
+    """Drop the server-side default again."""
+    op.execute("ALTER TABLE dns_logs ALTER COLUMN created_at DROP DEFAULT")
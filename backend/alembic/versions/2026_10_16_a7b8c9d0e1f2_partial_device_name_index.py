@@ -0,0 +1,65 @@
+"""partial_device_name_index
+
+Revision ID: a7b8c9d0e1f2
+Revises: f5a6b7c8d9e0
+Create Date: 2026-10-16 11:00:00.000000
+
+Make the device stats index partial on ``device_name IS NOT NULL``.
+
+The device value was already promoted out of the JSON payload into the
+plain ``device_name`` column (c1d2e3f4a5b6), and the broken functional
+``data->>'device'`` indexes were dropped there. Every device read path
+only ever looks at rows that HAVE a device:
+
+- ``get_stats_devices()`` and the overview's "most active device" filter
+  on ``device_name IS NOT NULL`` before grouping.
+- The /logs device filter uses ``device_name IN (...)``, which PostgreSQL
+  proves implies ``device_name IS NOT NULL``.
+
+Queries resolved by IP without a configured device name carry NULL, and
+indexing them only bloats the index.
+
+Changes
+-------
+1. Create ``idx_dns_logs_timestamp_device_name_nn`` on
+   ``(timestamp DESC, device_name) WHERE device_name IS NOT NULL``.
+2. Drop the full ``idx_dns_logs_timestamp_device_name``.
+
+Concurrency
+-----------
+``dns_logs`` is partitioned (f5a6b7c8d9e0), and PostgreSQL does not support
+``CREATE/DROP INDEX CONCURRENTLY`` on partitioned tables. The index is
+built per partition under a SHARE lock. Inserts wait for the build, but
+reads continue.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b8c9d0e1f2"
+down_revision: Union[str, Sequence[str], None] = "f5a6b7c8d9e0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Swap the device_name index for a partial one."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_dns_logs_timestamp_device_name_nn "
+        "ON dns_logs (timestamp DESC, device_name) "
+        "WHERE device_name IS NOT NULL"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_dns_logs_timestamp_device_name")
+    op.execute("ANALYZE dns_logs")
+
+
+def downgrade() -> None:
+    """Restore the full device_name index."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_dns_logs_timestamp_device_name "
+        "ON dns_logs (timestamp DESC, device_name)"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_dns_logs_timestamp_device_name_nn")
@@ -0,0 +1,78 @@
+"""add_daily_domains_materialized_view
+
+Revision ID: b3c4d5e6f7a8
+Revises: a1b2c3d4e5f7
+Create Date: 2026-10-16 18:00:00.000000
+
+Add ``mv_dns_logs_domains_daily``, a materialized view holding one row per
+(UTC day, profile, domain, blocked) with the number of queries for it:
+
+    bucket       timestamptz  -- date_trunc('day', timestamp, 'UTC')
+    profile_id   varchar      -- '' for rows without a profile
+    domain       varchar
+    tld          varchar      -- '' for rows without a TLD
+    blocked      boolean
+    query_count  bigint
+
+Like ``mv_dns_logs_hourly`` it only holds complete UTC days and shares that
+view's watermark in ``system_settings``: both are refreshed together, so
+everything before the watermark is in both views.
+
+Why this helps
+--------------
+``/stats/domains`` and ``/stats/tlds`` GROUP BY domain/TLD over every row
+in the window. For 7d/30d/3m/all that is millions of rows per request.
+Complete days are now read from this view (a few thousand distinct domains
+per day) and only the partial first day plus everything since the
+watermark is aggregated from ``dns_logs``. Domain exclusions still apply,
+because the view keeps the full domain.
+
+The hourly view is refreshed here as well. The watermark is moved to today,
+so both views have to be complete up to it.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3c4d5e6f7a8"
+down_revision: Union[str, Sequence[str], None] = "a1b2c3d4e5f7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create and populate the daily domain counters view."""
+    op.execute(
+        "CREATE MATERIALIZED VIEW IF NOT EXISTS mv_dns_logs_domains_daily AS "
+        "SELECT date_trunc('day', timestamp, 'UTC') AS bucket, "
+        "COALESCE(profile_id, '') AS profile_id, "
+        "domain, "
+        "COALESCE(tld, '') AS tld, "
+        "blocked, "
+        "count(*) AS query_count "
+        "FROM dns_logs "
+        "WHERE timestamp < date_trunc('day', now(), 'UTC') "
+        "GROUP BY 1, 2, 3, 4, 5 "
+        "WITH DATA"
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_dns_logs_domains_daily "
+        "ON mv_dns_logs_domains_daily (bucket, profile_id, domain, tld, blocked)"
+    )
+    # Bring the hourly view up to the same watermark.
+    op.execute("REFRESH MATERIALIZED VIEW mv_dns_logs_hourly")
+    op.execute(
+        "INSERT INTO system_settings (key, value, updated_at) "
+        "VALUES ('hourly_stats_view_through', "
+        "to_char(date_trunc('day', now(), 'UTC') AT TIME ZONE 'UTC', "
+        "'YYYY-MM-DD\"T\"HH24:MI:SS+00:00'), now()) "
+        "ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, "
+        "updated_at = EXCLUDED.updated_at"
+    )
+
+
+def downgrade() -> None:
+    """Drop the daily domain counters view."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_dns_logs_domains_daily")
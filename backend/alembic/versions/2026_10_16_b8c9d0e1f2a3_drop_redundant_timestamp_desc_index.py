@@ -0,0 +1,59 @@
+"""drop_redundant_timestamp_desc_index
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-16 12:00:00.000000
+
+Drop ``idx_dns_logs_timestamp_desc``, a single-column btree whose only
+column is the leading column of three other indexes on the table:
+
+- ``idx_dns_logs_timestamp_profile_desc`` (timestamp DESC, profile_id)
+- ``idx_dns_logs_timestamp_action``       (timestamp DESC, action)
+- ``uq_dns_logs_timestamp_domain_client`` (timestamp, domain, client_ip)
+
+Any plan that ranges over ``timestamp`` (or orders by it) can use one of
+those composites with the same Index Cond. The wide-range case is also
+served by the BRIN index added in e4f5a6b7c8d9.
+
+The other redundancies named alongside it were already handled. Both
+``idx_dns_logs_tld`` and ``idx_dns_logs_tld_timestamp`` are gone (d3e4f5a6b7c8 /
+c1d2e3f4a5b6), as are ``idx_dns_logs_domain`` and
+``idx_dns_logs_domain_action``.
+
+Why this helps
+--------------
+Every INSERT from the worker updates every index in the target partition.
+One fewer btree means less write amplification and WAL per fetched row,
+and frees buffer cache for the indexes that are actually read.
+
+Concurrency
+-----------
+``dns_logs`` is partitioned (f5a6b7c8d9e0), so ``DROP INDEX CONCURRENTLY``
+is not available. The drop takes a brief ACCESS EXCLUSIVE lock per
+partition and does no table rewrite.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, Sequence[str], None] = "a7b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop the redundant timestamp-only btree."""
+    op.execute("DROP INDEX IF EXISTS idx_dns_logs_timestamp_desc")
+    op.execute("ANALYZE dns_logs")
+
+
+def downgrade() -> None:
+    """Re-create the timestamp-only btree."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_dns_logs_timestamp_desc "
+        "ON dns_logs (timestamp DESC)"
+    )
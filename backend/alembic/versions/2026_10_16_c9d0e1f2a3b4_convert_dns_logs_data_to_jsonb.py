@@ -0,0 +1,48 @@
+"""convert_dns_logs_data_to_jsonb
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-16 13:00:00.000000
+
+Convert ``dns_logs.data`` (the raw NextDNS payload) from ``json`` to
+``jsonb``.
+
+``json`` stores the original text and is re-parsed on every access; ``jsonb``
+is stored pre-parsed in a binary form that PostgreSQL can read without
+re-tokenising, and it de-duplicates keys and drops insignificant
+whitespace, so the TOASTed payload is usually smaller.
+
+The application no longer reads ``data`` on any hot path: stats use the
+promoted ``tld``/``device_name``/``blocked`` columns, and ``/logs`` only
+selects ``data`` when the caller asks for it with ``include_data=true``.
+
+Downtime
+--------
+Changing a column type rewrites every partition and holds an ACCESS
+EXCLUSIVE lock on ``dns_logs`` for the duration. Stop the worker before
+running ``alembic upgrade`` and restart the backend afterwards (pooled
+connections cache the ingest temp table's column types).
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c9d0e1f2a3b4"
+down_revision: Union[str, Sequence[str], None] = "b8c9d0e1f2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Rewrite dns_logs.data as jsonb."""
+    op.execute("ALTER TABLE dns_logs ALTER COLUMN data TYPE jsonb USING data::jsonb")
+    op.execute("ANALYZE dns_logs")
+
+
+def downgrade() -> None:
+    """Rewrite dns_logs.data back to json."""
+    op.execute("ALTER TABLE dns_logs ALTER COLUMN data TYPE json USING data::json")
+    op.execute("ANALYZE dns_logs")
@@ -0,0 +1,83 @@
+"""add_hourly_stats_materialized_view
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-16 15:00:00.000000
+
+Add ``mv_dns_logs_hourly``, a materialized view holding one row per
+(UTC hour, profile, blocked) with the number of queries in that bucket:
+
+    bucket       timestamptz  -- date_trunc('hour', timestamp, 'UTC')
+    profile_id   varchar      -- '' for rows without a profile
+    blocked      boolean
+    query_count  bigint
+
+Only complete UTC days are materialized (``timestamp < today 00:00 UTC`` at
+refresh time), so the view has a well-defined watermark: everything before
+the refresh day is in the view, everything after it is read from
+``dns_logs`` directly. The application records that watermark in
+``system_settings`` after each refresh.
+
+Why this helps
+--------------
+The day/week granularities of ``/stats/timeseries`` (7d, 30d, 3m, all)
+counted ``dns_logs`` twice per bucket: up to ~180 range counts over
+millions of rows for ``3m``. Summing pre-aggregated hourly buckets reads
+at most 24 × days × 2 rows from a table that is a few hundred KB.
+
+Refresh
+-------
+``REFRESH MATERIALIZED VIEW CONCURRENTLY`` requires a unique index without
+a WHERE clause, hence ``uq_mv_dns_logs_hourly``. The scheduler refreshes the
+view once a night, after retention cleanup and just before the heavy stats
+pre-computation that reads from it. A concurrent refresh does not block
+readers.
+
+``profile_id`` is COALESCEd to ``''`` because the unique index would treat
+NULLs as distinct and refuse a concurrent refresh.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f2a3b4c5d6"
+down_revision: Union[str, Sequence[str], None] = "d0e1f2a3b4c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create and populate the hourly counters view."""
+    op.execute(
+        "CREATE MATERIALIZED VIEW IF NOT EXISTS mv_dns_logs_hourly AS "
+        "SELECT date_trunc('hour', timestamp, 'UTC') AS bucket, "
+        "COALESCE(profile_id, '') AS profile_id, "
+        "blocked, "
+        "count(*) AS query_count "
+        "FROM dns_logs "
+        "WHERE timestamp < date_trunc('day', now(), 'UTC') "
+        "GROUP BY 1, 2, 3 "
+        "WITH DATA"
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_mv_dns_logs_hourly "
+        "ON mv_dns_logs_hourly (bucket, profile_id, blocked)"
+    )
+    # Watermark matching the data just materialized.
+    op.execute(
+        "INSERT INTO system_settings (key, value, updated_at) "
+        "VALUES ('hourly_stats_view_through', "
+        "to_char(date_trunc('day', now(), 'UTC') AT TIME ZONE 'UTC', "
+        "'YYYY-MM-DD\"T\"HH24:MI:SS+00:00'), now()) "
+        "ON CONFLICT (key) DO UPDATE SET value = EXCLUDED.value, "
+        "updated_at = EXCLUDED.updated_at"
+    )
+
+
+def downgrade() -> None:
+    """Drop the hourly counters view and its watermark."""
+    op.execute("DELETE FROM system_settings WHERE key = 'hourly_stats_view_through'")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_dns_logs_hourly")
@@ -0,0 +1,62 @@
+"""add_dns_logs_timestamp_brin_index
+
+Revision ID: e4f5a6b7c8d9
+Revises: d3e4f5a6b7c8
+Create Date: 2026-10-16 09:00:00.000000
+
+Add a BRIN index on ``dns_logs.timestamp`` for wide time-range scans.
+
+``dns_logs`` is append-only and rows arrive in (roughly) timestamp order,
+so the physical row order is almost perfectly correlated with
+``timestamp``. That is the ideal case for BRIN: the index stores only the
+min/max timestamp per block range, which makes it a few MB instead of the
+hundreds of MB taken by the btree ``idx_dns_logs_timestamp_desc``.
+
+Why this helps
+--------------
+1. Wide ranges (``/stats/overview?time_range=7d``, 30d, 3m) touch a large
+   fraction of the table. For those the planner can use a bitmap scan on
+   the BRIN index to skip whole block ranges instead of walking millions
+   of btree leaf entries.
+2. The BRIN index is tiny, so it stays resident in shared buffers, and it
+   adds almost no cost to the worker's INSERTs.
+3. The btree indexes are KEPT. They remain the better choice for short
+   ranges and ``ORDER BY timestamp DESC LIMIT n`` (the /logs page), and
+   the planner picks between them per query.
+
+``pages_per_range=32`` (default 128) trades a slightly larger index for
+tighter block pruning on the ~1–3 day boundaries the dashboard uses.
+
+Concurrency
+-----------
+Created with ``CREATE INDEX CONCURRENTLY`` so the worker can keep inserting
+while the index builds. This requires running outside an explicit
+transaction — Alembic's autocommit_block() handles that.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4f5a6b7c8d9"
+down_revision: Union[str, Sequence[str], None] = "d3e4f5a6b7c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the BRIN timestamp index concurrently."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_dns_logs_timestamp_brin "
+            "ON dns_logs USING BRIN (timestamp) WITH (pages_per_range = 32)"
+        )
+        op.execute("ANALYZE dns_logs")
+
+
+def downgrade() -> None:
+    """Drop the BRIN timestamp index."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_dns_logs_timestamp_brin")
@@ -0,0 +1,63 @@
+"""partial_blocked_timestamp_index
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-16 16:00:00.000000
+
+Replace the full ``idx_dns_logs_blocked (blocked)`` btree with a partial
+index that only holds blocked rows:
+
+    idx_dns_logs_ts_blocked ON dns_logs (timestamp DESC) WHERE blocked
+
+A two-value column is a poor btree key. ``blocked = true`` matches a large
+fraction of the table, so the planner rarely used the old index, yet every
+insert paid to maintain it. The queries that want blocked rows always add a
+time window too: the blocked counters, the top blocked domains, and /logs
+with ``status_filter=blocked``. A ``timestamp`` index restricted to blocked
+rows serves all of them. Allowed rows are never written to it, so it is a
+fraction of the size and stays cache-resident.
+
+The action indexes named in the original proposal are already gone.
+``idx_dns_logs_action`` went in d3e4f5a6b7c8 and
+``idx_dns_logs_timestamp_action`` in d0e1f2a3b4c5. No partial index is
+added for ``blocked = false``: allowed rows are the majority, so the
+covering ``idx_dns_logs_ts_cover`` index is the better access path for them.
+
+Predicate matching
+------------------
+The application filters with ``blocked = true`` / ``blocked = false``.
+PostgreSQL folds these to ``blocked`` / ``NOT blocked``, which matches the
+index predicate exactly. The earlier ``blocked IS true`` form did not.
+
+Concurrency
+-----------
+``dns_logs`` is partitioned, so the index is built per partition without
+CONCURRENTLY. Inserts wait for the build, but reads continue.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a3b4c5d6e7"
+down_revision: Union[str, Sequence[str], None] = "e1f2a3b4c5d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Swap the full blocked index for a partial timestamp index."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_dns_logs_ts_blocked "
+        "ON dns_logs (timestamp DESC) WHERE blocked"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_dns_logs_blocked")
+    op.execute("ANALYZE dns_logs")
+
+
+def downgrade() -> None:
+    """Restore the full blocked index."""
+    op.execute("CREATE INDEX IF NOT EXISTS idx_dns_logs_blocked ON dns_logs (blocked)")
+    op.execute("DROP INDEX IF EXISTS idx_dns_logs_ts_blocked")
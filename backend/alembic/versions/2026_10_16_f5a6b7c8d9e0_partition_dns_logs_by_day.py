@@ -0,0 +1,179 @@
+"""partition_dns_logs_by_day
+
+Revision ID: f5a6b7c8d9e0
+Revises: e4f5a6b7c8d9
+Create Date: 2026-10-16 10:00:00.000000
+
+Convert ``dns_logs`` into a table declaratively partitioned by
+``RANGE (timestamp)`` with one partition per UTC day.
+
+Every hot read path (stats overview/timeseries/domains/tlds/devices and
+/logs) filters on ``timestamp``. With daily partitions the planner prunes
+everything outside the requested window: ``time_range=7d`` scans 8 small
+partitions instead of the whole 13M+ row heap and its indexes.
+
+Changes
+-------
+1. Create ``dns_logs_new`` with the same columns (``LIKE dns_logs``)
+   partitioned by ``RANGE (timestamp)``, one daily partition
+   ``dns_logs_pYYYYMMDD`` from the oldest row to 7 days ahead, plus a
+   ``dns_logs_default`` catch-all so an insert can never fail for lack of
+   a partition.
+2. Copy all rows, drop the old table and rename the new one into place.
+   The existing ``dns_logs_id_seq`` sequence is re-owned, so ids continue.
+3. Recreate the primary key as ``(id, timestamp)`` (a partitioned table's
+   unique constraints must include the partition key),
+   ``uq_dns_logs_timestamp_domain_client`` (already includes it) and the
+   read-path indexes on the parent; they propagate to every partition.
+4. Install ``dns_logs_ensure_partitions(days_ahead)``, which the scheduler
+   calls on start-up and nightly to create upcoming daily partitions. Rows
+   that already landed in ``dns_logs_default`` for a day are moved into
+   that day's new partition, and a day that fails is skipped with a
+   warning instead of aborting the remaining days.
+
+Downtime
+--------
+This rewrites the whole table inside one transaction and holds an
+ACCESS EXCLUSIVE lock on ``dns_logs`` while doing so. Stop the worker
+(or set DISABLE_SCHEDULER) before running ``alembic upgrade``.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f5a6b7c8d9e0"
+down_revision: Union[str, Sequence[str], None] = "e4f5a6b7c8d9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Read-path indexes that exist on dns_logs as of e4f5a6b7c8d9.
+_INDEXES = (
+    "CREATE INDEX idx_dns_logs_blocked ON dns_logs (blocked)",
+    "CREATE INDEX idx_dns_logs_profile_timestamp "
+    "ON dns_logs (profile_id, timestamp)",
+    "CREATE INDEX idx_dns_logs_timestamp_desc ON dns_logs (timestamp DESC)",
+    "CREATE INDEX idx_dns_logs_timestamp_profile_desc "
+    "ON dns_logs (timestamp DESC, profile_id)",
+    "CREATE INDEX idx_dns_logs_timestamp_action "
+    "ON dns_logs (timestamp DESC, action)",
+    "CREATE INDEX idx_dns_logs_timestamp_device_name "
+    "ON dns_logs (timestamp DESC, device_name)",
+    "CREATE INDEX idx_dns_logs_timestamp_brin "
+    "ON dns_logs USING BRIN (timestamp) WITH (pages_per_range = 32)",
+)
+
+_ENSURE_PARTITIONS_FUNCTION = """
+CREATE OR REPLACE FUNCTION dns_logs_ensure_partitions(
+    days_ahead integer DEFAULT 7,
+    start_day date DEFAULT (now() AT TIME ZONE 'UTC')::date
+) RETURNS integer
+LANGUAGE plpgsql AS $$
+DECLARE
+    current_day date := start_day;
+    last_day date := (now() AT TIME ZONE 'UTC')::date + days_ahead;
+    partition_name text;
+    day_start timestamptz;
+    day_end timestamptz;
+    created integer := 0;
+BEGIN
+    WHILE current_day <= last_day LOOP
+        partition_name := 'dns_logs_p' || to_char(current_day, 'YYYYMMDD');
+        day_start := current_day::timestamp AT TIME ZONE 'UTC';
+        day_end := (current_day + 1)::timestamp AT TIME ZONE 'UTC';
+        IF to_regclass(partition_name) IS NULL THEN
+            -- Each day runs in its own subtransaction: a failure is logged
+            -- and rolled back without blocking the days after it.
+            BEGIN
+                -- Postgres refuses to create a partition while the default
+                -- partition holds rows for its range, so park them first.
+                EXECUTE 'CREATE TEMP TABLE dns_logs_moving (LIKE dns_logs_default)';
+                EXECUTE format(
+                    'WITH moved AS (DELETE FROM dns_logs_default '
+                    'WHERE timestamp >= %L AND timestamp < %L RETURNING *) '
+                    'INSERT INTO dns_logs_moving SELECT * FROM moved',
+                    day_start,
+                    day_end
+                );
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF dns_logs FOR VALUES FROM (%L) TO (%L)',
+                    partition_name,
+                    day_start,
+                    day_end
+                );
+                EXECUTE 'INSERT INTO dns_logs SELECT * FROM dns_logs_moving';
+                EXECUTE 'DROP TABLE dns_logs_moving';
+                created := created + 1;
+            EXCEPTION WHEN OTHERS THEN
+                RAISE WARNING 'could not create partition %: %',
+                    partition_name, SQLERRM;
+            END;
+        END IF;
+        current_day := current_day + 1;
+    END LOOP;
+    RETURN created;
+END;
+$$
+"""
+
+
+def upgrade() -> None:
+    """Rebuild dns_logs as a daily range-partitioned table."""
+    op.execute(
+        "CREATE TABLE dns_logs_new "
+        "(LIKE dns_logs INCLUDING DEFAULTS INCLUDING STORAGE) "
+        "PARTITION BY RANGE (timestamp)"
+    )
+    op.execute("CREATE TABLE dns_logs_default PARTITION OF dns_logs_new DEFAULT")
+
+    # Swap the tables first so dns_logs_ensure_partitions() (which targets
+    # "dns_logs") can create the daily partitions on the new parent.
+    op.execute("ALTER TABLE dns_logs RENAME TO dns_logs_old")
+    op.execute("ALTER TABLE dns_logs_new RENAME TO dns_logs")
+    op.execute(_ENSURE_PARTITIONS_FUNCTION)
+    op.execute(
+        "SELECT dns_logs_ensure_partitions(7, "
+        "COALESCE((SELECT min(timestamp) FROM dns_logs_old) AT TIME ZONE 'UTC', "
+        "now() AT TIME ZONE 'UTC')::date)"
+    )
+
+    op.execute("INSERT INTO dns_logs SELECT * FROM dns_logs_old")
+    op.execute("ALTER SEQUENCE dns_logs_id_seq OWNED BY dns_logs.id")
+    op.execute("DROP TABLE dns_logs_old")
+
+    op.execute(
+        "ALTER TABLE dns_logs ADD CONSTRAINT dns_logs_pkey PRIMARY KEY (id, timestamp)"
+    )
+    op.execute(
+        "ALTER TABLE dns_logs ADD CONSTRAINT uq_dns_logs_timestamp_domain_client "
+        "UNIQUE (timestamp, domain, client_ip)"
+    )
+    for statement in _INDEXES:
+        op.execute(statement)
+
+    op.execute("ANALYZE dns_logs")
+
+
+def downgrade() -> None:
+    """Collapse the partitions back into a single heap table."""
+    op.execute(
+        "CREATE TABLE dns_logs_flat "
+        "(LIKE dns_logs INCLUDING DEFAULTS INCLUDING STORAGE)"
+    )
+    op.execute("INSERT INTO dns_logs_flat SELECT * FROM dns_logs")
+    op.execute("ALTER SEQUENCE dns_logs_id_seq OWNED BY dns_logs_flat.id")
+    op.execute("DROP TABLE dns_logs")  # drops every partition with it
+    op.execute("DROP FUNCTION IF EXISTS dns_logs_ensure_partitions(integer, date)")
+    op.execute("ALTER TABLE dns_logs_flat RENAME TO dns_logs")
+
+    op.execute("ALTER TABLE dns_logs ADD CONSTRAINT dns_logs_pkey PRIMARY KEY (id)")
+    op.execute(
+        "ALTER TABLE dns_logs ADD CONSTRAINT uq_dns_logs_timestamp_domain_client "
+        "UNIQUE (timestamp, domain, client_ip)"
+    )
+    for statement in _INDEXES:
+        op.execute(statement)
+
+    op.execute("ANALYZE dns_logs")
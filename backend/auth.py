@@ -1,4 +1,6 @@
 # file: backend/auth.py
+import hashlib
+import hmac
 import os
 from datetime import datetime, timedelta, timezone
 from typing import Optional
@@ -30,6 +32,12 @@ AUTH_SECRET_KEY = os.getenv(
     "test-secret-key-for-testing-only-do-not-use-in-production-min-32-chars",
 )
 AUTH_ALGORITHM = "HS256"
+# Hashed once for the constant-time comparisons in authenticate_user().
+# Comparing fixed-size SHA-256 digests makes the work independent of the
+# submitted value's length and does not reveal the configured one's.
+_AUTH_USERNAME_DIGEST = hashlib.sha256(AUTH_USERNAME.encode("utf-8")).digest()
+_AUTH_PASSWORD_DIGEST = hashlib.sha256(AUTH_PASSWORD.encode("utf-8")).digest()
+_AUTH_PASSWORD_IS_HASH = AUTH_PASSWORD.startswith(("$2b$", "$2a$"))
 AUTH_SESSION_TIMEOUT = int(os.getenv("AUTH_SESSION_TIMEOUT", "60"))  # minutes
 
 # Validate AUTH_SECRET_KEY when authentication is enabled (production)
@@ -111,33 +119,40 @@ def decode_access_token(token: str) -> Optional[dict]:
         payload = jwt.decode(token, AUTH_SECRET_KEY, algorithms=[AUTH_ALGORITHM])
         return payload
     except JWTError as e:
-        logger.debug(f"🔒 JWT decode error: {e}")
+        logger.debug("🔒 JWT decode error: %s", e)
         return None
 
 
 # Authentication functions
+def _digest(value: str) -> bytes:
+    """SHA-256 digest of a submitted credential, for compare_digest()."""
+    return hashlib.sha256(value.encode("utf-8")).digest()
+
+
 def authenticate_user(username: str, password: str) -> bool:
     """Authenticate a user with username and password."""
-    if username != AUTH_USERNAME:
-        logger.warning(f"🔒 Authentication failed: invalid username '{username}'")
+    # hmac.compare_digest keeps the comparison time independent of how many
+    # leading characters match, so credentials can't be probed by timing.
+    if not hmac.compare_digest(_digest(username), _AUTH_USERNAME_DIGEST):
+        logger.warning("🔒 Authentication failed: invalid username '%s'", username)
         return False
 
     # If AUTH_PASSWORD is already a hash (starts with $2b$), verify against it
-    # Otherwise, hash the plain password and compare
-    if AUTH_PASSWORD.startswith("$2b$") or AUTH_PASSWORD.startswith("$2a$"):
+    # Otherwise, compare the plain password in constant time
+    if _AUTH_PASSWORD_IS_HASH:
         # It's already a hash, verify directly
         is_valid = verify_password(password, AUTH_PASSWORD)
     else:
-        # It's a plain password, hash and compare
+        # It's a plain password
         # This allows users to just put plain passwords in .env
-        is_valid = password == AUTH_PASSWORD
+        is_valid = hmac.compare_digest(_digest(password), _AUTH_PASSWORD_DIGEST)
 
     if not is_valid:
         logger.warning(
-            f"🔒 Authentication failed: invalid password for user '{username}'"
+            "🔒 Authentication failed: invalid password for user '%s'", username
         )
     else:
-        logger.info(f"🔒 User '{username}' authenticated successfully")
+        logger.info("🔒 User '%s' authenticated successfully", username)
 
     return is_valid
 
@@ -206,8 +221,8 @@ def init_auth():
     """Initialize authentication system and log configuration."""
     if AUTH_ENABLED:
         logger.info("🔒 Authentication system ENABLED")
-        logger.info(f"🔒 Session timeout: {AUTH_SESSION_TIMEOUT} minutes")
-        logger.info(f"🔒 Configured username: {AUTH_USERNAME}")
+        logger.info("🔒 Session timeout: %s minutes", AUTH_SESSION_TIMEOUT)
+        logger.info("🔒 Configured username: %s", AUTH_USERNAME)
         if not AUTH_PASSWORD:
             logger.warning(
                 "⚠️  AUTH_PASSWORD not set! Authentication will not work properly."
@@ -1,7 +1,85 @@
 # file: backend/logging_config.py
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+from datetime import datetime, timezone
+
+# Accepted LOG_LEVEL names
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Chatty third-party loggers capped at WARNING unless running at DEBUG
+_NOISY_LOGGERS = tuple(
+    logging.getLogger(name)
+    for name in ("urllib3", "requests", "apscheduler", "werkzeug")
+)
+_UVICORN_LOGGERS = tuple(
+    logging.getLogger(name) for name in ("uvicorn", "uvicorn.error", "uvicorn.access")
+)
+
+
+# Background listener that performs the actual stdout writes (see setup_logging)
+_LOG_LISTENER = None
+
+# Attributes every LogRecord carries; anything else was passed via extra=
+_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Render each record as one JSON object per line (LOG_FORMAT=json).
+
+    Fields passed with ``extra={...}`` are emitted as top-level keys so log
+    shippers can index them without parsing the message text.
+    """
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """Queue records untouched so the listener's formatter renders them.
+
+    The stock :meth:`QueueHandler.prepare` formats each record in the
+    calling thread and folds the traceback into ``msg``, which leaves the
+    listener nothing to format and drops JsonFormatter's ``exc_info`` field.
+    """
+
+    def prepare(self, record):
+        # Copy so handlers further up the chain still see the original
+        return copy.copy(record)
+
+
+def _apply_third_party_levels(log_level):
+    """Quieten noisy libraries and align uvicorn's loggers with *log_level*."""
+    # Suppress noisy third-party loggers in production
+    if log_level > logging.DEBUG:
+        for noisy_logger in _NOISY_LOGGERS:
+            noisy_logger.setLevel(logging.WARNING)
+
+    # Align uvicorn loggers so HTTP access logs respect our level setting
+    for uvicorn_logger in _UVICORN_LOGGERS:
+        uvicorn_logger.setLevel(log_level)
 
 
 def setup_logging():
@@ -14,23 +92,21 @@ def setup_logging():
     - WARNING: Warning messages for unexpected situations
     - ERROR: Error messages for serious problems
     - CRITICAL: Critical errors that may cause the program to abort
+
+    LOG_FORMAT=json switches the console output to one JSON object per line
+    (see JsonFormatter); the default is the human-readable text format.
     """
     # Get log level from environment variable, default to INFO
     log_level_str = os.getenv("LOG_LEVEL", "INFO").upper()
+    log_format = os.getenv("LOG_FORMAT", "text").lower()
 
     # Map string to logging level
-    log_levels = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL,
-    }
-
-    log_level = log_levels.get(log_level_str, logging.INFO)
+    log_level = LOG_LEVELS.get(log_level_str, logging.INFO)
 
     # Create formatter for log messages
-    if log_level == logging.DEBUG:
+    if log_format == "json":
+        formatter = JsonFormatter()
+    elif log_level == logging.DEBUG:
         # More detailed format for debugging
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s",
@@ -52,62 +128,56 @@ def setup_logging():
 
     # Create console handler with custom formatter
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
 
+    # Logging calls only enqueue the record; a listener thread formats it and
+    # writes to stdout, so request handlers never block on console I/O.
+    global _LOG_LISTENER  # pylint: disable=global-statement
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+    else:
+        atexit.register(_stop_log_listener)
+    log_queue = queue.SimpleQueue()
+    queue_handler = _RecordQueueHandler(log_queue)
+    queue_handler.setLevel(log_level)
+    _LOG_LISTENER = logging.handlers.QueueListener(log_queue, console_handler)
+    _LOG_LISTENER.start()
+
     # Get root logger and clear any existing handlers
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(queue_handler)
     root_logger.setLevel(log_level)
 
     # Log the configuration
     logger = logging.getLogger(__name__)
-    logger.info(f"📋 Logging configured with level: {log_level_str}")
+    logger.info("📋 Logging configured with level: %s", log_level_str)
 
-    # Suppress noisy third-party loggers in production
-    if log_level > logging.DEBUG:
-        logging.getLogger("urllib3").setLevel(logging.WARNING)
-        logging.getLogger("requests").setLevel(logging.WARNING)
-        logging.getLogger("apscheduler").setLevel(logging.WARNING)
-        logging.getLogger("werkzeug").setLevel(logging.WARNING)
-
-    # Align uvicorn loggers so HTTP access logs respect our level setting
-    for uvicorn_logger in ("uvicorn", "uvicorn.error", "uvicorn.access"):
-        logging.getLogger(uvicorn_logger).setLevel(log_level)
+    _apply_third_party_levels(log_level)
 
     return logger
 
 
+def _stop_log_listener():
+    """Flush queued records and stop the listener thread at interpreter exit."""
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+
+
 def apply_log_level(level: str) -> None:
     """Change the root logger level at runtime without full reconfiguration.
 
     Args:
         level: Log level string (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
-    log_levels = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL,
-    }
-    log_level = log_levels.get(level.upper(), logging.INFO)
+    log_level = LOG_LEVELS.get(level.upper(), logging.INFO)
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     for handler in root_logger.handlers:
         handler.setLevel(log_level)
 
     # Re-apply third-party suppression when not in DEBUG
-    if log_level > logging.DEBUG:
-        logging.getLogger("urllib3").setLevel(logging.WARNING)
-        logging.getLogger("requests").setLevel(logging.WARNING)
-        logging.getLogger("apscheduler").setLevel(logging.WARNING)
-        logging.getLogger("werkzeug").setLevel(logging.WARNING)
-
-    # Align uvicorn loggers so HTTP access logs respect our level setting
-    for uvicorn_logger in ("uvicorn", "uvicorn.error", "uvicorn.access"):
-        logging.getLogger(uvicorn_logger).setLevel(log_level)
+    _apply_third_party_levels(log_level)
 
 
 def get_logger(name):
@@ -1,18 +1,21 @@
 # file: backend/main.py
 import asyncio
+import logging
 import os
 import platform
-import secrets
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from typing import List, Optional, Dict, Any
 
 import psutil
-from fastapi import FastAPI, Depends, HTTPException, Query, Header, Request, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
+from pydantic_core import to_json
 from sqlalchemy.exc import SQLAlchemyError
 
 from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -37,6 +40,7 @@ from auth import (
 from models import (
     init_db,
     get_logs,
+    iter_logs,
     get_total_record_count,
     get_logs_stats,
     check_database_health,
@@ -57,7 +61,10 @@ from models import (
     get_retention_days,
     set_retention_days,
     RETENTION_MIN_DAYS,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
 )
+from models import engine as db_engine
 from models import get_available_profiles as get_profiles_from_db
 from models import (
     get_stats_overview as get_db_stats_overview,
@@ -67,21 +74,31 @@ from models import (
     get_stats_devices,
     get_database_metrics,
 )
-from stats_cache import get_cached, make_cache_key, store_cached
+from stats_cache import exclude_fingerprint, get_cached, make_cache_key, store_cached
 from profile_service import (
     get_profile_info,
     get_multiple_profiles_info,
     get_configured_profile_ids,
+    validate_api_key,
 )
 
 setup_logging()
 logger = get_logger(__name__)
 
-# Initialize rate limiter for brute force protection
-limiter = Limiter(key_func=get_remote_address)
+# Initialize rate limiter for brute force protection. Counters live in
+# process memory by default; with several API replicas/workers point
+# RATELIMIT_STORAGE_URI at a shared store (e.g. redis://redis:6379/1; the
+# redis client is in requirements.txt) so the login limit holds across all
+# of them.
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=os.getenv("RATELIMIT_STORAGE_URI", "memory://"),
+    strategy="moving-window",
+)
 
-# Track application start time for accurate uptime
-app_start_time = datetime.now(timezone.utc)
+# Track application start time for accurate uptime (monotonic: immune to
+# wall-clock adjustments and needs no datetime arithmetic per request)
+app_start_monotonic = time.monotonic()
 
 # Version from Docker build arg / environment variable
 APP_VERSION = os.getenv("APP_VERSION", "dev")
@@ -91,28 +108,77 @@ _github_release_cache: Dict[str, Any] = {"tag": None, "fetched_at": 0.0}
 GITHUB_CACHE_TTL_SECONDS = 3600  # 1 hour
 GITHUB_REPO = "BondIT-ApS/NextDNS-Optimized-Analytics"
 
+# CPU/memory/disk sample cache (5-second TTL) for /health/detailed, which
+# monitoring may poll every few seconds
+_system_usage_cache: Dict[str, Any] = {
+    "cpu": 0.0,
+    "memory": None,
+    "disk": None,
+    "sampled_at": 0.0,
+}
+SYSTEM_USAGE_TTL_SECONDS = 5
+
 # Scheduler initialization (can be disabled for K8s multi-pod deployments)
 # Default: enabled (backward compatible with Docker Compose and single-pod deployments)
 DISABLE_SCHEDULER = os.getenv("DISABLE_SCHEDULER", "false").lower() == "true"
+# Startup fetch interval as configured in the environment (reported by
+# /health/detailed; the live value is managed via /settings/system)
+FETCH_INTERVAL = int(os.getenv("FETCH_INTERVAL", "60"))
+
+# Blocking database calls get their own pool, one worker per pooled
+# connection. NextDNS/GitHub HTTPS calls and psutil sampling stay on the
+# default executor, so a few slow upstream requests can't occupy the workers
+# that DB-bound handlers need. The in-process scheduler draws on the same
+# engine pool, so a DB worker may still briefly wait on checkout while a
+# fetch cycle is writing.
+_DB_EXECUTOR = ThreadPoolExecutor(
+    max_workers=DB_POOL_SIZE + DB_MAX_OVERFLOW, thread_name_prefix="db-worker"
+)
+
+
+async def _run_db(func, *args, **kwargs):
+    """Run a blocking database call on the DB executor, off the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _DB_EXECUTOR, partial(func, *args, **kwargs)
+    )
+
 
-apscheduler_instance = None  # Holds the APScheduler instance when running
-if not DISABLE_SCHEDULER:
+def _start_scheduler():
+    """Start the in-process scheduler unless DISABLE_SCHEDULER is set.
+
+    Returns:
+        BackgroundScheduler: The running scheduler, or None if not started.
+    """
+    if DISABLE_SCHEDULER:
+        logger.info("🔇 Scheduler disabled (DISABLE_SCHEDULER=true)")
+        logger.info(
+            "💡 Use separate worker pod for DNS log fetching in K8s multi-pod setup"
+        )
+        return None
     try:
-        from scheduler import (  # pylint: disable=unused-import,duplicate-code
-            scheduler as _scheduler_module_scheduler,
+        from scheduler import (  # pylint: disable=import-outside-toplevel
+            start_scheduler,
         )
 
-        apscheduler_instance = _scheduler_module_scheduler
+        started = start_scheduler()
         logger.info("🔄 NextDNS log scheduler started successfully")
+        return started
     except ImportError as e:
-        logger.warning(f"⚠️  Could not start scheduler: {e}")
+        logger.warning("⚠️  Could not start scheduler: %s", e)
         logger.info("🧱 App will work but won't automatically fetch NextDNS logs")
-else:
-    logger.info("🔇 Scheduler disabled (DISABLE_SCHEDULER=true)")
-    logger.info(
-        "💡 Use separate worker pod for DNS log fetching in K8s multi-pod setup"
+        return None
+
+
+def _stop_scheduler(started):
+    """Stop the in-process scheduler if this process started it."""
+    if started is None:
+        return
+    from scheduler import (  # pylint: disable=import-outside-toplevel
+        shutdown_scheduler,
     )
 
+    shutdown_scheduler()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -123,10 +189,20 @@ async def lifespan(app: FastAPI):
     init_auth()  # Initialize authentication system
     if migrate_config_from_env():
         logger.info("🔑 NextDNS config seeded from environment variables")
+    # Held on app.state so request handlers can reschedule its jobs
+    app.state.scheduler = _start_scheduler()
+    # Prime psutil's CPU sampler; later non-blocking reads return the
+    # utilisation since the previous call instead of a meaningless 0.0.
+    psutil.cpu_percent(interval=None)
     logger.info("✅ FastAPI application startup completed")
     yield
-    # Shutdown (if needed in the future)
+    # Shutdown
     logger.info("👋 FastAPI application shutting down")
+    _stop_scheduler(app.state.scheduler)
+    app.state.scheduler = None
+    # Close pooled connections now rather than leaving PostgreSQL to time
+    # them out once the process is gone.
+    db_engine.dispose()
 
 
 # Initialize FastAPI app
@@ -156,24 +232,42 @@ app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 # Add CORS middleware
 # SECURITY: Get allowed origins from environment variable (comma-separated)
 # Default includes common development ports
-ALLOWED_ORIGINS = os.getenv(
-    "ALLOWED_ORIGINS",
-    "http://localhost:5002,http://localhost:5173,http://localhost:3000",
-).split(",")
-
-logger.info(f"🔒 CORS configured for origins: {', '.join(ALLOWED_ORIGINS)}")
-logger.warning(
-    "⚠️  SECURITY: Ensure ALLOWED_ORIGINS is properly configured for production"
-)
+_ALLOWED_ORIGINS_ENV = os.getenv("ALLOWED_ORIGINS")
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in (
+        _ALLOWED_ORIGINS_ENV
+        or "http://localhost:5002,http://localhost:5173,http://localhost:3000"
+    ).split(",")
+    if origin.strip()
+]
+# Set ENABLE_CORS=false when a reverse proxy serves frontend and API from
+# one origin (or handles CORS itself) to drop the middleware entirely
+ENABLE_CORS = os.getenv("ENABLE_CORS", "true").lower() == "true"
+
+if ENABLE_CORS:
+    logger.info("🔒 CORS configured for origins: %s", ", ".join(ALLOWED_ORIGINS))
+    # Only nag when the configuration actually needs attention
+    if "*" in ALLOWED_ORIGINS:
+        logger.warning(
+            "⚠️  SECURITY: ALLOWED_ORIGINS contains '*' - any site can call the API"
+        )
+    elif not _ALLOWED_ORIGINS_ENV:
+        logger.warning(
+            "⚠️  SECURITY: ALLOWED_ORIGINS not set - using localhost development "
+            "defaults; set it for production"
+        )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=ALLOWED_ORIGINS,  # Specific origins only - never use ["*"]
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["Content-Type", "Authorization", "X-API-Key"],
-    expose_headers=["X-Response-Time"],
-)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=ALLOWED_ORIGINS,  # Specific origins only - never use ["*"]
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        allow_headers=["Content-Type", "Authorization", "X-API-Key"],
+        expose_headers=["X-Response-Time"],
+    )
+else:
+    logger.info("🔇 CORS middleware disabled (ENABLE_CORS=false)")
 
 # Add performance monitoring middleware (only in DEBUG mode)
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -186,61 +280,9 @@ else:
     )
 
 # Authentication setup
-security = HTTPBearer()
 LOCAL_API_KEY = os.getenv("LOCAL_API_KEY")
 
 
-def verify_api_key(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    """Authenticate user with API key."""
-    if not credentials or not credentials.credentials:
-        raise HTTPException(
-            status_code=401,
-            detail="API key required",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    if not secrets.compare_digest(credentials.credentials, LOCAL_API_KEY or ""):
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid API key",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    return "authenticated"
-
-
-# Flexible authentication supporting both Bearer and X-API-Key
-def verify_api_key_flexible(
-    x_api_key: str = Header(None),
-    credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False)),
-):
-    """Authenticate user with API key via Bearer token or X-API-Key header."""
-    api_key = None
-
-    # Try Bearer token first
-    if credentials and credentials.credentials:
-        api_key = credentials.credentials
-    # Fall back to X-API-Key header
-    elif x_api_key:
-        api_key = x_api_key
-
-    if not api_key:
-        raise HTTPException(
-            status_code=401,
-            detail="API key required via Authorization header (Bearer token) or X-API-Key header",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    if not secrets.compare_digest(api_key, LOCAL_API_KEY or ""):
-        raise HTTPException(
-            status_code=401,
-            detail="Invalid API key",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    return "authenticated"
-
-
 # Pydantic models for request/response
 
 
@@ -514,14 +556,14 @@ class VersionResponse(BaseModel):
 async def root():
     """Root endpoint for health check."""
     try:
-        check_database_health()
+        await _run_db(check_database_health)
         return {
             "message": "NextDNS Optimized Analytics API",
             "version": APP_VERSION,
             "status": "running",
         }
     except (SQLAlchemyError, ValueError, TypeError) as e:
-        logger.error(f"❌ Root health check failed - database offline: {e}")
+        logger.error("❌ Root health check failed - database offline: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail={
@@ -537,11 +579,12 @@ async def root():
 async def health_check():
     """Simple health check endpoint."""
     try:
-        # Quick database connectivity check
-        check_database_health()
+        # Quick database connectivity check (blocking driver call, so run it
+        # in a worker thread rather than on the event loop)
+        await _run_db(check_database_health)
         return HealthResponse(status="healthy", healthy=True)
     except (SQLAlchemyError, ValueError, TypeError) as e:
-        logger.error(f"❌ Health check failed - database offline: {e}")
+        logger.error("❌ Health check failed - database offline: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail={"status": "unhealthy", "healthy": False},
@@ -572,10 +615,10 @@ def _fetch_github_latest_release() -> Optional[str]:
         tag = resp.json().get("tag_name")
         _github_release_cache["tag"] = tag
         _github_release_cache["fetched_at"] = now
-        logger.debug(f"📦 GitHub latest release fetched: {tag}")
+        logger.debug("📦 GitHub latest release fetched: %s", tag)
         return tag
     except Exception as e:
-        logger.warning(f"⚠️  GitHub release check failed (graceful degradation): {e}")
+        logger.warning("⚠️  GitHub release check failed (graceful degradation): %s", e)
         # Update timestamp even on failure to avoid hammering GitHub on errors
         _github_release_cache["fetched_at"] = now
         return _github_release_cache["tag"]  # stale value or None
@@ -597,11 +640,33 @@ async def get_version():
     return VersionResponse(version=APP_VERSION, latest=latest, up_to_date=up_to_date)
 
 
+def _sample_system_usage():
+    """Return ``(cpu_percent, virtual_memory, disk_usage)``, refreshed every 5s.
+
+    CPU usage is read without a sampling interval: it covers the time since
+    the previous sample (or startup) and never blocks the event loop. Holding
+    it for the TTL also keeps back-to-back probes from measuring a
+    near-zero window.
+    """
+    now = time.monotonic()
+    if (
+        _system_usage_cache["memory"] is None
+        or (now - _system_usage_cache["sampled_at"]) >= SYSTEM_USAGE_TTL_SECONDS
+    ):
+        _system_usage_cache["cpu"] = psutil.cpu_percent(interval=None)
+        _system_usage_cache["memory"] = psutil.virtual_memory()
+        _system_usage_cache["disk"] = psutil.disk_usage("/")
+        _system_usage_cache["sampled_at"] = now
+    return (
+        _system_usage_cache["cpu"],
+        _system_usage_cache["memory"],
+        _system_usage_cache["disk"],
+    )
+
+
 def _create_backend_resources(uptime_seconds: float) -> BackendResources:
-    """Create backend resource metrics."""
-    cpu_percent = psutil.cpu_percent(interval=1)
-    memory = psutil.virtual_memory()
-    disk = psutil.disk_usage("/")
+    """Create backend resource metrics from the cached system sample."""
+    cpu_percent, memory, disk = _sample_system_usage()
 
     return BackendResources(
         cpu_percent=cpu_percent,
@@ -615,8 +680,13 @@ def _create_backend_resources(uptime_seconds: float) -> BackendResources:
     )
 
 
+@lru_cache(maxsize=1)
 def _create_backend_stack() -> BackendStack:
-    """Create backend stack information."""
+    """Create backend stack information.
+
+    Platform and CPU details are fixed for the life of the process, so the
+    result is built on the first health check and reused afterwards.
+    """
     return BackendStack(
         platform=platform.system(),
         platform_release=platform.release(),
@@ -628,8 +698,9 @@ def _create_backend_stack() -> BackendStack:
     )
 
 
+@lru_cache(maxsize=1)
 def _create_frontend_stack() -> FrontendStack:
-    """Create frontend stack information."""
+    """Create frontend stack information (static, built once)."""
     return FrontendStack(
         framework="React 19.1.1",
         build_tool="Vite 7.1.6",
@@ -651,7 +722,7 @@ def _get_database_metrics() -> Optional[DatabaseMetrics]:
             health=DatabaseHealth(**db_metrics_data["health"]),
         )
     except (SQLAlchemyError, ValueError, TypeError, KeyError) as e:
-        logger.warning(f"⚠️ Could not collect database metrics: {e}")
+        logger.warning("⚠️ Could not collect database metrics: %s", e)
         return None
 
 
@@ -659,53 +730,59 @@ def _get_database_metrics() -> Optional[DatabaseMetrics]:
 async def detailed_health_check():
     """Detailed health check with comprehensive system information."""
     try:
-        # Database connectivity check (lightweight SELECT 1)
-        check_database_health()
+        # Calculate uptime
+        uptime_seconds = time.monotonic() - app_start_monotonic
+
+        # The probes are independent blocking calls: run them side by side in
+        # worker threads. A failed connectivity check (SELECT 1) raises out of
+        # gather() into the 503 handler below.
+        _, total_records, backend_resources, database_metrics = await asyncio.gather(
+            _run_db(check_database_health),
+            # Estimated record count (uses pg_class, no table scan)
+            _run_db(get_total_record_count),
+            asyncio.to_thread(_create_backend_resources, uptime_seconds),
+            _run_db(_get_database_metrics),
+        )
         db_healthy = True  # If we get here, database is accessible
         api_healthy = True  # API is responding if we get here
         overall_healthy = db_healthy and api_healthy
 
-        # Get estimated record count (uses pg_class, no table scan)
-        total_records = get_total_record_count()
-
-        # Calculate uptime
-        uptime_seconds = (datetime.now(timezone.utc) - app_start_time).total_seconds()
-
-        # Get environment configuration
-        fetch_interval = int(os.getenv("FETCH_INTERVAL", "60"))
-        log_level = os.getenv("LOG_LEVEL", "INFO")
-
         # Create metrics components
-        backend_resources = _create_backend_resources(uptime_seconds)
         backend_health = BackendHealth(status="healthy", uptime_seconds=uptime_seconds)
         backend_metrics = BackendMetrics(
             resources=backend_resources, health=backend_health
         )
         backend_stack = _create_backend_stack()
         frontend_stack = _create_frontend_stack()
-        database_metrics = _get_database_metrics()
 
         logger.debug(
-            f"🏥 Detailed health check completed - "
-            f"Overall: {overall_healthy}, DB: {db_healthy}, API: {api_healthy}"
+            "🏥 Detailed health check completed - Overall: %s, DB: %s, API: %s",
+            overall_healthy,
+            db_healthy,
+            api_healthy,
         )
 
-        return DetailedHealthResponse(
+        health = DetailedHealthResponse(
             status_api="healthy" if api_healthy else "unhealthy",
             status_db="healthy" if db_healthy else "unhealthy",
             healthy=overall_healthy,
             total_dns_records=total_records,
-            fetch_interval_minutes=fetch_interval,
-            log_level=log_level,
+            # Environment configuration (read once at import)
+            fetch_interval_minutes=FETCH_INTERVAL,
+            log_level=LOG_LEVEL,
             backend_metrics=backend_metrics,
             backend_stack=backend_stack,
             database_metrics=database_metrics,
             frontend_stack=frontend_stack,
             timestamp=datetime.now(timezone.utc).isoformat(),
         )
+        # The model was just validated on construction; serialise it directly
+        # instead of letting FastAPI dump it and validate it a second time
+        # against the same response_model.
+        return Response(content=to_json(health), media_type="application/json")
 
     except (SQLAlchemyError, ValueError, TypeError, KeyError, OSError) as e:
-        logger.error(f"❌ Detailed health check failed - database offline: {e}")
+        logger.error("❌ Detailed health check failed - database offline: %s", e)
         # Return minimal error response with 503 status
         error_backend_metrics = BackendMetrics(
             resources=BackendResources(
@@ -763,13 +840,18 @@ async def detailed_health_check():
 # Authentication Endpoints
 
 
+# Both bodies depend only on import-time settings: encode them once and
+# hand the same bytes to every request.
+_AUTH_CONFIG_BODY = to_json(
+    AuthConfig(enabled=AUTH_ENABLED, session_timeout_minutes=AUTH_SESSION_TIMEOUT)
+)
+_LOGOUT_BODY = to_json({"message": "Logged out successfully"})
+
+
 @app.get("/auth/config", response_model=AuthConfig, tags=["Authentication"])
 async def get_auth_config():
     """Get authentication configuration (whether auth is enabled)."""
-    return AuthConfig(
-        enabled=AUTH_ENABLED,
-        session_timeout_minutes=AUTH_SESSION_TIMEOUT,
-    )
+    return Response(content=_AUTH_CONFIG_BODY, media_type="application/json")
 
 
 @app.post("/auth/login", response_model=LoginResponse, tags=["Authentication"])
@@ -802,7 +884,7 @@ async def login(request: Request, login_data: LoginRequest):
 @app.post("/auth/logout", tags=["Authentication"])
 async def logout():
     """Logout endpoint. Client should remove token."""
-    return {"message": "Logged out successfully"}
+    return Response(content=_LOGOUT_BODY, media_type="application/json")
 
 
 @app.get("/auth/status", response_model=AuthStatus, tags=["Authentication"])
@@ -817,8 +899,13 @@ async def get_auth_status(current_user: str = Depends(get_current_user)):
 @app.get("/stats", response_model=StatsResponse, tags=["Statistics"])
 async def get_stats(current_user: str = Depends(get_current_user)):
     """Get database statistics."""
-    total_records = get_total_record_count()
-    logger.info(f"📊 Stats requested: {total_records:,} total records")
+    total_records = await _run_db(get_total_record_count)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "📊 Stats requested: %s total records",
+            format(total_records, ","),
+            extra={"total_records": total_records},
+        )
 
     return StatsResponse(
         total_records=total_records,
@@ -842,12 +929,20 @@ async def get_logs_statistics(
 ):
     """Get statistics for DNS logs in the database, optionally filtered by profile and time range."""
     logger.debug(
-        f"📊 API request for logs statistics (profile: '{profile}', time_range: '{time_range}', exclude: {exclude})"
+        "📊 API request for logs statistics (profile: '%s', time_range: '%s', exclude: %s)",
+        profile,
+        time_range,
+        exclude,
     )
-    stats = get_logs_stats(
-        profile_filter=profile, time_range=time_range, exclude_domains=exclude
+    # Blocking SQLAlchemy call — run it in a worker thread so the event loop
+    # keeps serving other requests while PostgreSQL counts.
+    stats = await _run_db(
+        get_logs_stats,
+        profile_filter=profile,
+        time_range=time_range,
+        exclude_domains=exclude,
     )
-    logger.info(f"📊 Returning stats: {stats}")
+    logger.info("📊 Returning stats: %s", stats)
     return LogsStatsResponse(**stats)
 
 
@@ -879,6 +974,9 @@ async def get_dns_logs(  # pylint: disable=too-many-positional-arguments
         description="Maximum number of records to return",
     ),
     offset: int = Query(default=0, ge=0, description="Number of records to skip"),
+    include_data: bool = Query(
+        default=False, description="Include the raw NextDNS payload for each log"
+    ),
     current_user: str = Depends(get_current_user),
 ):
     """
@@ -892,14 +990,25 @@ async def get_dns_logs(  # pylint: disable=too-many-positional-arguments
     - **time_range**: Time range filter (30m, 1h, 6h, 24h, 7d, 30d, 3m, all)
     - **limit**: Maximum number of records to return (1-10000)
     - **offset**: Number of records to skip for pagination
+    - **include_data**: Include the raw NextDNS payload (off by default)
     """
     logger.debug(
-        f"📊 API request: exclude={exclude}, search='{search}', "
-        f"status={status_filter}, profile='{profile}', devices={devices}, "
-        f"time_range='{time_range}', limit={limit}, offset={offset}"
+        "📊 API request: exclude=%s, search='%s', status=%s, profile='%s', "
+        "devices=%s, time_range='%s', limit=%s, offset=%s",
+        exclude,
+        search,
+        status_filter,
+        profile,
+        devices,
+        time_range,
+        limit,
+        offset,
     )
 
-    logs, filtered_total_records = get_logs(
+    # Blocking SQLAlchemy call — run it in a worker thread so the event loop
+    # keeps serving other requests while the page is fetched.
+    logs, filtered_total_records = await _run_db(
+        get_logs,
         exclude_domains=exclude,
         search_query=search,
         status_filter=status_filter,
@@ -908,26 +1017,107 @@ async def get_dns_logs(  # pylint: disable=too-many-positional-arguments
         time_range=time_range,
         limit=limit,
         offset=offset,
+        include_data=include_data,
     )
 
     logger.info(
-        f"📊 Returning {len(logs)} DNS logs from {filtered_total_records} filtered records"
+        "📊 Returning %d DNS logs from %d filtered records",
+        len(logs),
+        filtered_total_records,
     )
 
-    return LogsResponse(
-        data=logs,
-        total_records=filtered_total_records,
-        returned_records=len(logs),
-        excluded_domains=exclude,
+    # get_logs() already returns rows in the DNSLogResponse shape, so skip
+    # building up to 10,000 response models and serialise the plain dicts
+    # with pydantic-core's JSON encoder. Returning a Response bypasses
+    # FastAPI's response_model pass; the model still documents the schema.
+    return Response(
+        content=to_json(
+            {
+                "data": logs,
+                "total_records": filtered_total_records,
+                "returned_records": len(logs),
+                "excluded_domains": exclude,
+            }
+        ),
+        media_type="application/json",
     )
 
 
+@app.get("/logs/stream", tags=["Logs"])
+async def stream_dns_logs(  # pylint: disable=too-many-positional-arguments
+    exclude: Optional[List[str]] = Query(
+        default=None,
+        description="Domains/patterns to exclude from results (supports wildcards: *.apple.com, tracking.*)",
+    ),
+    search: Optional[str] = Query(
+        default="", description="Search query for domain names"
+    ),
+    status_filter: Optional[str] = Query(
+        default="all", description="Filter by status: all, blocked, allowed"
+    ),
+    profile: Optional[str] = Query(
+        default=None, description="Filter by specific profile ID"
+    ),
+    devices: Optional[List[str]] = Query(
+        default=None, description="Filter by specific device names"
+    ),
+    time_range: str = Query(
+        default="all", description="Time range: 30m, 1h, 6h, 24h, 7d, 30d, 3m, all"
+    ),
+    limit: int = Query(
+        default=10000,
+        ge=1,
+        le=1000000,
+        description="Maximum number of records to stream",
+    ),
+    include_data: bool = Query(
+        default=False, description="Include the raw NextDNS payload for each log"
+    ),
+    current_user: str = Depends(get_current_user),
+):
+    """
+    Stream DNS logs as newline-delimited JSON (one log object per line).
+
+    Accepts the same filters as **/logs** but reads through a server-side
+    cursor and writes rows as they arrive, so large exports start
+    immediately and never buffer the whole result in memory. No total
+    count is returned.
+    """
+    logger.debug(
+        "📊 API stream request: exclude=%s, search='%s', status=%s, profile='%s', "
+        "devices=%s, time_range='%s', limit=%s",
+        exclude,
+        search,
+        status_filter,
+        profile,
+        devices,
+        time_range,
+        limit,
+    )
+
+    rows = iter_logs(
+        exclude_domains=exclude,
+        search_query=search,
+        status_filter=status_filter,
+        profile_filter=profile,
+        device_filter=devices,
+        time_range=time_range,
+        limit=limit,
+        include_data=include_data,
+    )
+    # A sync generator: Starlette drains it in the threadpool, so the
+    # database reads never block the event loop.
+    # Same pydantic-core encoder as /logs
+    lines = (to_json(row) + b"\n" for row in rows)
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
 @app.get("/profiles", response_model=ProfileListResponse, tags=["Profiles"])
 async def list_available_profiles(current_user: str = Depends(get_current_user)):
     """Get list of available profiles with their record counts and last activity."""
     logger.debug("🧱 API request for available profiles")
-    profiles = get_profiles_from_db()
-    logger.info(f"🧱 Returning {len(profiles)} profiles")
+    profiles = await _run_db(get_profiles_from_db)
+    logger.info("🧱 Returning %d profiles", len(profiles))
     return ProfileListResponse(profiles=profiles, total_profiles=len(profiles))
 
 
@@ -936,12 +1126,15 @@ async def get_profile_information(current_user: str = Depends(get_current_user))
     """Get detailed information for all configured profiles from NextDNS API."""
     logger.debug("🧱 API request for profile information")
 
-    configured_profiles = get_configured_profile_ids()
+    configured_profiles = await _run_db(get_configured_profile_ids)
     if not configured_profiles:
         return ProfileInfoResponse(profiles={}, total_profiles=0)
 
-    profile_info = get_multiple_profiles_info(configured_profiles)
-    logger.info(f"🧱 Returning information for {len(profile_info)} profiles")
+    # Blocking HTTPS calls to NextDNS — keep them off the event loop.
+    profile_info = await asyncio.to_thread(
+        get_multiple_profiles_info, configured_profiles
+    )
+    logger.info("🧱 Returning information for %d profiles", len(profile_info))
 
     return ProfileInfoResponse(profiles=profile_info, total_profiles=len(profile_info))
 
@@ -955,19 +1148,49 @@ async def get_single_profile_info(
     profile_id: str, current_user: str = Depends(get_current_user)
 ):
     """Get detailed information for a specific profile from NextDNS API."""
-    logger.debug(f"🧱 API request for profile {profile_id} information")
+    logger.debug("🧱 API request for profile %s information", profile_id)
 
-    profile_info = get_profile_info(profile_id)
+    profile_info = await asyncio.to_thread(get_profile_info, profile_id)
     if not profile_info:
         raise HTTPException(
             status_code=404,
             detail=f"Profile {profile_id} not found or could not be fetched",
         )
 
-    logger.info(f"🧱 Returning information for profile {profile_id}")
+    logger.info("🧱 Returning information for profile %s", profile_id)
     return NextDNSProfileInfo(**profile_info)
 
 
+# Cache misses being computed right now, by stats cache key. A dashboard
+# refresh fires several identical requests at once; they share one run.
+_STATS_INFLIGHT: Dict[str, asyncio.Future] = {}
+
+
+def _compute_and_store(cache_key: str, persistent: bool, compute, kwargs):
+    """Compute a stat in a worker thread and put it in the stats cache."""
+    value = compute(**kwargs)
+    store_cached(cache_key, value, persistent=persistent)
+    return value
+
+
+async def _compute_stat_once(cache_key: str, persistent: bool, compute, **kwargs):
+    """Compute a cache-missed stat, sharing one run among identical requests.
+
+    The first caller starts *compute* in a worker thread; callers arriving
+    with the same key before it finishes await the same task instead of
+    running the aggregation again.
+    """
+    task = _STATS_INFLIGHT.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _run_db(_compute_and_store, cache_key, persistent, compute, kwargs)
+        )
+        _STATS_INFLIGHT[cache_key] = task
+        task.add_done_callback(lambda _: _STATS_INFLIGHT.pop(cache_key, None))
+    # Shielded so one client disconnecting doesn't cancel the shared run
+    return await asyncio.shield(task)
+
+
 @app.get("/stats/overview", response_model=StatsOverviewResponse, tags=["Statistics"])
 async def get_stats_overview(
     profile: Optional[str] = Query(
@@ -984,24 +1207,31 @@ async def get_stats_overview(
 ):
     """Get overview statistics for the dashboard."""
     logger.debug(
-        f"📊 Stats overview request: profile={profile}, time_range={time_range}, exclude={exclude}"
+        "📊 Stats overview request: profile=%s, time_range=%s, exclude=%s",
+        profile,
+        time_range,
+        exclude,
     )
 
-    # Cache only unfiltered requests (no custom domain exclusions)
-    if not exclude:
-        cache_key = make_cache_key("overview", profile, time_range)
-        cached = get_cached(cache_key)
-        if cached is not None:
-            return StatsOverviewResponse(**cached)
-
-    # Cache miss or filtered request — compute live
-    stats = get_db_stats_overview(
-        profile_filter=profile, time_range=time_range, exclude_domains=exclude
+    # Unfiltered requests use both cache levels; custom exclusions are
+    # cached in memory only, keyed by a fingerprint of the exclude list
+    persistent = not exclude
+    extra = {} if persistent else {"exclude": exclude_fingerprint(exclude)}
+    cache_key = make_cache_key("overview", profile, time_range, **extra)
+    cached = get_cached(cache_key, persistent=persistent)
+    if cached is not None:
+        return StatsOverviewResponse(**cached)
+
+    # Cache miss — compute live
+    stats = await _compute_stat_once(
+        cache_key,
+        persistent,
+        get_db_stats_overview,
+        profile_filter=profile,
+        time_range=time_range,
+        exclude_domains=exclude,
     )
 
-    if not exclude:
-        store_cached(cache_key, stats)
-
     return StatsOverviewResponse(**stats)
 
 
@@ -1046,53 +1276,43 @@ async def get_stats_timeseries(
         }
         granularity = granularity_map.get(time_range, "hour")
 
-    # Cache only unfiltered status-mode requests
-    use_cache = group_by == "status"
-    if use_cache:
-        cache_key = make_cache_key(
-            "timeseries", profile, time_range, gran=granularity, group=group_by
-        )
-        cached = get_cached(cache_key)
-        if cached is not None:
-            time_series_data = [TimeSeriesDataPoint(**point) for point in cached]
-            return TimeSeriesResponse(
-                data=time_series_data,
-                granularity=granularity,
-                total_points=len(time_series_data),
-            )
-
-    # Cache miss or profile-grouping request — compute live
-    result = get_db_stats_timeseries(
-        profile_filter=profile,
-        time_range=time_range,
-        granularity=granularity,
-        group_by=group_by,
+    # Only status-mode keys are refreshed by the scheduler, so profile-mode
+    # results stay in the memory cache where the TTL bounds their age.
+    persistent = group_by == "status"
+    cache_key = make_cache_key(
+        "timeseries", profile, time_range, gran=granularity, group=group_by
     )
+    result = get_cached(cache_key, persistent=persistent)
+    if result is None:
+        result = await _compute_stat_once(
+            cache_key,
+            persistent,
+            get_db_stats_timeseries,
+            profile_filter=profile,
+            time_range=time_range,
+            granularity=granularity,
+            group_by=group_by,
+        )
 
     # Handle different return types based on group_by mode
     if group_by == "profile":
         # Result is a dict with data, granularity, total_points, available_profiles
         data_points = result.get("data", [])
         available_profiles = result.get("available_profiles", [])
-        time_series_data = [TimeSeriesDataPoint(**point) for point in data_points]
 
+        # The point dicts are validated as one list by pydantic-core
         return TimeSeriesResponse(
-            data=time_series_data,
+            data=data_points,
             granularity=granularity,
-            total_points=len(time_series_data),
+            total_points=len(data_points),
             available_profiles=available_profiles,
         )
 
     # Legacy mode: result is a list of data points
-    if use_cache:
-        store_cached(cache_key, result)
-
-    time_series_data = [TimeSeriesDataPoint(**point) for point in result]
-
     return TimeSeriesResponse(
-        data=time_series_data,
+        data=result,
         granularity=granularity,
-        total_points=len(time_series_data),
+        total_points=len(result),
     )
 
 
@@ -1115,46 +1335,32 @@ async def get_top_domains(
 ):
     """Get top blocked and allowed domains."""
     logger.debug(
-        f"📊 Top domains request: profile={profile}, time_range={time_range}, limit={limit}, exclude={exclude}"
-    )
-
-    # Cache only unfiltered requests with default limit
-    if not exclude and limit == 10:
-        cache_key = make_cache_key("domains", profile, time_range, limit=limit)
-        cached = get_cached(cache_key)
-        if cached is not None:
-            blocked_domains = [
-                TopDomainsItem(**item) for item in cached["blocked_domains"]
-            ]
-            allowed_domains = [
-                TopDomainsItem(**item) for item in cached["allowed_domains"]
-            ]
-            return TopDomainsResponse(
-                blocked_domains=blocked_domains, allowed_domains=allowed_domains
-            )
-
-    # Cache miss or filtered/custom-limit request — compute live
-    domains_data = get_db_top_domains(
-        profile_filter=profile,
-        time_range=time_range,
-        limit=limit,
-        exclude_domains=exclude,
+        "📊 Top domains request: profile=%s, time_range=%s, limit=%s, exclude=%s",
+        profile,
+        time_range,
+        limit,
+        exclude,
     )
 
-    if not exclude and limit == 10:
-        store_cached(cache_key, domains_data)
-
-    # Convert to TopDomainsItem objects
-    blocked_domains = [
-        TopDomainsItem(**item) for item in domains_data["blocked_domains"]
-    ]
-    allowed_domains = [
-        TopDomainsItem(**item) for item in domains_data["allowed_domains"]
-    ]
+    # Only default requests are refreshed by the scheduler; custom limits and
+    # exclusions stay in the memory cache, where the TTL bounds their age.
+    persistent = limit == 10 and not exclude
+    extra = {"exclude": exclude_fingerprint(exclude)} if exclude else {}
+    cache_key = make_cache_key("domains", profile, time_range, limit=limit, **extra)
+    domains_data = get_cached(cache_key, persistent=persistent)
+    if domains_data is None:
+        domains_data = await _compute_stat_once(
+            cache_key,
+            persistent,
+            get_db_top_domains,
+            profile_filter=profile,
+            time_range=time_range,
+            limit=limit,
+            exclude_domains=exclude,
+        )
 
-    return TopDomainsResponse(
-        blocked_domains=blocked_domains, allowed_domains=allowed_domains
-    )
+    # Validate both ranked lists in one pass instead of item by item
+    return TopDomainsResponse.model_validate(domains_data)
 
 
 @app.get("/stats/tlds", response_model=TopTLDsResponse, tags=["Statistics"])
@@ -1182,34 +1388,32 @@ async def get_top_tlds(
     - www.google.com → google.com
     """
     logger.debug(
-        f"📊 Top TLDs request: profile={profile}, time_range={time_range}, limit={limit}, exclude={exclude}"
-    )
-
-    # Cache only unfiltered requests with default limit
-    if not exclude and limit == 10:
-        cache_key = make_cache_key("tlds", profile, time_range, limit=limit)
-        cached = get_cached(cache_key)
-        if cached is not None:
-            blocked_tlds = [TopDomainsItem(**item) for item in cached["blocked_tlds"]]
-            allowed_tlds = [TopDomainsItem(**item) for item in cached["allowed_tlds"]]
-            return TopTLDsResponse(blocked_tlds=blocked_tlds, allowed_tlds=allowed_tlds)
-
-    # Cache miss or filtered/custom-limit request — compute live
-    tlds_data = get_stats_tlds(
-        profile_filter=profile,
-        time_range=time_range,
-        limit=limit,
-        exclude_domains=exclude,
+        "📊 Top TLDs request: profile=%s, time_range=%s, limit=%s, exclude=%s",
+        profile,
+        time_range,
+        limit,
+        exclude,
     )
 
-    if not exclude and limit == 10:
-        store_cached(cache_key, tlds_data)
-
-    # Convert to TopDomainsItem objects (reusing same structure)
-    blocked_tlds = [TopDomainsItem(**item) for item in tlds_data["blocked_tlds"]]
-    allowed_tlds = [TopDomainsItem(**item) for item in tlds_data["allowed_tlds"]]
+    # Only default requests are refreshed by the scheduler; custom limits and
+    # exclusions stay in the memory cache, where the TTL bounds their age.
+    persistent = limit == 10 and not exclude
+    extra = {"exclude": exclude_fingerprint(exclude)} if exclude else {}
+    cache_key = make_cache_key("tlds", profile, time_range, limit=limit, **extra)
+    tlds_data = get_cached(cache_key, persistent=persistent)
+    if tlds_data is None:
+        tlds_data = await _compute_stat_once(
+            cache_key,
+            persistent,
+            get_stats_tlds,
+            profile_filter=profile,
+            time_range=time_range,
+            limit=limit,
+            exclude_domains=exclude,
+        )
 
-    return TopTLDsResponse(blocked_tlds=blocked_tlds, allowed_tlds=allowed_tlds)
+    # Validate both ranked lists in one pass instead of item by item
+    return TopTLDsResponse.model_validate(tlds_data)
 
 
 @app.get("/devices", response_model=DeviceStatsResponse, tags=["Devices"])
@@ -1227,21 +1431,20 @@ async def get_devices(
     Returns device names and basic statistics for the specified profile and time range.
     This endpoint is optimized for populating device filter dropdowns.
     """
-    logger.debug(f"📱 Devices request: profile={profile}, time_range={time_range}")
+    logger.debug("📱 Devices request: profile=%s, time_range=%s", profile, time_range)
 
     # Cache only the standard limit=10 request (dropdown needs up to 50, skip cache)
     # Get device statistics (reuse existing function but with higher limit)
-    device_results = get_stats_devices(
+    device_results = await _run_db(
+        get_stats_devices,
         profile_filter=profile,
         time_range=time_range,
         limit=50,  # Get more devices for filtering
         exclude_devices=None,
     )
 
-    # Convert to DeviceUsageItem objects
-    devices = [DeviceUsageItem(**device) for device in device_results]
-
-    return DeviceStatsResponse(devices=devices)
+    # The device dicts are validated as one list by pydantic-core
+    return DeviceStatsResponse(devices=device_results)
 
 
 @app.get("/stats/devices", response_model=DeviceStatsResponse, tags=["Statistics"])
@@ -1271,34 +1474,39 @@ async def get_device_stats(
     Useful for network monitoring, troubleshooting, and identifying device behavior patterns.
     """
     logger.debug(
-        f"📱 Device stats request: profile={profile}, time_range={time_range}, "
-        f"limit={limit}, exclude_devices={exclude}, exclude_domains={exclude_domains}"
-    )
-
-    # Cache only unfiltered requests with default limit
-    if not exclude and not exclude_domains and limit == 10:
-        cache_key = make_cache_key("devices", profile, time_range, limit=limit)
-        cached = get_cached(cache_key)
-        if cached is not None:
-            devices = [DeviceUsageItem(**device) for device in cached]
-            return DeviceStatsResponse(devices=devices)
-
-    # Cache miss or filtered/custom-limit request — compute live
-    device_results = get_stats_devices(
-        profile_filter=profile,
-        time_range=time_range,
-        limit=limit,
-        exclude_devices=exclude,
-        exclude_domains=exclude_domains,
+        "📱 Device stats request: profile=%s, time_range=%s, limit=%s, "
+        "exclude_devices=%s, exclude_domains=%s",
+        profile,
+        time_range,
+        limit,
+        exclude,
+        exclude_domains,
     )
 
-    if not exclude and not exclude_domains and limit == 10:
-        store_cached(cache_key, device_results)
-
-    # Convert to DeviceUsageItem objects
-    devices = [DeviceUsageItem(**device) for device in device_results]
+    # Only default requests are refreshed by the scheduler; custom limits and
+    # exclusions stay in the memory cache, where the TTL bounds their age.
+    persistent = limit == 10 and not exclude and not exclude_domains
+    extra = {}
+    if exclude:
+        extra["exclude"] = exclude_fingerprint(exclude)
+    if exclude_domains:
+        extra["exclude_domains"] = exclude_fingerprint(exclude_domains)
+    cache_key = make_cache_key("devices", profile, time_range, limit=limit, **extra)
+    device_results = get_cached(cache_key, persistent=persistent)
+    if device_results is None:
+        device_results = await _compute_stat_once(
+            cache_key,
+            persistent,
+            get_stats_devices,
+            profile_filter=profile,
+            time_range=time_range,
+            limit=limit,
+            exclude_devices=exclude,
+            exclude_domains=exclude_domains,
+        )
 
-    return DeviceStatsResponse(devices=devices)
+    # The device dicts are validated as one list by pydantic-core
+    return DeviceStatsResponse(devices=device_results)
 
 
 # ---------------------------------------------------------------------------
@@ -1363,22 +1571,6 @@ def _mask_api_key(key: str) -> str:
     return "•" * (len(key) - 4) + key[-4:]
 
 
-def _validate_nextdns_api_key(api_key: str) -> bool:
-    """Check the key against the NextDNS API by listing profiles.
-
-    Returns True if the key is accepted (HTTP 200), False otherwise.
-    """
-    try:
-        response = __import__("requests").get(
-            "https://api.nextdns.io/profiles",
-            headers={"X-Api-Key": api_key},
-            timeout=10,
-        )
-        return response.status_code == 200
-    except Exception:  # pylint: disable=broad-exception-caught
-        return False
-
-
 @app.get(
     "/settings/nextdns/api-key",
     response_model=ApiKeyResponse,
@@ -1388,7 +1580,7 @@ async def get_api_key_setting(
     current_user: str = Depends(get_current_user),
 ):
     """Return whether a NextDNS API key is configured and its masked value."""
-    key = get_nextdns_api_key()
+    key = await _run_db(get_nextdns_api_key)
     if not key:
         return ApiKeyResponse(configured=False)
     return ApiKeyResponse(configured=True, masked_key=_mask_api_key(key))
@@ -1408,13 +1600,14 @@ async def update_api_key_setting(
     if not api_key:
         raise HTTPException(status_code=400, detail="api_key must not be empty")
 
-    if not _validate_nextdns_api_key(api_key):
+    # Blocking HTTP call on the shared keep-alive session, off the event loop
+    if not await asyncio.to_thread(validate_api_key, api_key):
         raise HTTPException(
             status_code=422,
             detail="API key rejected by NextDNS — check that it is valid",
         )
 
-    if not set_nextdns_api_key(api_key):
+    if not await _run_db(set_nextdns_api_key, api_key):
         raise HTTPException(status_code=500, detail="Failed to save API key")
 
     logger.info("🔑 NextDNS API key updated via settings endpoint")
@@ -1430,7 +1623,7 @@ async def list_settings_profiles(
     current_user: str = Depends(get_current_user),
 ):
     """Return all configured NextDNS profiles (enabled and disabled)."""
-    rows = get_all_profiles()
+    rows = await _run_db(get_all_profiles)
     items = [
         SettingsProfileItem(
             profile_id=r.profile_id,
@@ -1459,27 +1652,28 @@ async def add_settings_profile(
         raise HTTPException(status_code=400, detail="profile_id must not be empty")
 
     # Verify the profile exists on NextDNS
-    api_key = get_nextdns_api_key()
+    api_key = await _run_db(get_nextdns_api_key)
     if not api_key:
         raise HTTPException(
             status_code=422,
             detail="No NextDNS API key configured — set it via PUT /settings/nextdns/api-key first",
         )
 
-    profile_info = get_profile_info(profile_id)
+    # NextDNS HTTPS call (up to a 10 s timeout), off the event loop
+    profile_info = await asyncio.to_thread(get_profile_info, profile_id)
     if not profile_info or profile_info.get("error"):
         raise HTTPException(
             status_code=422,
             detail=f"Profile '{profile_id}' not found or not accessible with the current API key",
         )
 
-    if not add_profile(profile_id):
+    if not await _run_db(add_profile, profile_id):
         raise HTTPException(
             status_code=409,
             detail=f"Profile '{profile_id}' already exists",
         )
 
-    row = get_profile(profile_id)
+    row = await _run_db(get_profile, profile_id)
     return SettingsProfileItem(
         profile_id=row.profile_id,
         enabled=row.enabled,
@@ -1499,12 +1693,12 @@ async def update_settings_profile(
     current_user: str = Depends(get_current_user),
 ):
     """Enable or disable a NextDNS profile."""
-    if not update_profile_enabled(profile_id, body.enabled):
+    if not await _run_db(update_profile_enabled, profile_id, body.enabled):
         raise HTTPException(
             status_code=404,
             detail=f"Profile '{profile_id}' not found",
         )
-    row = get_profile(profile_id)
+    row = await _run_db(get_profile, profile_id)
     return SettingsProfileItem(
         profile_id=row.profile_id,
         enabled=row.enabled,
@@ -1527,7 +1721,7 @@ async def delete_settings_profile(
     current_user: str = Depends(get_current_user),
 ):
     """Delete a profile and optionally purge all its DNS log data."""
-    result = delete_profile(profile_id, delete_data=purge_data)
+    result = await _run_db(delete_profile, profile_id, delete_data=purge_data)
     if not result["deleted"]:
         raise HTTPException(
             status_code=404,
@@ -1566,11 +1760,8 @@ class SystemSettingsUpdateRequest(BaseModel):
     retention_days: Optional[int] = None
 
 
-@app.get("/settings/system", response_model=SystemSettingsResponse, tags=["Settings"])
-async def get_system_settings(
-    current_user: str = Depends(get_current_user),
-):
-    """Return current scheduler and application settings."""
+def _read_system_settings() -> SystemSettingsResponse:
+    """Read the current system settings (blocking DB reads; run in a thread)."""
     return SystemSettingsResponse(
         fetch_interval=get_fetch_interval(),
         fetch_limit=get_fetch_limit(),
@@ -1579,8 +1770,17 @@ async def get_system_settings(
     )
 
 
+@app.get("/settings/system", response_model=SystemSettingsResponse, tags=["Settings"])
+async def get_system_settings(
+    current_user: str = Depends(get_current_user),
+):
+    """Return current scheduler and application settings."""
+    return await _run_db(_read_system_settings)
+
+
 @app.put("/settings/system", response_model=SystemSettingsResponse, tags=["Settings"])
 async def update_system_settings(
+    request: Request,
     body: SystemSettingsUpdateRequest,
     current_user: str = Depends(get_current_user),
 ):
@@ -1591,19 +1791,22 @@ async def update_system_settings(
                 status_code=422,
                 detail="fetch_interval must be between 1 and 1440 minutes",
             )
-        set_fetch_interval(body.fetch_interval)
-        if apscheduler_instance is not None:
+        await _run_db(set_fetch_interval, body.fetch_interval)
+        running_scheduler = getattr(request.app.state, "scheduler", None)
+        if running_scheduler is not None:
             try:
-                apscheduler_instance.reschedule_job(
+                running_scheduler.reschedule_job(
                     "fetch_logs",
                     trigger="interval",
                     minutes=body.fetch_interval,
                 )
                 logger.info(
-                    f"⏰ Scheduler rescheduled to {body.fetch_interval} minutes"
+                    "⏰ Scheduler rescheduled to %d minutes",
+                    body.fetch_interval,
+                    extra={"fetch_interval": body.fetch_interval},
                 )
             except Exception as e:  # pylint: disable=broad-exception-caught
-                logger.warning(f"⚠️  Could not reschedule job: {e}")
+                logger.warning("⚠️  Could not reschedule job: %s", e)
 
     if body.fetch_limit is not None:
         if not 10 <= body.fetch_limit <= 1000:
@@ -1611,8 +1814,12 @@ async def update_system_settings(
                 status_code=422,
                 detail="fetch_limit must be between 10 and 1000",
             )
-        set_fetch_limit(body.fetch_limit)
-        logger.info(f"📊 Fetch limit updated to {body.fetch_limit}")
+        await _run_db(set_fetch_limit, body.fetch_limit)
+        logger.info(
+            "📊 Fetch limit updated to %d",
+            body.fetch_limit,
+            extra={"fetch_limit": body.fetch_limit},
+        )
 
     if body.log_level is not None:
         level = body.log_level.upper()
@@ -1621,8 +1828,8 @@ async def update_system_settings(
                 status_code=422,
                 detail=f"log_level must be one of: {', '.join(sorted(VALID_LOG_LEVELS))}",
             )
-        logger.info(f"📋 Log level changing to: {level}")
-        set_log_level(level)
+        logger.info("📋 Log level changing to: %s", level, extra={"log_level": level})
+        await _run_db(set_log_level, level)
         apply_log_level(level)
 
     if body.retention_days is not None:
@@ -1641,25 +1848,33 @@ async def update_system_settings(
                 status_code=422,
                 detail="retention_days must be at most 3650 (10 years)",
             )
-        set_retention_days(body.retention_days)
+        await _run_db(set_retention_days, body.retention_days)
         if body.retention_days == 0:
             logger.info("🪟 Log retention disabled (unlimited)")
         else:
             logger.info(
-                f"🪟 Log retention updated to {body.retention_days} days "
-                f"(cleanup runs nightly at 00:30 UTC)"
+                "🪟 Log retention updated to %d days "
+                "(cleanup runs nightly at 00:30 UTC)",
+                body.retention_days,
+                extra={"retention_days": body.retention_days},
             )
 
-    return SystemSettingsResponse(
-        fetch_interval=get_fetch_interval(),
-        fetch_limit=get_fetch_limit(),
-        log_level=get_log_level(),
-        retention_days=get_retention_days(),
-    )
+    return await _run_db(_read_system_settings)
 
 
 if __name__ == "__main__":
     import uvicorn
 
     logger.info("🖥️  Starting FastAPI server with uvicorn on 0.0.0.0:5000")
-    uvicorn.run(app, host="0.0.0.0", port=5000, log_level="info")
+    # uvloop/httptools ship with uvicorn[standard]. A single process only:
+    # the scheduler and the in-memory caches live in this process.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=5000,
+        loop="uvloop",
+        http="httptools",
+        backlog=2048,
+        access_log=False,
+        log_level="info",
+    )
@@ -1,15 +1,24 @@
 # file: backend/models.py
+import io
 import json
 import os
 import re
+import threading
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from typing import Optional
 
 from sqlalchemy import (
+    and_,
     case,
     create_engine,
+    select,
+    union_all,
+    BigInteger,
     Column,
     Integer,
+    MetaData,
+    Table,
     String,
     Text,
     DateTime,
@@ -17,11 +26,15 @@ from sqlalchemy import (
     Index,
     TypeDecorator,
     UniqueConstraint,
+    false,
     func,
     text,
+    true,
     or_,
 )
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import sessionmaker, declarative_base, defer
 from sqlalchemy.exc import SQLAlchemyError
 from cachetools import TTLCache
 
@@ -53,16 +66,31 @@ def extract_tld(domain):
     if not domain or not isinstance(domain, str):
         return domain
 
-    try:
-        # Simple regex approach: extract the last two parts of the domain
-        # This works for most common cases but won't handle complex TLDs
-        match = re.match(r"^(?:.*\.)?(\w[\w-]*\.[a-zA-Z]{2,})$", domain.lower())
-        if match:
-            return match.group(1)
-        return domain
-    except (AttributeError, IndexError) as e:
-        logger.debug(f"Failed to extract TLD from '{domain}': {e}")
-        return domain
+    return _extract_tld_cached(domain)
+
+
+# Simple regex approach: extract the last two parts of the domain
+# This works for most common cases but won't handle complex TLDs
+_TLD_PATTERN = re.compile(r"^(?:.*\.)?(\w[\w-]*\.[a-zA-Z]{2,})$")
+
+
+@lru_cache(maxsize=8192)
+def _extract_tld_cached(domain):
+    """Memoised regex extraction; a fetch batch repeats the same few domains."""
+    match = _TLD_PATTERN.match(domain.lower())
+    if match:
+        return match.group(1)
+    return domain
+
+
+@lru_cache(maxsize=1024)
+def _decode_device_json(device_json):
+    """Memoised json.loads for the ``device`` column.
+
+    A page of /logs repeats the same handful of device strings thousands of
+    times. Callers get a shallow copy so the cached dict is never mutated.
+    """
+    return json.loads(device_json)
 
 
 def build_domain_exclusion_filter(domain_column, exclude_domains):
@@ -88,8 +116,12 @@ def build_domain_exclusion_filter(domain_column, exclude_domains):
     if not exclude_domains or len(exclude_domains) == 0:
         return None
 
-    # Separate exact matches from wildcard patterns
-    exact_matches = []
+    # Separate exact matches from wildcard patterns. Both are compared
+    # case-insensitively, so duplicates that differ only in case are
+    # dropped here instead of being shipped to PostgreSQL as extra
+    # NOT IN values / ILIKE branches.
+    exact_matches = {}
+    seen_wildcards = set()
     wildcard_conditions = []
 
     for pattern in exclude_domains:
@@ -105,7 +137,7 @@ def build_domain_exclusion_filter(domain_column, exclude_domains):
             # Validate pattern - reject overly broad patterns for performance
             if pattern in ("*", "**", "*.*"):
                 logger.warning(
-                    f"⚠️ Rejecting overly broad wildcard pattern: '{pattern}'"
+                    "⚠️ Rejecting overly broad wildcard pattern: '%s'", pattern
                 )
                 continue
 
@@ -114,26 +146,31 @@ def build_domain_exclusion_filter(domain_column, exclude_domains):
             sql_pattern = pattern.replace("_", "\\_").replace("%", "\\%")
             # Replace * with SQL LIKE %
             sql_pattern = sql_pattern.replace("*", "%")
+            if sql_pattern.lower() in seen_wildcards:
+                continue
+            seen_wildcards.add(sql_pattern.lower())
 
             # Add condition for this pattern (case-insensitive)
             wildcard_conditions.append(domain_column.ilike(sql_pattern))
             logger.debug(
-                f"🔍 Wildcard pattern: '{pattern}' → SQL ILIKE '{sql_pattern}'"
+                "🔍 Wildcard pattern: '%s' → SQL ILIKE '%s'", pattern, sql_pattern
             )
         else:
-            # Exact match
-            exact_matches.append(pattern)
+            # Exact match (kept lowercase, first occurrence wins)
+            exact_matches.setdefault(pattern.lower(), None)
 
     # Build combined filter conditions
     conditions = []
 
     # Add exact match exclusion (case-insensitive using lowercase comparison)
     if exact_matches:
-        # Convert patterns to lowercase for case-insensitive matching
-        lowercase_patterns = [p.lower() for p in exact_matches]
-        conditions.append(~func.lower(domain_column).in_(lowercase_patterns))
+        # Patterns are already lowercased for case-insensitive matching; the
+        # list binds as one expanding parameter, so every list length shares
+        # the same compiled statement.
+        conditions.append(~func.lower(domain_column).in_(list(exact_matches)))
         logger.debug(
-            f"🚫 Excluding {len(exact_matches)} exact domain matches (case-insensitive)"
+            "🚫 Excluding %d exact domain matches (case-insensitive)",
+            len(exact_matches),
         )
 
     # Add wildcard exclusions (using NOT LIKE for each)
@@ -142,7 +179,7 @@ def build_domain_exclusion_filter(domain_column, exclude_domains):
         # NOT (pattern1 OR pattern2) = domain doesn't match any pattern
         combined_wildcards = or_(*wildcard_conditions)
         conditions.append(~combined_wildcards)
-        logger.debug(f"🔍 Excluding {len(wildcard_conditions)} wildcard patterns")
+        logger.debug("🔍 Excluding %d wildcard patterns", len(wildcard_conditions))
 
     # Combine all conditions with AND
     if len(conditions) == 0:
@@ -150,11 +187,39 @@ def build_domain_exclusion_filter(domain_column, exclude_domains):
     if len(conditions) == 1:
         return conditions[0]
     # Both exact and wildcard conditions exist
-    from sqlalchemy import and_
-
     return and_(*conditions)
 
 
+# Rolling windows accepted by the ``time_range`` parameter ("all" = unbounded)
+TIME_RANGE_DELTAS = {
+    "30m": timedelta(minutes=30),
+    "1h": timedelta(hours=1),
+    "6h": timedelta(hours=6),
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30),
+    "3m": timedelta(days=90),  # 3 months = ~90 days
+}
+
+
+def _time_range_filter(time_range, now=None):
+    """Build the ``timestamp >= cutoff`` predicate for a rolling time range.
+
+    The bare indexed ``timestamptz`` column is compared against a
+    timezone-aware datetime. There is no BETWEEN, tsrange or cast on the
+    column, so PostgreSQL can use it as an Index Cond and prune daily
+    partitions. Windows end at "now", so there is no upper bound. Bucketed
+    queries pair this with ``timestamp < end`` (half-open).
+
+    Returns:
+        The SQLAlchemy predicate, or None for "all"/unknown ranges.
+    """
+    delta = TIME_RANGE_DELTAS.get(time_range)
+    if delta is None:
+        return None
+    return DNSLog.timestamp >= (now or datetime.now(timezone.utc)) - delta
+
+
 # Custom Text type that forces TEXT without JSON casting
 class ForceText(TypeDecorator):  # pylint: disable=too-many-ancestors
     """Custom SQLAlchemy type that forces values to be stored as text."""
@@ -197,7 +262,29 @@ ssl_mode = os.getenv("PGSSLMODE") or os.getenv("POSTGRES_SSL_MODE", "")
 if ssl_mode:
     DATABASE_URL += f"?sslmode={ssl_mode}"
 
-engine = create_engine(DATABASE_URL, echo=False)
+# query_cache_size: SQLAlchemy caches the compiled SQL of every statement
+# shape it sees. The /logs and stats filters combine into many distinct
+# shapes (profile × status × device × exclusions × range), which overflowed
+# the default of 500 and forced recompilation on the hot read path.
+#
+# Pool sizing: API handlers run their queries in worker threads, each holding
+# one pooled connection, so pool_size + max_overflow caps concurrent DB work
+# (main.py sizes its thread pool to match).
+#
+# pool_use_lifo hands out the most recently returned connection first. At
+# typical dashboard load that keeps requests on a few warm backends (catalog
+# and relation caches already populated) instead of rotating through all of
+# them, and lets the rest go idle.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    query_cache_size=1200,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_use_lifo=True,
+)
 session_factory = sessionmaker(bind=engine)
 
 
@@ -207,6 +294,8 @@ class DNSLog(Base):
 
     __tablename__ = "dns_logs"
 
+    # In PostgreSQL the table is partitioned by day on ``timestamp`` and the
+    # primary key is (id, timestamp); id alone is still unique (sequence).
     id = Column(Integer, primary_key=True, autoincrement=True)
     timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
     domain = Column(String(255), nullable=False, index=True)
@@ -216,7 +305,7 @@ class DNSLog(Base):
     device = Column(ForceText, nullable=True)  # Store device info as JSON string
     client_ip = Column(String(45))  # Support IPv4 and IPv6
     query_type = Column(String(10), default="A")  # A, AAAA, CNAME, etc.
-    blocked = Column(Boolean, default=False, nullable=False, index=True)
+    blocked = Column(Boolean, default=False, nullable=False)
     profile_id = Column(String(50), index=True)
     tld = Column(
         String(255), nullable=True
@@ -224,10 +313,14 @@ class DNSLog(Base):
     device_name = Column(
         String(255), nullable=True
     )  # Extracted device name for fast aggregation (avoids JSON parsing per row)
-    data = Column(ForceText, nullable=False)  # Store original raw data as JSON string
+    data = Column(
+        ForceText, nullable=False
+    )  # Original raw payload; JSONB in PostgreSQL (bound as a JSON string)
+    # Ingest time, filled in by the database (a1b2c3d4e5f7) so inserts don't
+    # have to send it.
     created_at = Column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
         nullable=False,
     )
 
@@ -237,6 +330,13 @@ class DNSLog(Base):
         # dropped in migration d3e4f5a6b7c8 (issue #183).
         # idx_dns_logs_domain_action removed — had 0 scans, dropped in migration c1d2e3f4a5b6
         Index("idx_dns_logs_profile_timestamp", "profile_id", "timestamp"),
+        # Blocked rows only (f2a3b4c5d6e7). Filter with ``blocked == true()``
+        # so PostgreSQL can match the partial predicate.
+        Index(
+            "idx_dns_logs_ts_blocked",
+            "timestamp",
+            postgresql_where=text("blocked"),
+        ),
         # Unique constraint to prevent duplicates based on
         # timestamp, domain, and client_ip
         UniqueConstraint(
@@ -281,12 +381,21 @@ class FetchStatus(Base):
     )
 
 
+# Liveness/readiness probes hit /, /health and /health/detailed every few
+# seconds on every pod. A successful ping is reused for two seconds so a
+# burst of probes costs one SELECT 1; failures are never cached.
+_DB_HEALTH_CACHE: TTLCache = TTLCache(maxsize=1, ttl=2)  # 2-second TTL
+_DB_HEALTH_CACHE_KEY = "ok"
+_DB_HEALTH_LOCK = threading.Lock()
+
+
 # Check database connectivity for health checks
 def check_database_health():
     """Check if database is accessible and healthy.
 
     Uses a lightweight SELECT 1 query instead of COUNT(*) to avoid
-    expensive full table scans on large tables (8M+ rows).
+    expensive full table scans on large tables (8M+ rows). A successful
+    check is cached for two seconds.
 
     Returns:
         bool: True if database is accessible
@@ -294,14 +403,50 @@ def check_database_health():
     Raises:
         SQLAlchemyError: If database is not accessible
     """
-    session = session_factory()
-    try:
-        # Lightweight connectivity check - no table scan
-        session.execute(text("SELECT 1"))
-        logger.debug("✅ Database health check passed (connectivity OK)")
+    if _DB_HEALTH_CACHE_KEY in _DB_HEALTH_CACHE:
         return True
-    finally:
-        session.close()
+
+    with _DB_HEALTH_LOCK:
+        # Another probe may have pinged while we waited.
+        if _DB_HEALTH_CACHE_KEY in _DB_HEALTH_CACHE:
+            return True
+
+        session = session_factory()
+        try:
+            # Lightweight connectivity check - no table scan
+            session.execute(text("SELECT 1"))
+            logger.debug("✅ Database health check passed (connectivity OK)")
+            _DB_HEALTH_CACHE[_DB_HEALTH_CACHE_KEY] = True
+            return True
+        finally:
+            session.close()
+
+
+def invalidate_database_health_cache() -> None:
+    """Forget the cached ping so the next health check queries the database."""
+    _DB_HEALTH_CACHE.clear()
+
+
+# dns_logs is partitioned by day: the parent's reltuples is -1, so sum the
+# per-partition estimates (also works for a plain table).
+_ROW_ESTIMATE_SQL = text(
+    "SELECT COALESCE(SUM(GREATEST(c.reltuples, 0)), 0)::bigint "
+    "FROM pg_class c "
+    "WHERE c.relkind = 'r' AND ("
+    "c.oid = 'dns_logs'::regclass OR c.oid IN ("
+    "SELECT inhrelid FROM pg_inherits "
+    "WHERE inhparent = 'dns_logs'::regclass))"
+)
+
+
+# The reltuples estimate only moves when (auto)VACUUM/ANALYZE runs, yet
+# /logs, /stats and every health probe ask for it. Keep it for a minute so
+# those requests don't each check out a connection for a catalog lookup.
+_ROW_ESTIMATE_CACHE: TTLCache = TTLCache(maxsize=1, ttl=60)  # 1-minute TTL
+_ROW_ESTIMATE_CACHE_KEY = "dns_logs"
+# Health probes and /logs now call this from worker threads; on a miss only
+# one of them queries while the rest wait for its result.
+_ROW_ESTIMATE_LOCK = threading.Lock()
 
 
 # Get total record count from database (estimated)
@@ -310,32 +455,49 @@ def get_total_record_count():
 
     Uses PostgreSQL's pg_class.reltuples for a fast estimated count
     instead of COUNT(*) which requires a full table scan.
-    The estimate is updated by VACUUM and ANALYZE operations.
+    The estimate is updated by VACUUM and ANALYZE operations, and is
+    cached in-process for one minute.
 
     Returns:
         int: Estimated number of records, or 0 if error occurs
     """
-    session = session_factory()
-    try:
-        result = session.execute(
-            text(
-                "SELECT COALESCE(reltuples, 0)::bigint "
-                "FROM pg_class WHERE relname = 'dns_logs'"
+    cached = _ROW_ESTIMATE_CACHE.get(_ROW_ESTIMATE_CACHE_KEY)
+    if cached is not None:
+        return cached
+
+    with _ROW_ESTIMATE_LOCK:
+        # Another thread may have refreshed it while we waited.
+        cached = _ROW_ESTIMATE_CACHE.get(_ROW_ESTIMATE_CACHE_KEY)
+        if cached is not None:
+            return cached
+
+        session = session_factory()
+        try:
+            result = session.execute(_ROW_ESTIMATE_SQL)
+            row = result.fetchone()
+            count = row[0] if row else 0
+            # reltuples can be -1 if stats haven't been collected yet
+            count = max(count, 0)
+            logger.debug(
+                "📊 Database contains ~%s total DNS log records (estimated)",
+                format(count, ","),
             )
-        )
-        row = result.fetchone()
-        count = row[0] if row else 0
-        # reltuples can be -1 if stats haven't been collected yet
-        count = max(count, 0)
-        logger.debug(
-            f"📊 Database contains ~{count:,} total DNS log records (estimated)"
-        )
-        return count
-    except SQLAlchemyError as e:
-        logger.error(f"❌ Error getting record count: {e}")
-        return 0
-    finally:
-        session.close()
+            _ROW_ESTIMATE_CACHE[_ROW_ESTIMATE_CACHE_KEY] = count
+            return count
+        except SQLAlchemyError as e:
+            logger.error("❌ Error getting record count: %s", e)
+            return 0
+        finally:
+            session.close()
+
+
+def invalidate_row_estimate_cache() -> None:
+    """Forget the cached row estimate so the next call re-reads pg_class.
+
+    Called by the scheduler after ingest and retention cleanup, the two
+    places that change the table's size.
+    """
+    _ROW_ESTIMATE_CACHE.clear()
 
 
 # Initialize the database (now handled by Alembic migrations)
@@ -349,7 +511,86 @@ def init_db():
 
     # Log current database status
     total_records = get_total_record_count()
-    logger.info(f"💾 Database currently contains {total_records:,} DNS log records")
+    logger.info(
+        "💾 Database currently contains %s DNS log records", format(total_records, ",")
+    )
+
+
+def _on_conflict_insert(session):
+    """Return the dialect ``insert()`` that supports ON CONFLICT clauses.
+
+    Production runs on PostgreSQL; the unit tests run on SQLite. Both
+    dialects expose the same ``on_conflict_do_nothing/do_update`` API.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        return pg_insert
+    return sqlite_insert
+
+
+# Normalise a raw NextDNS log entry into dns_logs column values
+def _build_log_row(log):
+    """Convert a NextDNS API log entry into a dict of ``dns_logs`` columns.
+
+    Shared by :func:`add_log` and :func:`add_logs_bulk` so both ingest paths
+    derive ``action``/``blocked``/``tld``/``device_name`` identically.
+
+    Args:
+        log (dict): DNS log data as returned by the NextDNS API
+
+    Returns:
+        dict: Column values ready to be inserted into ``dns_logs``
+    """
+    # Extract timestamp from log data
+    log_timestamp_str = log.get("timestamp")
+    if log_timestamp_str:
+        # Parse NextDNS timestamp format: 2025-09-18T08:11:39.673Z
+        log_timestamp = datetime.fromisoformat(log_timestamp_str.replace("Z", "+00:00"))
+    else:
+        log_timestamp = datetime.now(timezone.utc)
+
+    # Determine action based on NextDNS log structure
+    action = log.get("action") or log.get("status") or "default"
+
+    # Handle device - extract name if it's a dict, otherwise use as is
+    device_info = log.get("device")
+
+    # Determine if request was blocked
+    blocked = bool(
+        log.get("blocked", False)
+        or action == "blocked"
+        or log.get("status") == "blocked"
+    )
+
+    # Extract TLD for Phase 3 optimization
+    domain = log.get("domain")
+
+    # Extract device name for fast aggregation (avoids JSON parsing per row at query time)
+    extracted_device_name = None
+    if isinstance(device_info, dict):
+        extracted_device_name = (device_info.get("name") or "").strip() or None
+    elif isinstance(device_info, str):
+        try:
+            d = json.loads(device_info)
+            if isinstance(d, dict):
+                extracted_device_name = (d.get("name") or "").strip() or None
+        except (json.JSONDecodeError, AttributeError):
+            pass
+
+    return {
+        "timestamp": log_timestamp,
+        "domain": domain,
+        "action": action,
+        # Ensure all JSON data is properly serialized as strings
+        "device": json.dumps(device_info) if device_info else None,
+        # Handle client info - could be in clientIp field
+        "client_ip": log.get("client_ip") or log.get("clientIp"),
+        "query_type": log.get("query_type", "A"),
+        "blocked": blocked,
+        "profile_id": log.get("profile_id"),
+        "tld": extract_tld(domain) if domain else None,
+        "device_name": extracted_device_name,
+        "data": json.dumps(log) if isinstance(log, dict) else str(log),
+    }
 
 
 # Add log entry to the database with duplicate prevention
@@ -365,106 +606,239 @@ def add_log(log):
     """
     session = session_factory()
     try:
-        # Extract timestamp from log data
-        log_timestamp_str = log.get("timestamp")
-        if log_timestamp_str:
-            # Parse NextDNS timestamp format: 2025-09-18T08:11:39.673Z
-            log_timestamp = datetime.fromisoformat(
-                log_timestamp_str.replace("Z", "+00:00")
-            )
-        else:
-            log_timestamp = datetime.now(timezone.utc)
-
-        # Determine action based on NextDNS log structure
-        action = log.get("action") or log.get("status") or "default"
-
-        # Handle device - extract name if it's a dict, otherwise use as is
-        device_info = log.get("device")
-
-        # Handle client info - could be in clientIp field
-        client_ip = log.get("client_ip") or log.get("clientIp")
+        row = _build_log_row(log)
 
         # Check for existing record first (duplicate prevention)
         existing_log = (
             session.query(DNSLog)
             .filter_by(
-                timestamp=log_timestamp,
-                domain=log.get("domain"),
-                client_ip=client_ip,
+                timestamp=row["timestamp"],
+                domain=row["domain"],
+                client_ip=row["client_ip"],
             )
             .first()
         )
 
         if existing_log:
             logger.debug(
-                f"🔄 Duplicate found for domain {log.get('domain')} "
-                f"at {log_timestamp} - skipping"
+                "🔄 Duplicate found for domain %s at %s - skipping",
+                row["domain"],
+                row["timestamp"],
             )
             return existing_log.id, False  # Return existing ID, not new
 
-        # Determine if request was blocked
-        blocked = (
-            log.get("blocked", False)
-            or action == "blocked"
-            or log.get("status") == "blocked"
-        )
-
-        # Ensure all JSON data is properly serialized as strings
-        device_str = json.dumps(device_info) if device_info else None
-        data_str = json.dumps(log) if isinstance(log, dict) else str(log)
-
         # Debug output to check data types (only in DEBUG mode)
         logger.debug(
-            f"🐛 Data serialization - device type: {type(device_str)}, device value: {device_str}"
+            "🐛 Data serialization - device type: %s, device value: %s",
+            type(row["device"]),
+            row["device"],
         )
         logger.debug(
-            f"🐛 Data serialization - data type: {type(data_str)}, "
-            f"data value (first 100 chars): {str(data_str)[:100]}"
+            "🐛 Data serialization - data type: %s, data value (first 100 chars): %s",
+            type(row["data"]),
+            str(row["data"])[:100],
         )
 
-        # Extract TLD for Phase 3 optimization
-        domain = log.get("domain")
-        tld = extract_tld(domain) if domain else None
-
-        # Extract device name for fast aggregation (avoids JSON parsing per row at query time)
-        extracted_device_name = None
-        if isinstance(device_info, dict):
-            extracted_device_name = (device_info.get("name") or "").strip() or None
-        elif isinstance(device_info, str):
-            try:
-                d = json.loads(device_info)
-                if isinstance(d, dict):
-                    extracted_device_name = (d.get("name") or "").strip() or None
-            except (json.JSONDecodeError, AttributeError):
-                pass
-
-        new_log = DNSLog(
-            timestamp=log_timestamp,
-            domain=domain,
-            action=action,
-            device=device_str,
-            client_ip=client_ip,
-            query_type=log.get("query_type", "A"),
-            blocked=blocked,
-            profile_id=log.get("profile_id"),
-            tld=tld,  # Phase 3: Pre-computed TLD for fast aggregation
-            device_name=extracted_device_name,  # Pre-extracted for fast GROUP BY queries
-            data=data_str,
-        )
+        new_log = DNSLog(**row)
         session.add(new_log)
         session.commit()
         logger.debug(
-            f"💾 Successfully added NEW log for domain: {log.get('domain')} at {log_timestamp}"
+            "💾 Successfully added NEW log for domain: %s at %s",
+            row["domain"],
+            row["timestamp"],
         )
         return new_log.id, True  # Return new ID, is new
     except SQLAlchemyError as e:
         session.rollback()
-        logger.error(f"❌ Error adding log to database: {e}")
+        logger.error("❌ Error adding log to database: %s", e)
         return None, False
     finally:
         session.close()
 
 
+# Columns written by the bulk ingest path (id and created_at are filled by the DB)
+_INGEST_COLUMNS = (
+    "timestamp",
+    "domain",
+    "action",
+    "device",
+    "client_ip",
+    "query_type",
+    "blocked",
+    "profile_id",
+    "tld",
+    "device_name",
+    "data",
+)
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_value(value):
+    """Render a Python value as a field in PostgreSQL's COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+# Ingest statements are fixed, so build them once instead of per batch
+_INGEST_COLUMN_LIST = ", ".join(_INGEST_COLUMNS)
+_INGEST_ASYNC_COMMIT_SQL = text("SET LOCAL synchronous_commit = off")
+_INGEST_STAGE_SQL = text(
+    "CREATE TEMP TABLE IF NOT EXISTS dns_logs_ingest ON COMMIT DELETE ROWS "
+    f"AS SELECT {_INGEST_COLUMN_LIST} FROM dns_logs WITH NO DATA"
+)
+_INGEST_COPY_SQL = f"COPY dns_logs_ingest ({_INGEST_COLUMN_LIST}) FROM STDIN"
+_INGEST_MERGE_SQL = text(
+    f"INSERT INTO dns_logs ({_INGEST_COLUMN_LIST}) "
+    f"SELECT {_INGEST_COLUMN_LIST} FROM dns_logs_ingest ORDER BY timestamp "
+    "ON CONFLICT DO NOTHING RETURNING timestamp"
+)
+
+
+def _copy_insert_rows(session, rows):
+    """Stream rows into dns_logs via COPY + INSERT ... ON CONFLICT DO NOTHING.
+
+    COPY cannot skip unique-constraint violations, so rows are first copied
+    into a session-local temp table (same column types as ``dns_logs``) and
+    then moved across in a single INSERT ... SELECT that drops duplicates.
+    Temp tables are never WAL-logged, so the staging step costs no WAL.
+
+    The transaction commits with ``synchronous_commit = off``: a crash can
+    lose at most the last few hundred milliseconds of ingested batches, and
+    those are simply fetched again because the later (synchronous)
+    fetch_status commit cannot survive without them.
+
+    Returns:
+        list: Timestamps of the rows that were actually inserted
+    """
+    session.execute(_INGEST_ASYNC_COMMIT_SQL)
+    session.execute(_INGEST_STAGE_SQL)
+
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_value(row[col]) for col in _INGEST_COLUMNS))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(_INGEST_COPY_SQL, buffer)
+    finally:
+        cursor.close()
+
+    return [r[0] for r in session.execute(_INGEST_MERGE_SQL)]
+
+
+def _insert_rows_on_conflict_do_nothing(session, rows):
+    """Portable fallback for non-PostgreSQL engines (used by the SQLite tests)."""
+    stmt = (
+        _on_conflict_insert(session)(DNSLog.__table__)
+        .on_conflict_do_nothing()
+        .returning(DNSLog.__table__.c.timestamp)
+    )
+    return [r[0] for r in session.execute(stmt, rows)]
+
+
+def _utc_key(value):
+    """Normalise a timestamp for comparison (SQLite hands back naive UTC)."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _drop_null_ip_duplicates(session, rows):
+    """Remove rows without a client IP that are already stored or repeated.
+
+    ``uq_dns_logs_timestamp_domain_client`` treats NULLs as distinct, so
+    ``ON CONFLICT DO NOTHING`` never skips a row whose ``client_ip`` is
+    NULL. NextDNS omits ``clientIp`` for some queries, and the incremental
+    fetch re-reads its boundary row every cycle, so those rows are matched
+    on (timestamp, domain) here instead, like :func:`add_log` does.
+
+    Returns:
+        list: The rows still to be inserted
+    """
+    null_ip_rows = [row for row in rows if row["client_ip"] is None]
+    if not null_ip_rows:
+        return rows
+
+    seen = {
+        (_utc_key(timestamp), domain)
+        for timestamp, domain in session.query(DNSLog.timestamp, DNSLog.domain)
+        .filter(
+            DNSLog.client_ip.is_(None),
+            DNSLog.timestamp.in_({row["timestamp"] for row in null_ip_rows}),
+        )
+        .all()
+    }
+    kept = []
+    for row in rows:
+        if row["client_ip"] is None:
+            key = (_utc_key(row["timestamp"]), row["domain"])
+            if key in seen:
+                continue
+            seen.add(key)
+        kept.append(row)
+    return kept
+
+
+# Add a batch of log entries in one round trip with duplicate prevention
+def add_logs_bulk(logs):
+    """Insert a batch of NextDNS log entries, skipping duplicates.
+
+    On PostgreSQL the batch is streamed with ``COPY ... FROM STDIN`` and
+    de-duplicated against ``uq_dns_logs_timestamp_domain_client`` with
+    ``ON CONFLICT DO NOTHING``, replacing the SELECT + INSERT per row that
+    :func:`add_log` issues. Rows without a client IP, which the constraint
+    can't catch, are checked first by :func:`_drop_null_ip_duplicates`.
+
+    Args:
+        logs (list): DNS log dicts as returned by the NextDNS API
+
+    Returns:
+        tuple: (inserted, skipped, latest_timestamp) where latest_timestamp
+        is the newest timestamp among the inserted rows (None if none were)
+    """
+    if not logs:
+        return 0, 0, None
+
+    rows = [_build_log_row(log) for log in logs]
+    session = session_factory()
+    try:
+        is_postgresql = session.get_bind().dialect.name == "postgresql"
+        new_rows = _drop_null_ip_duplicates(session, rows)
+        if not new_rows:
+            inserted_timestamps = []
+        elif is_postgresql:
+            inserted_timestamps = _copy_insert_rows(session, new_rows)
+        else:
+            inserted_timestamps = _insert_rows_on_conflict_do_nothing(session, new_rows)
+        session.commit()
+        if is_postgresql and inserted_timestamps:
+            # Rows older than the stats views' watermark aren't in the views yet
+            lower_stats_view_watermark(min(inserted_timestamps))
+
+        inserted = len(inserted_timestamps)
+        latest_timestamp = max(inserted_timestamps) if inserted_timestamps else None
+        logger.debug(
+            "💾 Bulk insert: %d NEW rows, %d duplicates skipped",
+            inserted,
+            len(rows) - inserted,
+        )
+        return inserted, len(rows) - inserted, latest_timestamp
+    except SQLAlchemyError as e:
+        session.rollback()
+        logger.error("❌ Error bulk inserting logs: %s", e)
+        return 0, 0, None
+    finally:
+        session.close()
+
+
 # Get last fetch timestamp for incremental fetching
 def get_last_fetch_timestamp(profile_id):
     """Get the last successful fetch timestamp for a profile.
@@ -482,14 +856,16 @@ def get_last_fetch_timestamp(profile_id):
         )
         if fetch_status:
             logger.debug(
-                f"📅 Last fetch for profile {profile_id}: {fetch_status.last_fetch_timestamp}"
+                "📅 Last fetch for profile %s: %s",
+                profile_id,
+                fetch_status.last_fetch_timestamp,
             )
             return fetch_status.last_fetch_timestamp
 
-        logger.debug(f"📅 No previous fetch found for profile {profile_id}")
+        logger.debug("📅 No previous fetch found for profile %s", profile_id)
         return None
     except SQLAlchemyError as e:
-        logger.error(f"❌ Error getting last fetch timestamp: {e}")
+        logger.error("❌ Error getting last fetch timestamp: %s", e)
         return None
     finally:
         session.close()
@@ -507,46 +883,172 @@ def update_fetch_status(profile_id, last_timestamp, records_count):
     """
     session = session_factory()
     try:
-        fetch_status = (
-            session.query(FetchStatus).filter_by(profile_id=profile_id).first()
+        # Single-statement upsert keyed by uq_fetch_status_profile instead of
+        # SELECT-then-INSERT/UPDATE (one round trip, no read-modify-write race)
+        now = datetime.now(timezone.utc)
+        table = FetchStatus.__table__
+        stmt = _on_conflict_insert(session)(table).values(
+            profile_id=profile_id,
+            last_fetch_timestamp=last_timestamp,
+            last_successful_fetch=now,
+            records_fetched=records_count,
+            created_at=now,
+            updated_at=now,
         )
-
-        if fetch_status:
-            # Update existing record
-            fetch_status.last_fetch_timestamp = last_timestamp
-            fetch_status.last_successful_fetch = datetime.now(timezone.utc)
-            fetch_status.records_fetched += records_count
-            fetch_status.updated_at = datetime.now(timezone.utc)
-            logger.debug(
-                f"📅 Updated fetch status for profile {profile_id}: "
-                f"last_timestamp={last_timestamp}, "
-                f"total_records={fetch_status.records_fetched}"
-            )
-        else:
-            # Create new record
-            fetch_status = FetchStatus(
-                profile_id=profile_id,
-                last_fetch_timestamp=last_timestamp,
-                records_fetched=records_count,
-            )
-            session.add(fetch_status)
-            logger.debug(
-                f"📅 Created new fetch status for profile {profile_id}: "
-                f"last_timestamp={last_timestamp}, records={records_count}"
-            )
-
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.profile_id],
+            set_={
+                "last_fetch_timestamp": stmt.excluded.last_fetch_timestamp,
+                "last_successful_fetch": now,
+                "records_fetched": table.c.records_fetched + records_count,
+                "updated_at": now,
+            },
+        )
+        session.execute(stmt)
         session.commit()
+        logger.debug(
+            "📅 Upserted fetch status for profile %s: last_timestamp=%s, records=+%s",
+            profile_id,
+            last_timestamp,
+            records_count,
+        )
         return True
     except SQLAlchemyError as e:
         session.rollback()
-        logger.error(f"❌ Error updating fetch status: {e}")
+        logger.error("❌ Error updating fetch status: %s", e)
         return False
     finally:
         session.close()
 
 
+def _filtered_logs_query(  # pylint: disable=too-many-positional-arguments,too-many-branches
+    session,
+    exclude_domains=None,
+    search_query="",
+    status_filter="all",
+    profile_filter=None,
+    device_filter=None,
+    time_range="all",
+    include_data=False,
+):
+    """Build the newest-first /logs query with every filter applied.
+
+    Returns:
+        tuple: (query, has_filter) — ``has_filter`` is False when no
+        narrowing filter was applied, i.e. the query spans the whole table.
+    """
+    query = session.query(DNSLog).order_by(DNSLog.timestamp.desc())
+    if not include_data:
+        query = query.options(defer(DNSLog.data))
+
+    # Track whether the caller applied any narrowing filter — if none
+    # were applied we can skip the expensive COUNT(*) and use the
+    # pg_class.reltuples estimate instead (issue #183: COUNT(*) on
+    # 13M rows takes ~2.5s and the dashboard fires it on every page).
+    has_filter = False
+
+    # Apply domain exclusions (with wildcard support)
+    if exclude_domains:
+        exclusion_filter = build_domain_exclusion_filter(DNSLog.domain, exclude_domains)
+        if exclusion_filter is not None:
+            query = query.filter(exclusion_filter)
+            has_filter = True
+
+    # Apply search filter on domain name
+    if search_query.strip():
+        query = query.filter(DNSLog.domain.ilike(f"%{search_query}%"))
+        has_filter = True
+        logger.debug("🔍 Filtering by domain search: '%s'", search_query)
+
+    # Apply status filter (case-insensitive)
+    if status_filter and status_filter.lower() == "blocked":
+        query = query.filter(DNSLog.blocked == true())
+        has_filter = True
+        logger.debug("🚫 Filtering for blocked requests only")
+    elif status_filter and status_filter.lower() == "allowed":
+        query = query.filter(DNSLog.blocked == false())
+        has_filter = True
+        logger.debug("✅ Filtering for allowed requests only")
+
+    # Apply profile filter
+    if profile_filter and profile_filter.strip():
+        query = query.filter(DNSLog.profile_id == profile_filter)
+        has_filter = True
+        logger.debug("🧱 Filtering for profile: '%s'", profile_filter)
+
+    # Apply device filter — use the indexed ``device_name`` column
+    # added in migration c1d2e3f4a5b6. The old code did
+    # ``device.ilike('%"name": "X"%')`` which is a substring scan on
+    # JSON TEXT and triggered full-table scans (>40 s on 6M rows).
+    # ``device_name`` is the trimmed value from the JSON and is
+    # covered by ``idx_dns_logs_timestamp_device_name_nn``.
+    if device_filter:
+        cleaned = [d.strip() for d in device_filter if d and d.strip()]
+        if cleaned:
+            query = query.filter(DNSLog.device_name.in_(cleaned))
+            has_filter = True
+            logger.debug("📱 Filtering for devices: %s", cleaned)
+
+    # Apply time range filter
+    time_filter = _time_range_filter(time_range)
+    if time_filter is not None:
+        query = query.filter(time_filter)
+        has_filter = True
+        logger.debug("📅 Filtering for time range: %s", time_range)
+
+    return query, has_filter
+
+
+def _log_to_dict(log, include_data=False):
+    """Serialise a DNSLog row into the /logs response shape."""
+    return {
+        "id": log.id,
+        "timestamp": log.timestamp.isoformat(),
+        "domain": log.domain,
+        "action": log.action,
+        "device": (
+            dict(_decode_device_json(log.device))
+            if log.device and isinstance(log.device, str)
+            else log.device
+        ),
+        "client_ip": log.client_ip,
+        "query_type": log.query_type if log.query_type is not None else "A",
+        "blocked": log.blocked,
+        "profile_id": log.profile_id,
+        "data": (
+            (
+                json.loads(log.data)
+                if log.data and isinstance(log.data, str)
+                else log.data
+            )
+            if include_data
+            else None
+        ),
+        "created_at": log.created_at.isoformat(),
+    }
+
+
+def _page_with_total(query, offset, limit):
+    """Return one page of *query* and the total number of matching rows.
+
+    The count rides along with the page as COUNT(*) OVER (), which is
+    evaluated before LIMIT/OFFSET: one round trip instead of two.
+
+    Returns:
+        tuple: (list of DNSLog rows, total count)
+    """
+    # pylint: disable=not-callable
+    filtered_total = func.count().over().label("filtered_total")
+    # pylint: enable=not-callable
+    rows = query.offset(offset).limit(limit).add_columns(filtered_total).all()
+    if rows:
+        return [row[0] for row in rows], rows[0].filtered_total
+    # Offset past the end (or no match) — count separately.
+    return [], query.count() if offset else 0
+
+
 # Retrieve logs with optional exclusion of domains and advanced filtering
-def get_logs(  # pylint: disable=too-many-positional-arguments,too-many-locals,too-many-branches
+def get_logs(  # pylint: disable=too-many-positional-arguments
     exclude_domains=None,
     search_query="",
     status_filter="all",
@@ -555,6 +1057,7 @@ def get_logs(  # pylint: disable=too-many-positional-arguments,too-many-locals,t
     time_range="all",
     limit=100,
     offset=0,
+    include_data=False,
 ):
     """Retrieve DNS logs with optional filtering and pagination.
 
@@ -570,137 +1073,117 @@ def get_logs(  # pylint: disable=too-many-positional-arguments,too-many-locals,t
                          - 3m: Last 3 months (weekly granularity)
         limit (int): Maximum number of records to return
         offset (int): Number of records to skip for pagination
+        include_data (bool): Also load the raw NextDNS payload (``data``).
+            Off by default — it is the widest (TOASTed) column and no
+            dashboard view uses it.
 
     Returns:
         tuple: (list of DNS log dictionaries, filtered total count)
     """
     logger.debug(
-        f"📊 Retrieving logs with limit={limit}, offset={offset}, "
-        f"exclude_domains={exclude_domains}, search='{search_query}', "
-        f"status='{status_filter}', profile='{profile_filter}', "
-        f"devices={device_filter}, time_range='{time_range}'"
+        "📊 Retrieving logs with limit=%s, offset=%s, exclude_domains=%s, "
+        "search='%s', status='%s', profile='%s', devices=%s, time_range='%s'",
+        limit,
+        offset,
+        exclude_domains,
+        search_query,
+        status_filter,
+        profile_filter,
+        device_filter,
+        time_range,
     )
     session = session_factory()
     try:
-        query = session.query(DNSLog).order_by(DNSLog.timestamp.desc())
-
-        # Track whether the caller applied any narrowing filter — if none
-        # were applied we can skip the expensive COUNT(*) and use the
-        # pg_class.reltuples estimate instead (issue #183: COUNT(*) on
-        # 13M rows takes ~2.5s and the dashboard fires it on every page).
-        has_filter = False
-
-        # Apply domain exclusions (with wildcard support)
-        if exclude_domains:
-            exclusion_filter = build_domain_exclusion_filter(
-                DNSLog.domain, exclude_domains
-            )
-            if exclusion_filter is not None:
-                query = query.filter(exclusion_filter)
-                has_filter = True
-
-        # Apply search filter on domain name
-        if search_query.strip():
-            query = query.filter(DNSLog.domain.ilike(f"%{search_query}%"))
-            has_filter = True
-            logger.debug(f"🔍 Filtering by domain search: '{search_query}'")
-
-        # Apply status filter (case-insensitive)
-        if status_filter and status_filter.lower() == "blocked":
-            query = query.filter(DNSLog.blocked.is_(True))
-            has_filter = True
-            logger.debug("🚫 Filtering for blocked requests only")
-        elif status_filter and status_filter.lower() == "allowed":
-            query = query.filter(DNSLog.blocked.is_(False))
-            has_filter = True
-            logger.debug("✅ Filtering for allowed requests only")
-
-        # Apply profile filter
-        if profile_filter and profile_filter.strip():
-            query = query.filter(DNSLog.profile_id == profile_filter)
-            has_filter = True
-            logger.debug(f"🧱 Filtering for profile: '{profile_filter}'")
-
-        # Apply device filter — use the indexed ``device_name`` column
-        # added in migration c1d2e3f4a5b6. The old code did
-        # ``device.ilike('%"name": "X"%')`` which is a substring scan on
-        # JSON TEXT and triggered full-table scans (>40 s on 6M rows).
-        # ``device_name`` is the trimmed value from the JSON and is
-        # covered by ``idx_dns_logs_timestamp_device_name``.
-        if device_filter:
-            cleaned = [d.strip() for d in device_filter if d and d.strip()]
-            if cleaned:
-                query = query.filter(DNSLog.device_name.in_(cleaned))
-                has_filter = True
-                logger.debug(f"📱 Filtering for devices: {cleaned}")
-
-        # Apply time range filter
-        if time_range != "all":
-            now = datetime.now(timezone.utc)
-
-            time_deltas = {
-                "30m": timedelta(minutes=30),
-                "1h": timedelta(hours=1),
-                "6h": timedelta(hours=6),
-                "24h": timedelta(hours=24),
-                "7d": timedelta(days=7),
-                "30d": timedelta(days=30),
-                "3m": timedelta(days=90),
-            }
-
-            if time_range in time_deltas:
-                cutoff_time = now - time_deltas[time_range]
-                query = query.filter(DNSLog.timestamp >= cutoff_time)
-                has_filter = True
-                logger.debug(f"📅 Filtering for time range: {time_range}")
+        query, has_filter = _filtered_logs_query(
+            session,
+            exclude_domains=exclude_domains,
+            search_query=search_query,
+            status_filter=status_filter,
+            profile_filter=profile_filter,
+            device_filter=device_filter,
+            time_range=time_range,
+            include_data=include_data,
+        )
 
         # Get the total matching the current filters. With no filters the
-        # answer is "the whole table" — use the pg_class estimate to avoid
-        # a multi-second COUNT(*) on millions of rows.
+        # answer is "the whole table" — use the (cached) pg_class estimate
+        # to avoid a multi-second COUNT(*) on millions of rows.
         if has_filter:
-            filtered_total_records = query.count()
+            logs, filtered_total_records = _page_with_total(query, offset, limit)
         else:
+            logs = query.offset(offset).limit(limit).all()
             filtered_total_records = get_total_record_count()
         logger.info(
-            f"📊 Database query: requesting {limit} records from {filtered_total_records:,} filtered records"
+            "📊 Database query: returned %d of %d filtered records",
+            len(logs),
+            filtered_total_records,
         )
 
-        # Apply pagination
-        query = query.offset(offset).limit(limit)
-
-        result = [
-            {
-                "id": log.id,
-                "timestamp": log.timestamp.isoformat(),
-                "domain": log.domain,
-                "action": log.action,
-                "device": (
-                    json.loads(log.device)
-                    if log.device and isinstance(log.device, str)
-                    else log.device
-                ),
-                "client_ip": log.client_ip,
-                "query_type": log.query_type if log.query_type is not None else "A",
-                "blocked": log.blocked,
-                "profile_id": log.profile_id,
-                "data": (
-                    json.loads(log.data)
-                    if log.data and isinstance(log.data, str)
-                    else log.data
-                ),
-                "created_at": log.created_at.isoformat(),
-            }
-            for log in query.all()
-        ]
-        logger.debug(f"📊 Retrieved {len(result)} logs from database")
+        result = [_log_to_dict(log, include_data) for log in logs]
+        logger.debug("📊 Retrieved %s logs from database", len(result))
         return result, filtered_total_records
     except SQLAlchemyError as e:
-        logger.error(f"❌ Error retrieving logs from database: {e}")
+        logger.error("❌ Error retrieving logs from database: %s", e)
         return [], 0
     finally:
         session.close()
 
 
+def iter_logs(  # pylint: disable=too-many-positional-arguments
+    exclude_domains=None,
+    search_query="",
+    status_filter="all",
+    profile_filter=None,
+    device_filter=None,
+    time_range="all",
+    limit=10000,
+    include_data=False,
+    batch_size=1000,
+):
+    """Yield DNS logs newest-first without materialising the result set.
+
+    Takes the same filters as :func:`get_logs` but reads through a
+    server-side cursor in ``batch_size`` chunks (``yield_per``), so memory
+    stays flat however many rows match. No total count is computed.
+
+    Database errors are logged and re-raised: rows may already have been
+    sent, so ending the stream quietly would pass a truncated export off as
+    complete.
+
+    Yields:
+        dict: One log in the /logs response shape.
+    """
+    session = session_factory()
+    try:
+        query, _ = _filtered_logs_query(
+            session,
+            exclude_domains=exclude_domains,
+            search_query=search_query,
+            status_filter=status_filter,
+            profile_filter=profile_filter,
+            device_filter=device_filter,
+            time_range=time_range,
+            include_data=include_data,
+        )
+        streamed = 0
+        for log in query.limit(limit).yield_per(batch_size):
+            yield _log_to_dict(log, include_data)
+            streamed += 1
+        logger.debug("📊 Streamed %s logs from database", streamed)
+    except SQLAlchemyError as e:
+        logger.error("❌ Error streaming logs from database: %s", e)
+        raise
+    finally:
+        session.close()
+
+
+# /logs/stats is polled by the dashboard on every refresh and, for the default
+# "all" range, counts the entire table. The numbers only move when a fetch
+# cycle lands, so a short TTL (and an explicit clear after each fetch) keeps
+# repeated calls off the database without serving noticeably stale totals.
+_LOGS_STATS_CACHE: TTLCache = TTLCache(maxsize=256, ttl=60)  # 1-minute TTL
+
+
 # Get total statistics for all logs in the database
 def get_logs_stats(profile_filter=None, time_range="all", exclude_domains=None):
     """Get statistics for DNS logs in the database, optionally filtered by profile and time range.
@@ -715,7 +1198,17 @@ def get_logs_stats(profile_filter=None, time_range="all", exclude_domains=None):
 
     Returns:
         dict: Dictionary containing total, blocked, and allowed counts and percentages
+
+    Unfiltered requests (no ``exclude_domains``) are cached in-process for
+    one minute, keyed by profile and time range.
     """
+    cache_key = None if exclude_domains else (profile_filter, time_range)
+    if cache_key is not None:
+        cached = _LOGS_STATS_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug("⚡ /logs/stats cache hit: %s", cache_key)
+            return dict(cached)
+
     session = session_factory()
     try:
         query = session.query(DNSLog)
@@ -731,32 +1224,19 @@ def get_logs_stats(profile_filter=None, time_range="all", exclude_domains=None):
         # Apply profile filter if specified
         if profile_filter and profile_filter.strip():
             query = query.filter(DNSLog.profile_id == profile_filter)
-            logger.debug(f"🧱 Getting stats for profile: '{profile_filter}'")
+            logger.debug("🧱 Getting stats for profile: '%s'", profile_filter)
 
         # Apply time range filter
-        if time_range != "all":
-            now = datetime.now(timezone.utc)
-
-            time_deltas = {
-                "30m": timedelta(minutes=30),
-                "1h": timedelta(hours=1),
-                "6h": timedelta(hours=6),
-                "24h": timedelta(hours=24),
-                "7d": timedelta(days=7),
-                "30d": timedelta(days=30),
-                "3m": timedelta(days=90),
-            }
-
-            if time_range in time_deltas:
-                cutoff_time = now - time_deltas[time_range]
-                query = query.filter(DNSLog.timestamp >= cutoff_time)
-                logger.debug(f"📅 Getting stats for time range: {time_range}")
+        time_filter = _time_range_filter(time_range)
+        if time_filter is not None:
+            query = query.filter(time_filter)
+            logger.debug("📅 Getting stats for time range: %s", time_range)
 
         # Get total count
         total_count = query.count()
 
         # Get blocked count
-        blocked_count = query.filter(DNSLog.blocked is True).count()
+        blocked_count = query.filter(DNSLog.blocked == true()).count()
 
         # Calculate allowed count
         allowed_count = total_count - blocked_count
@@ -778,10 +1258,12 @@ def get_logs_stats(profile_filter=None, time_range="all", exclude_domains=None):
             "profile_id": profile_filter,
         }
 
-        logger.debug(f"📊 Database stats: {stats}")
+        logger.debug("📊 Database stats: %s", stats)
+        if cache_key is not None:
+            _LOGS_STATS_CACHE[cache_key] = dict(stats)
         return stats
     except SQLAlchemyError as e:
-        logger.error(f"❌ Error getting logs statistics: {e}")
+        logger.error("❌ Error getting logs statistics: %s", e)
         return {
             "total": 0,
             "blocked": 0,
@@ -794,6 +1276,15 @@ def get_logs_stats(profile_filter=None, time_range="all", exclude_domains=None):
         session.close()
 
 
+def invalidate_logs_stats_cache() -> None:
+    """Drop every cached /logs/stats result.
+
+    Called by the scheduler after a fetch cycle inserts new rows so the
+    next request recounts instead of waiting out the TTL.
+    """
+    _LOGS_STATS_CACHE.clear()
+
+
 # Get list of available profiles in the database
 # ---------------------------------------------------------------------------
 # /profiles cache
@@ -839,25 +1330,22 @@ def get_available_profiles():
         )
         # pylint: enable=not-callable
 
-        profiles = []
-        for result in results:
-            profiles.append(
-                {
-                    "profile_id": result.profile_id,
-                    "record_count": result.record_count,
-                    "last_activity": (
-                        result.last_activity.isoformat()
-                        if result.last_activity
-                        else None
-                    ),
-                }
-            )
+        profiles = [
+            {
+                "profile_id": result.profile_id,
+                "record_count": result.record_count,
+                "last_activity": (
+                    result.last_activity.isoformat() if result.last_activity else None
+                ),
+            }
+            for result in results
+        ]
 
         _PROFILES_CACHE[_PROFILES_CACHE_KEY] = profiles
-        logger.debug(f"🧱 Found {len(profiles)} profiles with data (cached 5 min)")
+        logger.debug("🧱 Found %s profiles with data (cached 5 min)", len(profiles))
         return profiles
     except SQLAlchemyError as e:
-        logger.error(f"❌ Error getting available profiles: {e}")
+        logger.error("❌ Error getting available profiles: %s", e)
         return []
     finally:
         session.close()
@@ -905,33 +1393,19 @@ def get_stats_overview(
         # Apply profile filter
         if profile_filter and profile_filter.strip() and profile_filter != "all":
             query = query.filter(DNSLog.profile_id == profile_filter)
-            logger.debug(f"🧱 Filtering stats for profile: '{profile_filter}'")
+            logger.debug("🧱 Filtering stats for profile: '%s'", profile_filter)
 
         # Apply time range filter
-        if time_range != "all":
-
-            now = datetime.now(timezone.utc)
-
-            time_deltas = {
-                "30m": timedelta(minutes=30),
-                "1h": timedelta(hours=1),
-                "6h": timedelta(hours=6),
-                "24h": timedelta(hours=24),
-                "7d": timedelta(days=7),
-                "30d": timedelta(days=30),
-                "3m": timedelta(days=90),  # 3 months = ~90 days
-            }
-
-            if time_range in time_deltas:
-                cutoff_time = now - time_deltas[time_range]
-                query = query.filter(DNSLog.timestamp >= cutoff_time)
-                logger.debug(f"📅 Filtering for time range: {time_range}")
+        time_filter = _time_range_filter(time_range)
+        if time_filter is not None:
+            query = query.filter(time_filter)
+            logger.debug("📅 Filtering for time range: %s", time_range)
 
         # Get total queries
         total_queries = query.count()
 
         # Get blocked queries
-        blocked_queries = query.filter(DNSLog.blocked.is_(True)).count()
+        blocked_queries = query.filter(DNSLog.blocked == true()).count()
 
         # Calculate allowed queries and percentage
         allowed_queries = total_queries - blocked_queries
@@ -971,7 +1445,7 @@ def get_stats_overview(
             if most_active_result and most_active_result[0]:
                 most_active_device = most_active_result[0]
         except SQLAlchemyError as e:
-            logger.debug(f"Could not determine most active device: {e}")
+            logger.debug("Could not determine most active device: %s", e)
             most_active_device = None
 
         # Get top blocked domain (only if there are blocked queries and use same filters)
@@ -998,15 +1472,12 @@ def get_stats_overview(
                     )
 
                 # Apply the same time range filter
-                if time_range != "all":
-                    if time_range in time_deltas:
-                        blocked_domain_query = blocked_domain_query.filter(
-                            DNSLog.timestamp >= cutoff_time
-                        )
+                if time_filter is not None:
+                    blocked_domain_query = blocked_domain_query.filter(time_filter)
 
                 # pylint: disable=not-callable
                 blocked_domain_result = (
-                    blocked_domain_query.filter(DNSLog.blocked.is_(True))
+                    blocked_domain_query.filter(DNSLog.blocked == true())
                     .group_by(DNSLog.domain)
                     .order_by(func.count(DNSLog.id).desc())
                     .first()
@@ -1015,7 +1486,7 @@ def get_stats_overview(
                 if blocked_domain_result and blocked_domain_result[0]:
                     top_blocked_domain = blocked_domain_result[0]
             except SQLAlchemyError as e:
-                logger.debug(f"Could not determine top blocked domain: {e}")
+                logger.debug("Could not determine top blocked domain: %s", e)
                 top_blocked_domain = None
 
         stats = {
@@ -1028,11 +1499,11 @@ def get_stats_overview(
             "top_blocked_domain": top_blocked_domain,
         }
 
-        logger.debug(f"📊 Real stats overview: {stats}")
+        logger.debug("📊 Real stats overview: %s", stats)
         return stats
 
     except SQLAlchemyError as e:
-        logger.error(f"❌ Error getting stats overview: {e}")
+        logger.error("❌ Error getting stats overview: %s", e)
         return {
             "total_queries": 0,
             "blocked_queries": 0,
@@ -1046,9 +1517,326 @@ def get_stats_overview(
         session.close()
 
 
+# ---------------------------------------------------------------------------
+# Hourly counters and daily domains materialized views (PostgreSQL only)
+# ---------------------------------------------------------------------------
+
+HOURLY_STATS_VIEW_SETTING = "hourly_stats_view_through"
+
+_REFRESH_HOURLY_STATS_VIEW_SQL = text(
+    "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_dns_logs_hourly"
+)
+_REFRESH_DOMAINS_DAILY_VIEW_SQL = text(
+    "REFRESH MATERIALIZED VIEW CONCURRENTLY mv_dns_logs_domains_daily"
+)
+_HOURLY_STATS_VIEW_WATERMARK_SQL = text("SELECT date_trunc('day', now(), 'UTC')")
+
+# mv_dns_logs_domains_daily: one row per (UTC day, profile, domain, blocked).
+# Kept out of Base.metadata so create_all() never turns it into a table.
+_DOMAINS_DAILY_VIEW = Table(
+    "mv_dns_logs_domains_daily",
+    MetaData(),
+    Column("bucket", DateTime(timezone=True)),
+    Column("profile_id", String(50)),
+    Column("domain", String(255)),
+    Column("tld", String(255)),
+    Column("blocked", Boolean),
+    Column("query_count", BigInteger),
+)
+
+# Windows long enough that reading complete days from the view pays off
+_DOMAINS_VIEW_RANGES = frozenset({"7d", "30d", "3m", "all"})
+
+
+def refresh_hourly_stats_view() -> bool:
+    """Refresh ``mv_dns_logs_hourly`` and ``mv_dns_logs_domains_daily``.
+
+    Both views only hold complete UTC days, so after a refresh they cover
+    every log before 00:00 UTC of the refresh day. That instant is stored in
+    system_settings so readers know where the views end and ``dns_logs``
+    has to take over.
+
+    If an ingest lowered the watermark while the refresh ran (see
+    :func:`lower_stats_view_watermark`), its rows may have missed the
+    refresh snapshot, so the lower value is kept.
+
+    Returns:
+        bool: True on success, False on error or when not on PostgreSQL.
+    """
+    session = session_factory()
+    try:
+        if session.get_bind().dialect.name != "postgresql":
+            return False
+        watermark_before = _stored_stats_view_watermark()
+        session.execute(_REFRESH_HOURLY_STATS_VIEW_SQL)
+        session.execute(_REFRESH_DOMAINS_DAILY_VIEW_SQL)
+        through = session.execute(_HOURLY_STATS_VIEW_WATERMARK_SQL).scalar()
+        session.commit()
+    except SQLAlchemyError as e:
+        session.rollback()
+        logger.error("❌ Error refreshing hourly stats view: %s", e)
+        return False
+    finally:
+        session.close()
+
+    watermark_now = _stored_stats_view_watermark()
+    if (
+        watermark_now is not None
+        and watermark_now != watermark_before
+        and watermark_now < through
+    ):
+        logger.info(
+            "✅ Stats views refreshed; watermark kept at %s (older logs arrived "
+            "during the refresh)",
+            watermark_now.isoformat(),
+        )
+        return True
+
+    set_setting(HOURLY_STATS_VIEW_SETTING, through.isoformat())
+    logger.info("✅ Hourly stats view refreshed through %s", through.isoformat())
+    return True
+
+
+def _parse_stats_view_watermark(value) -> Optional[datetime]:
+    """Parse the stored watermark, or None when unset/malformed."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        logger.warning("⚠️ Ignoring malformed %s: %s", HOURLY_STATS_VIEW_SETTING, value)
+        return None
+
+
+def _stored_stats_view_watermark() -> Optional[datetime]:
+    """Read the watermark from the database, bypassing the settings cache."""
+    with _SETTINGS_LOCK:
+        _SETTINGS_CACHE.pop(HOURLY_STATS_VIEW_SETTING, None)
+    return _parse_stats_view_watermark(get_setting(HOURLY_STATS_VIEW_SETTING))
+
+
+def lower_stats_view_watermark(oldest: datetime) -> bool:
+    """Move the views' watermark back to the UTC day containing *oldest*.
+
+    Logs that arrive late (a fetch backlog after an outage, a slow cycle)
+    can be older than the watermark, and the views won't hold them until the
+    next refresh. Moving the watermark to the start of their day makes
+    readers count that day and everything after it from ``dns_logs``.
+
+    Returns:
+        bool: True if the watermark was moved.
+    """
+    watermark = _stored_stats_view_watermark()
+    if watermark is None:
+        return False
+    day_start = oldest.astimezone(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    if day_start >= watermark:
+        return False
+    set_setting(HOURLY_STATS_VIEW_SETTING, day_start.isoformat())
+    logger.info(
+        "⏪ Stats view watermark moved back to %s for late-arriving logs",
+        day_start.isoformat(),
+    )
+    return True
+
+
+def _hourly_stats_view_watermark(session) -> Optional[datetime]:
+    """Return the instant up to which mv_dns_logs_hourly is complete, or None."""
+    if session.get_bind().dialect.name != "postgresql":
+        return None
+    return _parse_stats_view_watermark(get_setting(HOURLY_STATS_VIEW_SETTING))
+
+
+def _hourly_stats_view_totals(
+    session, start_time, through, interval_hours, profile_filter=None
+):
+    """Sum the hourly view into ``interval_hours``-wide buckets from start_time.
+
+    Returns:
+        dict: ``{interval_index: [total_queries, blocked_queries]}`` covering
+        ``[start_time, through)``.
+    """
+    sql = (
+        "SELECT bucket, blocked, sum(query_count) FROM mv_dns_logs_hourly "
+        "WHERE bucket >= :start_time AND bucket < :through"
+    )
+    params = {"start_time": start_time, "through": through}
+    if profile_filter:
+        sql += " AND profile_id = :profile_id"
+        params["profile_id"] = profile_filter
+    sql += " GROUP BY bucket, blocked"
+
+    interval = timedelta(hours=interval_hours)
+    totals = {}
+    for bucket, blocked, count in session.execute(text(sql), params):
+        counts = totals.setdefault((bucket - start_time) // interval, [0, 0])
+        counts[0] += int(count)
+        if blocked:
+            counts[1] += int(count)
+    return totals
+
+
+def _domains_view_window(session, time_range, now=None):
+    """Split a rolling window around the complete days in the domains view.
+
+    Returns:
+        tuple or None: ``(start, view_from, through)`` where whole days in
+        ``[view_from, through)`` can be read from mv_dns_logs_domains_daily
+        and the rest of ``[start, now]`` from dns_logs (``start`` and
+        ``view_from`` are None for "all"). None when the view can't help.
+    """
+    if time_range not in _DOMAINS_VIEW_RANGES:
+        return None
+    through = _hourly_stats_view_watermark(session)
+    if through is None:
+        return None
+    delta = TIME_RANGE_DELTAS.get(time_range)
+    if delta is None:
+        return None, None, through
+    start = (now or datetime.now(timezone.utc)) - delta
+    view_from = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    if view_from < start:
+        view_from += timedelta(days=1)
+    if view_from >= through:
+        return None
+    return start, view_from, through
+
+
+def _ranked_counts_from_domains_view(
+    session, name, window, limit, profile_filter=None, exclude_domains=None
+):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """Rank blocked and allowed ``name`` ("domain" or "tld") counts.
+
+    Complete days come from mv_dns_logs_domains_daily, the partial first
+    day and everything past the watermark from dns_logs, combined in one
+    UNION ALL so the ranking sees the full window.
+
+    Returns:
+        tuple: ``(total_queries, blocked_rows, allowed_rows)`` with rows as
+        ``(name, count)`` pairs.
+    """
+    start, view_from, through = window
+    view = _DOMAINS_DAILY_VIEW
+
+    raw_window = DNSLog.timestamp >= through
+    if view_from is not None:
+        raw_window = or_(
+            raw_window,
+            and_(DNSLog.timestamp >= start, DNSLog.timestamp < view_from),
+        )
+    raw_column = getattr(DNSLog, name)
+    # pylint: disable=not-callable
+    raw = (
+        select(
+            func.coalesce(raw_column, "").label("name"),
+            DNSLog.blocked.label("blocked"),
+            func.count().label("n"),
+        )
+        .where(raw_window)
+        .group_by(func.coalesce(raw_column, ""), DNSLog.blocked)
+    )
+    # pylint: enable=not-callable
+    viewed = (
+        select(
+            view.c[name].label("name"),
+            view.c.blocked.label("blocked"),
+            func.sum(view.c.query_count).label("n"),
+        )
+        .where(view.c.bucket < through)
+        .group_by(view.c[name], view.c.blocked)
+    )
+    if view_from is not None:
+        viewed = viewed.where(view.c.bucket >= view_from)
+    if profile_filter:
+        raw = raw.where(DNSLog.profile_id == profile_filter)
+        viewed = viewed.where(view.c.profile_id == profile_filter)
+    if exclude_domains:
+        exclusion_filter = build_domain_exclusion_filter(DNSLog.domain, exclude_domains)
+        if exclusion_filter is not None:
+            raw = raw.where(exclusion_filter)
+            viewed = viewed.where(
+                build_domain_exclusion_filter(view.c.domain, exclude_domains)
+            )
+
+    combined = union_all(raw, viewed).subquery()
+    total_queries = int(
+        session.execute(select(func.coalesce(func.sum(combined.c.n), 0))).scalar()
+    )
+
+    def top(blocked):
+        rows = session.execute(
+            select(combined.c.name, func.sum(combined.c.n).label("count"))
+            .where(combined.c.blocked == blocked, combined.c.name != "")
+            .group_by(combined.c.name)
+            .order_by(func.sum(combined.c.n).desc())
+            .limit(limit)
+        )
+        return [(row_name, int(row_count)) for row_name, row_count in rows]
+
+    return total_queries, top(true()), top(false())
+
+
+def _bucket_counts(base_query, intervals, counts_from, group_column):
+    """Count rows per time bucket and ``group_column`` value in one query.
+
+    Buckets are assigned with a CASE over the interval end times, so rows
+    land in exactly the bucket the ``start <= timestamp < end`` filters
+    would pick, on PostgreSQL and SQLite alike.
+
+    Args:
+        base_query: Query on DNSLog with the profile/time filters applied
+        intervals (list): ``(interval_start, interval_end, display_time)``
+            tuples in ascending order
+        counts_from (datetime): Lower bound for rows to count
+        group_column: Column to break each bucket down by (e.g. ``blocked``)
+
+    Returns:
+        dict: ``{interval_index: {group_value: count}}``
+    """
+    bucket = case(
+        *[(DNSLog.timestamp < end, i) for i, (_, end, _) in enumerate(intervals)]
+    )
+    rows = (
+        base_query.filter(
+            DNSLog.timestamp >= counts_from,
+            DNSLog.timestamp < intervals[-1][1],
+        )
+        .with_entities(
+            bucket, group_column, func.count(DNSLog.id)  # pylint: disable=not-callable
+        )
+        .group_by(bucket, group_column)
+        .all()
+    )
+    counts = {}
+    for index, group_value, count in rows:
+        if index is not None:
+            counts.setdefault(index, {})[group_value] = count
+    return counts
+
+
+def _bucket_window_end(now, interval_minutes):
+    """Return the end of the ``interval_minutes``-wide bucket containing ``now``.
+
+    Sub-day windows are snapped to clock boundaries (``:00``, ``:05``, ``:15``
+    …) so every bucket covers exactly the period its label names, with the
+    newest bucket still filling up. Requests made within the same bucket get
+    identical boundaries.
+    """
+    bucket_start = now.replace(
+        minute=now.minute - now.minute % interval_minutes, second=0, microsecond=0
+    )
+    return bucket_start + timedelta(minutes=interval_minutes)
+
+
 # Get time series data from database
 def get_stats_timeseries(
-    profile_filter=None, time_range="24h", granularity="hour", group_by="status"
+    profile_filter=None,
+    time_range="24h",
+    granularity="hour",
+    group_by="status",
+    now=None,
 ):  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
     """Get time series statistics from the database.
 
@@ -1060,6 +1848,7 @@ def get_stats_timeseries(
                          - 3m: Last 3 months (weekly granularity)
         granularity (str): Time granularity (hour, day, etc.)
         group_by (str): Grouping mode - "status" (blocked/allowed) or "profile" (by profile_id)
+        now (datetime): Reference time; defaults to the current UTC time
 
     Returns:
         list or dict: List of time series data points (status mode) or dict with data and
@@ -1068,7 +1857,7 @@ def get_stats_timeseries(
     session = session_factory()
     try:
 
-        now = datetime.now(timezone.utc)
+        now = now or datetime.now(timezone.utc)
 
         # Initialize variables to avoid unbound local variable error
         interval_minutes = 0
@@ -1098,22 +1887,22 @@ def get_stats_timeseries(
 
         # Determine time parameters based on time range
         if time_range == "30m":
-            start_time = now - timedelta(minutes=30)
+            start_time = _bucket_window_end(now, 1) - timedelta(minutes=30)
             interval_minutes = 1
             num_intervals = 30  # 30 x 1min = 30 minutes
             granularity = "1min"
         elif time_range == "1h":
-            start_time = now - timedelta(hours=1)
+            start_time = _bucket_window_end(now, 5) - timedelta(hours=1)
             interval_minutes = 5
             num_intervals = 12  # 12 x 5min = 1 hour
             granularity = "5min"
         elif time_range == "6h":
-            start_time = now - timedelta(hours=6)
+            start_time = _bucket_window_end(now, 15) - timedelta(hours=6)
             interval_minutes = 15
             num_intervals = 24  # 24 x 15min = 6 hours
             granularity = "15min"
         elif time_range == "24h":
-            start_time = now - timedelta(hours=24)
+            start_time = _bucket_window_end(now, 60) - timedelta(hours=24)
             interval_hours = 1
             num_intervals = 24  # 24 x 1hour = 24 hours
             granularity = "hour"
@@ -1195,9 +1984,24 @@ def get_stats_timeseries(
         # Apply profile filter
         if profile_filter and profile_filter.strip() and profile_filter != "all":
             base_query = base_query.filter(DNSLog.profile_id == profile_filter)
+        else:
+            profile_filter = None
+
+        # Day/week buckets are hour-aligned, so complete days can be summed
+        # from the hourly materialized view instead of counting dns_logs.
+        view_through = None
+        view_totals = {}
+        if group_by != "profile" and granularity in ("day", "week"):
+            view_through = _hourly_stats_view_watermark(session)
+            if view_through is not None and view_through > start_time:
+                view_totals = _hourly_stats_view_totals(
+                    session, start_time, view_through, interval_hours, profile_filter
+                )
+            else:
+                view_through = None
 
         # Generate time buckets
-        data_points = []
+        intervals = []
         for i in range(num_intervals):
             if time_range in ["30m", "1h", "6h"]:
                 interval_start = start_time + timedelta(minutes=i * interval_minutes)
@@ -1240,56 +2044,67 @@ def get_stats_timeseries(
                     display_time = interval_start.replace(
                         hour=0, minute=0, second=0, microsecond=0
                     )
-
-            # Query for this interval
-            interval_query = base_query.filter(
-                DNSLog.timestamp >= interval_start, DNSLog.timestamp < interval_end
+            intervals.append((interval_start, interval_end, display_time))
+
+        # Count every bucket in one grouped query instead of one or two
+        # COUNT(*) round trips per interval. Rows already summed from the
+        # hourly view are left out by starting the scan at its watermark.
+        counts_from = view_through if view_through is not None else start_time
+        bucket_counts = (
+            _bucket_counts(
+                base_query,
+                intervals,
+                counts_from,
+                DNSLog.profile_id if group_by == "profile" else DNSLog.blocked,
             )
+            if intervals
+            else {}
+        )
 
-            if group_by == "profile":
-                # Group by profile_id within this time interval
-                profile_counts = {}
-                profile_query = (
-                    interval_query.with_entities(
-                        DNSLog.profile_id,
-                        func.count(DNSLog.id),  # pylint: disable=not-callable
-                    )
-                    .group_by(DNSLog.profile_id)
-                    .all()
-                )
-
-                total_queries = 0
-                for profile_id, count in profile_query:
-                    if profile_id:  # Skip None profile_ids
-                        profile_counts[profile_id] = count
-                        total_queries += count
+        data_points = []
+        for i, (interval_start, _, display_time) in enumerate(intervals):
+            counts = bucket_counts.get(i, {})
 
+            if group_by == "profile":
+                # Profile breakdown within this time interval
+                profile_counts = {
+                    profile_id: count
+                    for profile_id, count in counts.items()
+                    if profile_id  # Skip None profile_ids
+                }
                 data_points.append(
                     {
                         "timestamp": display_time.isoformat(),
-                        "total_queries": total_queries,
+                        "total_queries": sum(profile_counts.values()),
                         "profiles": profile_counts,
                     }
                 )
-            else:
-                # Default: group by status (blocked/allowed)
-                total_queries = interval_query.count()
-                blocked_queries = interval_query.filter(
-                    DNSLog.blocked.is_(True)
-                ).count()
-                allowed_queries = total_queries - blocked_queries
+                continue
 
-                data_points.append(
-                    {
-                        "timestamp": display_time.isoformat(),
-                        "total_queries": total_queries,
-                        "blocked_queries": blocked_queries,
-                        "allowed_queries": allowed_queries,
-                    }
-                )
+            # Default: group by status (blocked/allowed)
+            total_queries = sum(counts.values())
+            blocked_queries = sum(count for blocked, count in counts.items() if blocked)
+            if view_through is not None and interval_start < view_through:
+                # Materialized part from the view, the rest from dns_logs
+                view_total, view_blocked = view_totals.get(i, (0, 0))
+                total_queries += view_total
+                blocked_queries += view_blocked
+            allowed_queries = total_queries - blocked_queries
+
+            data_points.append(
+                {
+                    "timestamp": display_time.isoformat(),
+                    "total_queries": total_queries,
+                    "blocked_queries": blocked_queries,
+                    "allowed_queries": allowed_queries,
+                }
+            )
 
         logger.debug(
-            f"📊 Generated {len(data_points)} {granularity} time series data points for {time_range}"
+            "📊 Generated %s %s time series data points for %s",
+            len(data_points),
+            granularity,
+            time_range,
         )
 
         # Debug: Log first and last data points to verify timestamp alignment
@@ -1297,10 +2112,14 @@ def get_stats_timeseries(
             first_point = data_points[0]
             last_point = data_points[-1]
             logger.debug(
-                f"🕐 First data point: {first_point['timestamp']} ({first_point['total_queries']} queries)"
+                "🕐 First data point: %s (%s queries)",
+                first_point["timestamp"],
+                first_point["total_queries"],
             )
             logger.debug(
-                f"🕐 Last data point: {last_point['timestamp']} ({last_point['total_queries']} queries)"
+                "🕐 Last data point: %s (%s queries)",
+                last_point["timestamp"],
+                last_point["total_queries"],
             )
 
         # Return format depends on grouping mode
@@ -1320,7 +2139,7 @@ def get_stats_timeseries(
         return data_points
 
     except SQLAlchemyError as e:
-        logger.error(f"❌ Error getting time series data: {e}")
+        logger.error("❌ Error getting time series data: %s", e)
         if group_by == "profile":
             return {
                 "data": [],
@@ -1334,6 +2153,22 @@ def get_stats_timeseries(
 
 
 # Get top domains from database
+def _ranked_counts(rows, total_queries):
+    """Shape ``(name, count)`` rows as ranked entries with a share of *total_queries*."""
+    if total_queries <= 0:
+        return [
+            {"domain": name, "count": count, "percentage": 0} for name, count in rows
+        ]
+    return [
+        {
+            "domain": name,
+            "count": count,
+            "percentage": round(count / total_queries * 100, 1),
+        }
+        for name, count in rows
+    ]
+
+
 def get_top_domains(
     profile_filter=None, time_range="24h", limit=10, exclude_domains=None
 ):  # pylint: disable=too-many-locals
@@ -1353,6 +2188,27 @@ def get_top_domains(
     """
     session = session_factory()
     try:
+        if not (profile_filter and profile_filter.strip() and profile_filter != "all"):
+            profile_filter = None
+
+        # Long windows read complete days from the daily domains view
+        view_window = _domains_view_window(session, time_range)
+        if view_window is not None:
+            total_queries, blocked_rows, allowed_rows = (
+                _ranked_counts_from_domains_view(
+                    session,
+                    "domain",
+                    view_window,
+                    limit,
+                    profile_filter,
+                    exclude_domains,
+                )
+            )
+            return {
+                "blocked_domains": _ranked_counts(blocked_rows, total_queries),
+                "allowed_domains": _ranked_counts(allowed_rows, total_queries),
+            }
+
         # Build base query
         query = session.query(DNSLog)
 
@@ -1365,27 +2221,13 @@ def get_top_domains(
                 query = query.filter(exclusion_filter)
 
         # Apply profile filter
-        if profile_filter and profile_filter.strip() and profile_filter != "all":
+        if profile_filter:
             query = query.filter(DNSLog.profile_id == profile_filter)
 
         # Apply time range filter
-        if time_range != "all":
-
-            now = datetime.now(timezone.utc)
-
-            time_deltas = {
-                "30m": timedelta(minutes=30),
-                "1h": timedelta(hours=1),
-                "6h": timedelta(hours=6),
-                "24h": timedelta(hours=24),
-                "7d": timedelta(days=7),
-                "30d": timedelta(days=30),
-                "3m": timedelta(days=90),  # 3 months = ~90 days
-            }
-
-            if time_range in time_deltas:
-                cutoff_time = now - time_deltas[time_range]
-                query = query.filter(DNSLog.timestamp >= cutoff_time)
+        time_filter = _time_range_filter(time_range)
+        if time_filter is not None:
+            query = query.filter(time_filter)
 
         # Get total queries for percentage calculation
         total_queries = query.count()
@@ -1399,7 +2241,7 @@ def get_top_domains(
                     query.with_entities(
                         DNSLog.domain, func.count(DNSLog.id).label("count")
                     )
-                    .filter(DNSLog.blocked.is_(True))
+                    .filter(DNSLog.blocked == true())
                     .group_by(DNSLog.domain)
                     .order_by(func.count(DNSLog.id).desc())
                     .limit(limit)
@@ -1407,21 +2249,9 @@ def get_top_domains(
                 )
                 # pylint: enable=not-callable
 
-                for domain_result in blocked_results:
-                    domain_name = domain_result[0]
-                    count = domain_result[1]
-                    percentage = (
-                        (count / total_queries * 100) if total_queries > 0 else 0
-                    )
-                    blocked_domains.append(
-                        {
-                            "domain": domain_name,
-                            "count": count,
-                            "percentage": round(percentage, 1),
-                        }
-                    )
+                blocked_domains = _ranked_counts(blocked_results, total_queries)
             except SQLAlchemyError as e:
-                logger.error(f"Error getting blocked domains: {e}")
+                logger.error("Error getting blocked domains: %s", e)
 
         # Get top allowed domains
         allowed_domains = []
@@ -1432,7 +2262,7 @@ def get_top_domains(
                     query.with_entities(
                         DNSLog.domain, func.count(DNSLog.id).label("count")
                     )
-                    .filter(DNSLog.blocked.is_(False))
+                    .filter(DNSLog.blocked == false())
                     .group_by(DNSLog.domain)
                     .order_by(func.count(DNSLog.id).desc())
                     .limit(limit)
@@ -1440,21 +2270,9 @@ def get_top_domains(
                 )
                 # pylint: enable=not-callable
 
-                for domain_result in allowed_results:
-                    domain_name = domain_result[0]
-                    count = domain_result[1]
-                    percentage = (
-                        (count / total_queries * 100) if total_queries > 0 else 0
-                    )
-                    allowed_domains.append(
-                        {
-                            "domain": domain_name,
-                            "count": count,
-                            "percentage": round(percentage, 1),
-                        }
-                    )
+                allowed_domains = _ranked_counts(allowed_results, total_queries)
             except SQLAlchemyError as e:
-                logger.error(f"Error getting allowed domains: {e}")
+                logger.error("Error getting allowed domains: %s", e)
 
         result = {
             "blocked_domains": blocked_domains,
@@ -1462,12 +2280,14 @@ def get_top_domains(
         }
 
         logger.debug(
-            f"📊 Found {len(blocked_domains)} blocked and {len(allowed_domains)} allowed top domains"
+            "📊 Found %s blocked and %s allowed top domains",
+            len(blocked_domains),
+            len(allowed_domains),
         )
         return result
 
     except SQLAlchemyError as e:
-        logger.error(f"❌ Error getting top domains: {e}")
+        logger.error("❌ Error getting top domains: %s", e)
         return {"blocked_domains": [], "allowed_domains": []}
     finally:
         session.close()
@@ -1496,6 +2316,27 @@ def get_stats_tlds(  # pylint: disable=too-many-locals,too-many-branches
     """
     session = session_factory()
     try:
+        if not (profile_filter and profile_filter.strip() and profile_filter != "all"):
+            profile_filter = None
+
+        # Long windows read complete days from the daily domains view
+        view_window = _domains_view_window(session, time_range)
+        if view_window is not None:
+            total_queries, blocked_rows, allowed_rows = (
+                _ranked_counts_from_domains_view(
+                    session,
+                    "tld",
+                    view_window,
+                    limit,
+                    profile_filter,
+                    exclude_domains,
+                )
+            )
+            return {
+                "blocked_tlds": _ranked_counts(blocked_rows, total_queries),
+                "allowed_tlds": _ranked_counts(allowed_rows, total_queries),
+            }
+
         # Build base query
         query = session.query(DNSLog)
 
@@ -1508,26 +2349,13 @@ def get_stats_tlds(  # pylint: disable=too-many-locals,too-many-branches
                 query = query.filter(exclusion_filter)
 
         # Apply profile filter
-        if profile_filter and profile_filter.strip() and profile_filter != "all":
+        if profile_filter:
             query = query.filter(DNSLog.profile_id == profile_filter)
 
         # Apply time range filter
-        if time_range != "all":
-            now = datetime.now(timezone.utc)
-
-            time_deltas = {
-                "30m": timedelta(minutes=30),
-                "1h": timedelta(hours=1),
-                "6h": timedelta(hours=6),
-                "24h": timedelta(hours=24),
-                "7d": timedelta(days=7),
-                "30d": timedelta(days=30),
-                "3m": timedelta(days=90),
-            }
-
-            if time_range in time_deltas:
-                cutoff_time = now - time_deltas[time_range]
-                query = query.filter(DNSLog.timestamp >= cutoff_time)
+        time_filter = _time_range_filter(time_range)
+        if time_filter is not None:
+            query = query.filter(time_filter)
 
         # Phase 3 Optimization: Use database-side aggregation with TLD column
         # This eliminates the need to load all records into Python and extract TLDs
@@ -1539,7 +2367,7 @@ def get_stats_tlds(  # pylint: disable=too-many-locals,too-many-branches
         # pylint: disable=not-callable
         blocked_results = (
             query.with_entities(DNSLog.tld, func.count(DNSLog.id).label("count"))
-            .filter(DNSLog.blocked.is_(True))
+            .filter(DNSLog.blocked == true())
             .filter(DNSLog.tld.isnot(None))  # Exclude null TLDs
             .group_by(DNSLog.tld)
             .order_by(func.count(DNSLog.id).desc())
@@ -1550,7 +2378,7 @@ def get_stats_tlds(  # pylint: disable=too-many-locals,too-many-branches
         # Aggregate allowed TLDs using database GROUP BY
         allowed_results = (
             query.with_entities(DNSLog.tld, func.count(DNSLog.id).label("count"))
-            .filter(DNSLog.blocked.is_(False))
+            .filter(DNSLog.blocked == false())
             .filter(DNSLog.tld.isnot(None))  # Exclude null TLDs
             .group_by(DNSLog.tld)
             .order_by(func.count(DNSLog.id).desc())
@@ -1560,32 +2388,10 @@ def get_stats_tlds(  # pylint: disable=too-many-locals,too-many-branches
         # pylint: enable=not-callable
 
         # Format blocked TLDs
-        blocked_tlds = []
-        for tld_result in blocked_results:
-            tld = tld_result[0]
-            count = tld_result[1]
-            percentage = (count / total_queries * 100) if total_queries > 0 else 0
-            blocked_tlds.append(
-                {
-                    "domain": tld,
-                    "count": count,
-                    "percentage": round(percentage, 1),
-                }
-            )
+        blocked_tlds = _ranked_counts(blocked_results, total_queries)
 
         # Format allowed TLDs
-        allowed_tlds = []
-        for tld_result in allowed_results:
-            tld = tld_result[0]
-            count = tld_result[1]
-            percentage = (count / total_queries * 100) if total_queries > 0 else 0
-            allowed_tlds.append(
-                {
-                    "domain": tld,
-                    "count": count,
-                    "percentage": round(percentage, 1),
-                }
-            )
+        allowed_tlds = _ranked_counts(allowed_results, total_queries)
 
         result = {
             "blocked_tlds": blocked_tlds,
@@ -1593,12 +2399,14 @@ def get_stats_tlds(  # pylint: disable=too-many-locals,too-many-branches
         }
 
         logger.debug(
-            f"📊 Found {len(blocked_tlds)} blocked and {len(allowed_tlds)} allowed top TLDs"
+            "📊 Found %s blocked and %s allowed top TLDs",
+            len(blocked_tlds),
+            len(allowed_tlds),
         )
         return result
 
     except SQLAlchemyError as e:
-        logger.error(f"❌ Error getting TLD statistics: {e}")
+        logger.error("❌ Error getting TLD statistics: %s", e)
         return {"blocked_tlds": [], "allowed_tlds": []}
     finally:
         session.close()
@@ -1637,7 +2445,7 @@ def get_stats_devices(  # pylint: disable=too-many-locals
         agg_query = session.query(
             DNSLog.device_name,
             func.count(DNSLog.id).label("total"),
-            func.sum(case((DNSLog.blocked.is_(True), 1), else_=0)).label(
+            func.sum(case((DNSLog.blocked == true(), 1), else_=0)).label(
                 "blocked_count"
             ),
             func.max(DNSLog.timestamp).label("last_activity"),
@@ -1653,20 +2461,9 @@ def get_stats_devices(  # pylint: disable=too-many-locals
             agg_query = agg_query.filter(domain_filter)
 
         # Apply time range filter
-        if time_range != "all":
-            now = datetime.now(timezone.utc)
-            time_deltas = {
-                "30m": timedelta(minutes=30),
-                "1h": timedelta(hours=1),
-                "6h": timedelta(hours=6),
-                "24h": timedelta(hours=24),
-                "7d": timedelta(days=7),
-                "30d": timedelta(days=30),
-                "3m": timedelta(days=90),
-            }
-            if time_range in time_deltas:
-                cutoff_time = now - time_deltas[time_range]
-                agg_query = agg_query.filter(DNSLog.timestamp >= cutoff_time)
+        time_filter = _time_range_filter(time_range)
+        if time_filter is not None:
+            agg_query = agg_query.filter(time_filter)
 
         # Only include rows with a known device name
         agg_query = agg_query.filter(DNSLog.device_name.isnot(None))
@@ -1710,11 +2507,11 @@ def get_stats_devices(  # pylint: disable=too-many-locals
                 }
             )
 
-        logger.debug(f"📱 Found {len(device_results)} devices with DNS activity")
+        logger.debug("📱 Found %s devices with DNS activity", len(device_results))
         return device_results
 
     except SQLAlchemyError as e:
-        logger.error(f"❌ Error getting device statistics: {e}")
+        logger.error("❌ Error getting device statistics: %s", e)
         return []
     finally:
         session.close()
@@ -1769,7 +2566,7 @@ def get_database_metrics():  # pylint: disable=too-many-branches,too-many-statem
                 )
 
         except SQLAlchemyError as e:
-            logger.debug(f"Could not fetch connection statistics: {e}")
+            logger.debug("Could not fetch connection statistics: %s", e)
 
         # Get cache hit ratio - using a more reliable query
         try:
@@ -1793,7 +2590,7 @@ def get_database_metrics():  # pylint: disable=too-many-branches,too-many-statem
                 metrics["performance"]["cache_hit_ratio"] = 0.95
 
         except SQLAlchemyError as e:
-            logger.debug(f"Could not fetch cache hit ratio: {e}")
+            logger.debug("Could not fetch cache hit ratio: %s", e)
             metrics["performance"]["cache_hit_ratio"] = 0.95
 
         # Get database size
@@ -1811,7 +2608,7 @@ def get_database_metrics():  # pylint: disable=too-many-branches,too-many-statem
                 metrics["performance"]["database_size_mb"] = 0
 
         except SQLAlchemyError as e:
-            logger.debug(f"Could not fetch database size: {e}")
+            logger.debug("Could not fetch database size: %s", e)
             metrics["performance"]["database_size_mb"] = 0
 
         # Get total queries (from our DNS logs table)
@@ -1820,7 +2617,7 @@ def get_database_metrics():  # pylint: disable=too-many-branches,too-many-statem
             metrics["performance"]["total_queries"] = total_queries
 
         except SQLAlchemyError as e:
-            logger.debug(f"Could not fetch total queries: {e}")
+            logger.debug("Could not fetch total queries: %s", e)
 
         # Get database uptime
         try:
@@ -1834,7 +2631,7 @@ def get_database_metrics():  # pylint: disable=too-many-branches,too-many-statem
                 metrics["health"]["uptime_seconds"] = int(uptime_result[0])
 
         except SQLAlchemyError as e:
-            logger.debug(f"Could not fetch database uptime: {e}")
+            logger.debug("Could not fetch database uptime: %s", e)
 
         # Determine overall health status
         if (
@@ -1847,11 +2644,11 @@ def get_database_metrics():  # pylint: disable=too-many-branches,too-many-statem
         else:
             metrics["health"]["status"] = "critical"
 
-        logger.debug(f"📊 Database metrics collected: {metrics}")
+        logger.debug("📊 Database metrics collected: %s", metrics)
         return metrics
 
     except (SQLAlchemyError, ValueError, TypeError) as e:
-        logger.error(f"❌ Error collecting database metrics: {e}")
+        logger.error("❌ Error collecting database metrics: %s", e)
         return {
             "connections": {"active": 0, "total": 0, "usage_percent": 0.0},
             "performance": {
@@ -1930,18 +2727,42 @@ class NextDNSProfile(Base):
 # ---------------------------------------------------------------------------
 
 
+# Settings change a few times a day at most but are read by every settings,
+# profile and scheduler call. Reads are cached for 30 seconds and set_setting
+# drops the key, so this process sees its own writes immediately and other
+# replicas within the TTL.
+_SETTINGS_CACHE: TTLCache = TTLCache(maxsize=32, ttl=30)  # 30-second TTL
+_SETTINGS_LOCK = threading.Lock()
+_SETTING_MISSING = object()
+
+
 def get_setting(key: str) -> Optional[str]:
     """Return the value for *key* from system_settings, or None."""
+    with _SETTINGS_LOCK:
+        cached = _SETTINGS_CACHE.get(key, _SETTING_MISSING)
+    if cached is not _SETTING_MISSING:
+        return cached
+
     session = session_factory()
     try:
         row = session.query(SystemSetting).filter_by(key=key).first()
-        return row.value if row else None
+        value = row.value if row else None
     except SQLAlchemyError as e:
         logger.error("❌ Error reading setting: %s", type(e).__name__)
         return None
     finally:
         session.close()
 
+    with _SETTINGS_LOCK:
+        _SETTINGS_CACHE[key] = value
+    return value
+
+
+def invalidate_settings_cache() -> None:
+    """Forget every cached setting so the next read goes to the database."""
+    with _SETTINGS_LOCK:
+        _SETTINGS_CACHE.clear()
+
 
 def set_setting(key: str, value: str) -> bool:
     """Upsert *key* → *value* in system_settings."""
@@ -1955,6 +2776,8 @@ def set_setting(key: str, value: str) -> bool:
             row = SystemSetting(key=key, value=value)
             session.add(row)
         session.commit()
+        with _SETTINGS_LOCK:
+            _SETTINGS_CACHE.pop(key, None)
         logger.debug("✅ Setting saved successfully")
         return True
     except SQLAlchemyError as e:
@@ -2116,9 +2939,12 @@ def delete_logs_older_than(
                 .limit(batch_size)
                 .subquery()
             )
+            # The timestamp predicate on the outer DELETE lets PostgreSQL
+            # prune to the expired daily partitions instead of probing the
+            # (id, timestamp) primary key of every partition.
             deleted = (
                 session.query(DNSLog)
-                .filter(DNSLog.id.in_(subq.select()))
+                .filter(DNSLog.timestamp < cutoff, DNSLog.id.in_(subq.select()))
                 .delete(synchronize_session=False)
             )
             session.commit()
@@ -2141,17 +2967,61 @@ def delete_logs_older_than(
         session.close()
 
 
+def ensure_dns_logs_partitions(days_ahead: int = 7) -> int:
+    """Create the daily ``dns_logs`` partitions for the next *days_ahead* days.
+
+    Wraps the ``dns_logs_ensure_partitions()`` function installed by
+    migration f5a6b7c8d9e0. Rows for days without a partition still land
+    in ``dns_logs_default``, so this only has to run ahead of time, not on
+    the insert path. Returns the number of partitions created.
+    """
+    session = session_factory()
+    try:
+        if session.get_bind().dialect.name != "postgresql":
+            return 0
+        created = session.execute(
+            text("SELECT dns_logs_ensure_partitions(:days_ahead)"),
+            {"days_ahead": days_ahead},
+        ).scalar()
+        session.commit()
+        logger.info(
+            "🗄️ dns_logs partitions ensured %d days ahead (%d created)",
+            days_ahead,
+            created or 0,
+        )
+        return created or 0
+    except SQLAlchemyError as e:
+        session.rollback()
+        logger.error("❌ Error creating dns_logs partitions: %s", e)
+        return 0
+    finally:
+        session.close()
+
+
 # ---------------------------------------------------------------------------
 # NextDNS profile helpers
 # ---------------------------------------------------------------------------
 
 
+# The profile set only changes through the settings API, yet /profiles/info,
+# the scheduler and stats precompute all read it. Cache it for a minute and
+# drop it whenever this process changes a profile; other replicas pick the
+# change up when their TTL runs out.
+_ACTIVE_PROFILES_CACHE: TTLCache = TTLCache(maxsize=1, ttl=60)  # 1-minute TTL
+_ACTIVE_PROFILES_CACHE_KEY = "active"
+
+
 def get_active_profile_ids() -> list:
     """Return profile_ids for all *enabled* profiles in the DB.
 
     Falls back to env var ``PROFILE_IDS`` if the table is empty (e.g. before
-    the first ``migrate_config_from_env`` run).
+    the first ``migrate_config_from_env`` run). Successful lookups are
+    cached for one minute.
     """
+    cached = _ACTIVE_PROFILES_CACHE.get(_ACTIVE_PROFILES_CACHE_KEY)
+    if cached is not None:
+        return list(cached)
+
     session = session_factory()
     try:
         rows = (
@@ -2161,9 +3031,11 @@ def get_active_profile_ids() -> list:
             .all()
         )
         if rows:
-            return [r.profile_id for r in rows]
+            profile_ids = [r.profile_id for r in rows]
+            _ACTIVE_PROFILES_CACHE[_ACTIVE_PROFILES_CACHE_KEY] = tuple(profile_ids)
+            return profile_ids
     except SQLAlchemyError as e:
-        logger.error(f"❌ Error reading active profiles: {e}")
+        logger.error("❌ Error reading active profiles: %s", e)
     finally:
         session.close()
 
@@ -2172,13 +3044,22 @@ def get_active_profile_ids() -> list:
     return [p.strip() for p in env_ids.split(",") if p.strip()]
 
 
+def invalidate_active_profiles_cache() -> None:
+    """Forget the cached active profile IDs.
+
+    Called by the profile mutation helpers below so the next read reflects
+    the change immediately.
+    """
+    _ACTIVE_PROFILES_CACHE.clear()
+
+
 def get_all_profiles() -> list:
     """Return all NextDNSProfile rows (enabled and disabled)."""
     session = session_factory()
     try:
         return session.query(NextDNSProfile).order_by(NextDNSProfile.profile_id).all()
     except SQLAlchemyError as e:
-        logger.error(f"❌ Error reading profiles: {e}")
+        logger.error("❌ Error reading profiles: %s", e)
         return []
     finally:
         session.close()
@@ -2190,7 +3071,7 @@ def get_profile(profile_id: str) -> Optional[object]:
     try:
         return session.query(NextDNSProfile).filter_by(profile_id=profile_id).first()
     except SQLAlchemyError as e:
-        logger.error(f"❌ Error reading profile '{profile_id}': {e}")
+        logger.error("❌ Error reading profile '%s': %s", profile_id, e)
         return None
     finally:
         session.close()
@@ -2204,15 +3085,16 @@ def add_profile(profile_id: str) -> bool:
             session.query(NextDNSProfile).filter_by(profile_id=profile_id).first()
         )
         if existing:
-            logger.warning(f"⚠️  Profile '{profile_id}' already exists")
+            logger.warning("⚠️  Profile '%s' already exists", profile_id)
             return False
         session.add(NextDNSProfile(profile_id=profile_id, enabled=True))
         session.commit()
-        logger.info(f"✅ Profile '{profile_id}' added")
+        invalidate_active_profiles_cache()
+        logger.info("✅ Profile '%s' added", profile_id)
         return True
     except SQLAlchemyError as e:
         session.rollback()
-        logger.error(f"❌ Error adding profile '{profile_id}': {e}")
+        logger.error("❌ Error adding profile '%s': %s", profile_id, e)
         return False
     finally:
         session.close()
@@ -2228,12 +3110,13 @@ def update_profile_enabled(profile_id: str, enabled: bool) -> bool:
         row.enabled = enabled
         row.updated_at = datetime.now(timezone.utc)
         session.commit()
+        invalidate_active_profiles_cache()
         state = "enabled" if enabled else "disabled"
-        logger.info(f"✅ Profile '{profile_id}' {state}")
+        logger.info("✅ Profile '%s' %s", profile_id, state)
         return True
     except SQLAlchemyError as e:
         session.rollback()
-        logger.error(f"❌ Error updating profile '{profile_id}': {e}")
+        logger.error("❌ Error updating profile '%s': %s", profile_id, e)
         return False
     finally:
         session.close()
@@ -2262,8 +3145,10 @@ def delete_profile_data(profile_id: str) -> dict:
         # showing the deleted profile for up to 5 more minutes.
         invalidate_profiles_cache()
         logger.info(
-            f"🗑️  Profile '{profile_id}' data cleaned up: "
-            f"{logs_deleted} DNS logs, {fetch_deleted} fetch status rows deleted"
+            "🗑️  Profile '%s' data cleaned up: %s DNS logs, %s fetch status rows deleted",
+            profile_id,
+            logs_deleted,
+            fetch_deleted,
         )
         return {
             "dns_logs_deleted": logs_deleted,
@@ -2271,7 +3156,7 @@ def delete_profile_data(profile_id: str) -> dict:
         }
     except SQLAlchemyError as e:
         session.rollback()
-        logger.error(f"❌ Error deleting data for profile '{profile_id}': {e}")
+        logger.error("❌ Error deleting data for profile '%s': %s", profile_id, e)
         return {"dns_logs_deleted": 0, "fetch_status_deleted": 0}
     finally:
         session.close()
@@ -2300,13 +3185,14 @@ def delete_profile(profile_id: str, delete_data: bool = True) -> dict:
         )
         session.commit()
         if deleted:
-            logger.info(f"🗑️  Profile '{profile_id}' removed from nextdns_profiles")
+            invalidate_active_profiles_cache()
+            logger.info("🗑️  Profile '%s' removed from nextdns_profiles", profile_id)
             return {"deleted": True, **cleanup}
-        logger.warning(f"⚠️  Profile '{profile_id}' not found for deletion")
+        logger.warning("⚠️  Profile '%s' not found for deletion", profile_id)
         return {"deleted": False, **cleanup}
     except SQLAlchemyError as e:
         session.rollback()
-        logger.error(f"❌ Error deleting profile '{profile_id}': {e}")
+        logger.error("❌ Error deleting profile '%s': %s", profile_id, e)
         return {"deleted": False, **cleanup}
     finally:
         session.close()
@@ -2407,7 +3293,7 @@ def migrate_config_from_env() -> bool:
         has_settings = session.query(SystemSetting).first() is not None
         has_profiles = session.query(NextDNSProfile).first() is not None
     except SQLAlchemyError as e:
-        logger.error(f"❌ migrate_config_from_env: cannot query tables: {e}")
+        logger.error("❌ migrate_config_from_env: cannot query tables: %s", e)
         return False
     finally:
         session.close()
@@ -2436,7 +3322,8 @@ def migrate_config_from_env() -> bool:
             try:
                 set_fetch_interval(int(fetch_interval_env))
                 logger.info(
-                    f"⏰ Migrated FETCH_INTERVAL={fetch_interval_env} to system_settings"
+                    "⏰ Migrated FETCH_INTERVAL=%s to system_settings",
+                    fetch_interval_env,
                 )
                 seeded = True
             except ValueError:
@@ -2447,7 +3334,7 @@ def migrate_config_from_env() -> bool:
             try:
                 set_fetch_limit(int(fetch_limit_env))
                 logger.info(
-                    f"📊 Migrated FETCH_LIMIT={fetch_limit_env} to system_settings"
+                    "📊 Migrated FETCH_LIMIT=%s to system_settings", fetch_limit_env
                 )
                 seeded = True
             except ValueError:
@@ -2456,7 +3343,7 @@ def migrate_config_from_env() -> bool:
         log_level_env = os.getenv("LOG_LEVEL")
         if log_level_env:
             set_log_level(log_level_env)
-            logger.info(f"📋 Migrated LOG_LEVEL={log_level_env} to system_settings")
+            logger.info("📋 Migrated LOG_LEVEL=%s to system_settings", log_level_env)
             seeded = True
 
     # Seed profiles
@@ -2467,7 +3354,7 @@ def migrate_config_from_env() -> bool:
             for pid in profile_ids:
                 add_profile(pid)
             logger.info(
-                f"🧱 Migrated {len(profile_ids)} profile(s) from PROFILE_IDS env to DB"
+                "🧱 Migrated %s profile(s) from PROFILE_IDS env to DB", len(profile_ids)
             )
             seeded = True
         else:
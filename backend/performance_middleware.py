@@ -1,5 +1,6 @@
 # file: backend/performance_middleware.py
 import time
+from bisect import bisect_right
 from typing import Callable
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -7,6 +8,15 @@ from logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bounds (exclusive, in ms) of each speed band, and the band labels
+_SPEED_THRESHOLDS_MS = (100, 500, 2000)
+_SPEED_BANDS = (
+    ("⚡", "Fast"),
+    ("✅", "Good"),
+    ("⚠️", "Slow"),
+    ("🐌", "Very Slow"),
+)
+
 
 class PerformanceMiddleware(BaseHTTPMiddleware):
     """
@@ -69,18 +79,9 @@ class PerformanceMiddleware(BaseHTTPMiddleware):
         🧱 Building blocks of performance monitoring!
         """
         # Determine emoji based on execution time
-        if execution_time_ms < 100:
-            emoji = "⚡"
-            speed_label = "Fast"
-        elif execution_time_ms < 500:
-            emoji = "✅"
-            speed_label = "Good"
-        elif execution_time_ms < 2000:
-            emoji = "⚠️"
-            speed_label = "Slow"
-        else:
-            emoji = "🐌"
-            speed_label = "Very Slow"
+        emoji, speed_label = _SPEED_BANDS[
+            bisect_right(_SPEED_THRESHOLDS_MS, execution_time_ms)
+        ]
 
         # Format query parameters if present
         query_str = ""
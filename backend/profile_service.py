@@ -1,12 +1,25 @@
 # file: backend/profile_service.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 import requests
+from cachetools import TTLCache
 from logging_config import get_logger
 from models import get_nextdns_api_key, get_active_profile_ids
 
 logger = get_logger(__name__)
 
+# Keep-alive connections to api.nextdns.io, shared by every lookup
+_session = requests.Session()
+
+# Profile names/metadata rarely change, but the dashboard asks for them on
+# every load. Successful lookups are reused for five minutes.
+_PROFILE_INFO_CACHE: TTLCache = TTLCache(maxsize=128, ttl=300)
+_PROFILE_INFO_LOCK = threading.Lock()
+# Upper bound on concurrent NextDNS requests for /profiles/info
+_MAX_PROFILE_FETCH_WORKERS = 8
+
 
 def _create_error_profile_info(profile_id: str, name_suffix: str, error: str) -> Dict:
     """Helper function to create error profile information."""
@@ -17,11 +30,20 @@ def _create_error_profile_info(profile_id: str, name_suffix: str, error: str) ->
     }
 
 
+# Known NextDNS error statuses: (name suffix, error text, warning log format)
+_PROFILE_ERROR_STATUSES = {
+    404: ("(Not Found)", "Profile not found", "⚠️  Profile %s not found (404)"),
+    403: ("(Access Denied)", "Access denied", "⚠️  Access denied to profile %s (403)"),
+}
+
+
 def _handle_api_response(response: requests.Response, profile_id: str) -> Dict:
     """Helper function to handle API response based on status code."""
     if response.status_code == 200:
         profile_data = response.json().get("data", {})
-        logger.debug(f"✅ Profile {profile_id}: {profile_data.get('name', 'Unknown')}")
+        logger.debug(
+            "✅ Profile %s: %s", profile_id, profile_data.get("name", "Unknown")
+        )
         return {
             "id": profile_id,
             "name": profile_data.get("name", f"Profile {profile_id}"),
@@ -30,37 +52,36 @@ def _handle_api_response(response: requests.Response, profile_id: str) -> Dict:
             "updated": profile_data.get("updated"),
         }
 
-    if response.status_code == 404:
-        logger.warning(f"⚠️  Profile {profile_id} not found (404)")
-        return _create_error_profile_info(
-            profile_id, "(Not Found)", "Profile not found"
-        )
-
-    if response.status_code == 403:
-        logger.warning(f"⚠️  Access denied to profile {profile_id} (403)")
-        return _create_error_profile_info(
-            profile_id, "(Access Denied)", "Access denied"
-        )
+    known_error = _PROFILE_ERROR_STATUSES.get(response.status_code)
+    if known_error is not None:
+        name_suffix, error, log_format = known_error
+        logger.warning(log_format, profile_id)
+        return _create_error_profile_info(profile_id, name_suffix, error)
 
     # Handle all other status codes
     logger.error(
-        f"❌ Profile {profile_id}: API returned {response.status_code}: {response.text}"
+        "❌ Profile %s: API returned %s: %s",
+        profile_id,
+        response.status_code,
+        response.text,
     )
     return _create_error_profile_info(
         profile_id, "(Error)", f"HTTP {response.status_code}"
     )
 
 
-def get_profile_info(profile_id: str) -> Optional[Dict]:
+def get_profile_info(profile_id: str, api_key: Optional[str] = None) -> Optional[Dict]:
     """Get profile information from NextDNS API.
 
     Args:
         profile_id (str): NextDNS profile ID
+        api_key (str, optional): NextDNS API key; read from settings if omitted
 
     Returns:
         dict: Profile information or None if error occurs
     """
-    api_key = get_nextdns_api_key()
+    if api_key is None:
+        api_key = get_nextdns_api_key()
     if not api_key:
         logger.warning("⚠️  No API key available for profile fetching")
         return None
@@ -69,21 +90,46 @@ def get_profile_info(profile_id: str) -> Optional[Dict]:
         url = f"https://api.nextdns.io/profiles/{profile_id}"
         headers = {"X-Api-Key": api_key}
 
-        logger.debug(f"🌐 Fetching profile info for: {profile_id}")
-        response = requests.get(url, headers=headers, timeout=10)
+        logger.debug("🌐 Fetching profile info for: %s", profile_id)
+        response = _session.get(url, headers=headers, timeout=10)
         return _handle_api_response(response, profile_id)
 
     except requests.exceptions.RequestException as e:
-        logger.error(f"❌ Profile {profile_id}: Request error: {e}")
+        logger.error("❌ Profile %s: Request error: %s", profile_id, e)
         return _create_error_profile_info(profile_id, "(Network Error)", str(e))
     except (ValueError, TypeError, KeyError) as e:
-        logger.error(f"❌ Profile {profile_id}: Unexpected error: {e}")
+        logger.error("❌ Profile %s: Unexpected error: %s", profile_id, e)
         return _create_error_profile_info(profile_id, "(Error)", str(e))
 
 
+def validate_api_key(api_key: str) -> bool:
+    """Check an API key against the NextDNS API by listing profiles.
+
+    Args:
+        api_key (str): NextDNS API key to check
+
+    Returns:
+        bool: True if NextDNS accepts the key (HTTP 200), False otherwise
+    """
+    try:
+        response = _session.get(
+            "https://api.nextdns.io/profiles",
+            headers={"X-Api-Key": api_key},
+            timeout=10,
+        )
+        return response.status_code == 200
+    except requests.exceptions.RequestException as e:
+        logger.warning("⚠️  NextDNS API key check failed: %s", e)
+        return False
+
+
 def get_multiple_profiles_info(profile_ids: List[str]) -> Dict[str, Dict]:
     """Get information for multiple profiles from NextDNS API.
 
+    Uncached profiles are fetched concurrently, so K profiles cost roughly
+    one API round-trip instead of K. Successful lookups are cached for five
+    minutes; errors are always retried on the next call.
+
     Args:
         profile_ids (list): List of NextDNS profile IDs
 
@@ -91,21 +137,38 @@ def get_multiple_profiles_info(profile_ids: List[str]) -> Dict[str, Dict]:
         dict: Dictionary mapping profile_id to profile information
     """
     profiles = {}
-
-    for profile_id in profile_ids:
-        profile_info = get_profile_info(profile_id)
-        if profile_info:
-            profiles[profile_id] = profile_info
-        else:
-            # Fallback info if API call fails
-            profiles[profile_id] = {
-                "id": profile_id,
-                "name": f"Profile {profile_id}",
-                "error": "Failed to fetch profile information",
-            }
-
-    logger.info(f"🧱 Fetched information for {len(profiles)} profiles")
-    return profiles
+    with _PROFILE_INFO_LOCK:
+        for profile_id in profile_ids:
+            cached = _PROFILE_INFO_CACHE.get(profile_id)
+            if cached is not None:
+                profiles[profile_id] = cached
+    missing = [profile_id for profile_id in profile_ids if profile_id not in profiles]
+
+    if missing:
+        api_key = get_nextdns_api_key()
+        with ThreadPoolExecutor(
+            max_workers=min(len(missing), _MAX_PROFILE_FETCH_WORKERS)
+        ) as executor:
+            fetched = executor.map(
+                lambda profile_id: get_profile_info(profile_id, api_key), missing
+            )
+            for profile_id, profile_info in zip(missing, fetched):
+                if profile_info:
+                    profiles[profile_id] = profile_info
+                    if "error" not in profile_info:
+                        with _PROFILE_INFO_LOCK:
+                            _PROFILE_INFO_CACHE[profile_id] = profile_info
+                else:
+                    # Fallback info if API call fails
+                    profiles[profile_id] = {
+                        "id": profile_id,
+                        "name": f"Profile {profile_id}",
+                        "error": "Failed to fetch profile information",
+                    }
+
+    logger.info("🧱 Fetched information for %s profiles", len(profiles))
+    # Preserve the caller's profile order
+    return {profile_id: profiles[profile_id] for profile_id in profile_ids}
 
 
 def get_configured_profile_ids() -> List[str]:
@@ -115,5 +178,5 @@ def get_configured_profile_ids() -> List[str]:
         list: List of active profile IDs
     """
     profile_ids = get_active_profile_ids()
-    logger.debug(f"🧱 Active profiles from DB: {profile_ids}")
+    logger.debug("🧱 Active profiles from DB: %s", profile_ids)
     return profile_ids
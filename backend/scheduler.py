@@ -1,18 +1,23 @@
 # file: backend/scheduler.py  # pylint: disable=duplicate-code
+import json
 import os
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from models import (
-    add_log,
+    add_logs_bulk,
     get_total_record_count,
     get_last_fetch_timestamp,
     update_fetch_status,
     get_nextdns_api_key,
     get_active_profile_ids,
     get_fetch_limit,
+    invalidate_logs_stats_cache,
+    invalidate_row_estimate_cache,
 )
 
 # Set up logging
@@ -23,13 +28,157 @@ logger = get_logger(__name__)
 FETCH_INTERVAL = int(os.getenv("FETCH_INTERVAL", "60"))  # Default to 60 minutes
 # FETCH_LIMIT is read from DB on each cycle via get_fetch_limit()
 
+# Upper bound on concurrent NextDNS API requests per fetch cycle
+FETCH_MAX_WORKERS = 8
 
-def fetch_logs():  # pylint: disable=too-many-locals,too-many-branches,too-many-statements,too-many-nested-blocks
+# (connect, read) timeouts for NextDNS API calls
+NEXTDNS_REQUEST_TIMEOUT = (5, 30)
+
+
+def _build_http_session():
+    """Create the pooled HTTP session used for all NextDNS API calls.
+
+    Keep-alive connections are reused across profiles and fetch cycles, so
+    only the first request pays the TCP+TLS handshake. Transient errors
+    (429/5xx) are retried with exponential backoff before giving up.
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
+
+
+http_session = _build_http_session()  # pylint: disable=invalid-name
+
+
+def _read_logs_payload(response):
+    """Decode the ``data`` array from a streamed NextDNS logs response.
+
+    Streams the gzip-decoded body and reads it once. Only the ``data`` list
+    is kept; the rest of the envelope is dropped.
+    """
+    response.raw.decode_content = True
+    return json.load(response.raw).get("data", [])
+
+
+def _request_profile_logs(profile_id, api_key, fetch_limit):
+    """Request new logs for a single profile from the NextDNS API.
+
+    Runs on a worker thread so that all enabled profiles are fetched
+    concurrently over the shared connection pool.
+
+    Returns:
+        list: Log entries (possibly empty), or None if the request failed
+    """
+    try:
+        logger.info("🧱 Processing profile: %s", profile_id)
+
+        # Get last fetch timestamp for this specific profile
+        last_fetch = get_last_fetch_timestamp(profile_id)
+
+        headers = {"X-Api-Key": api_key}
+        nextdns_api_url = f"https://api.nextdns.io/profiles/{profile_id}/logs"
+
+        # Build parameters for incremental fetching
+        if last_fetch:
+            # Fetch records newer than last fetch (with small overlap for safety)
+            from_time = last_fetch.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+            params = {
+                "from": from_time,
+                "to": "now",
+                "raw": "false",
+                "limit": fetch_limit,
+            }
+            logger.info(
+                "📅 Profile %s: incremental fetch from %s", profile_id, from_time
+            )
+        else:
+            # First fetch - get last hour of data
+            params = {
+                "from": "-1h",
+                "to": "now",
+                "raw": "false",
+                "limit": fetch_limit,
+            }
+            logger.info("📅 Profile %s: initial fetch from past hour", profile_id)
+
+        logger.debug("🌐 Making API request to: %s", nextdns_api_url)
+        with http_session.get(
+            nextdns_api_url,
+            headers=headers,
+            params=params,
+            timeout=NEXTDNS_REQUEST_TIMEOUT,
+            stream=True,
+        ) as response:
+            if response.status_code != 200:
+                logger.error(
+                    "⚠️  Profile %s: API returned status %s: %s",
+                    profile_id,
+                    response.status_code,
+                    response.text,
+                )
+                return None
+
+            logs = _read_logs_payload(response)
+
+        logger.info("🔄 Profile %s: fetched %d DNS logs", profile_id, len(logs))
+        return logs
+
+    except requests.exceptions.RequestException as e:
+        logger.error("❌ Profile %s: error fetching logs: %s", profile_id, e)
+        return None
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.error("❌ Profile %s: unexpected error: %s", profile_id, e)
+        return None
+
+
+def _store_profile_logs(profile_id, logs):
+    """Persist a profile's fetched logs and advance its fetch status.
+
+    Returns:
+        tuple: (added, skipped) record counts
+    """
+    # Ensure every log has the profile_id tagged
+    for log in logs:
+        log["profile_id"] = profile_id
+
+    # Insert the whole batch in one round trip; duplicates are
+    # skipped by the unique constraint instead of a per-row SELECT
+    profile_added, profile_skipped, latest_timestamp = add_logs_bulk(logs)
+
+    # Update fetch status with latest timestamp for this profile
+    if latest_timestamp and profile_added > 0:
+        update_fetch_status(profile_id, latest_timestamp, profile_added)
+        logger.debug("📅 Profile %s: updated fetch status", profile_id)
+
+    # Log profile statistics
+    logger.info(
+        "💾 Profile %s: %d NEW records added, %d duplicates skipped",
+        profile_id,
+        profile_added,
+        profile_skipped,
+    )
+    return profile_added, profile_skipped
+
+
+def fetch_logs():  # pylint: disable=too-many-locals
     """Fetch logs from NextDNS API with timestamp-based incremental fetching for multiple profiles.
 
     API key and profile list are read from the database on every invocation so
     that changes made via the settings API take effect on the next scheduled
     run without requiring a restart.
+
+    API requests for all profiles run concurrently (bounded by
+    ``FETCH_MAX_WORKERS``) so a cycle takes roughly as long as the slowest
+    profile rather than the sum of all of them. Inserts stay sequential on
+    the scheduler thread.
     """
     # Re-read config from DB on every cycle (supports dynamic management)
     api_key = get_nextdns_api_key()
@@ -47,7 +196,8 @@ def fetch_logs():  # pylint: disable=too-many-locals,too-many-branches,too-many-
     # Log initial database state
     initial_count = get_total_record_count()
     logger.info(
-        f"🔄 Starting multi-profile NextDNS log fetch (Database has {initial_count:,} records)"
+        "🔄 Starting multi-profile NextDNS log fetch (Database has %d records)",
+        initial_count,
     )
 
     total_added = 0
@@ -55,151 +205,96 @@ def fetch_logs():  # pylint: disable=too-many-locals,too-many-branches,too-many-
     successful_profiles = 0
     failed_profiles = 0
 
-    # Fetch from each profile
-    for profile_id in profile_ids:  # pylint: disable=too-many-nested-blocks
-        try:
-            logger.info(f"🧱 Processing profile: {profile_id}")
-
-            # Get last fetch timestamp for this specific profile
-            last_fetch = get_last_fetch_timestamp(profile_id)
-
-            headers = {"X-Api-Key": api_key}
-            nextdns_api_url = f"https://api.nextdns.io/profiles/{profile_id}/logs"
-
-            # Build parameters for incremental fetching
-            if last_fetch:
-                # Fetch records newer than last fetch (with small overlap for safety)
-                from_time = last_fetch.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-                params = {
-                    "from": from_time,
-                    "to": "now",
-                    "raw": "false",
-                    "limit": fetch_limit,
-                }
-                logger.info(
-                    f"📅 Profile {profile_id}: incremental fetch from {from_time}"
-                )
-            else:
-                # First fetch - get last hour of data
-                params = {
-                    "from": "-1h",
-                    "to": "now",
-                    "raw": "false",
-                    "limit": fetch_limit,
-                }
-                logger.info(f"📅 Profile {profile_id}: initial fetch from past hour")
-
-            logger.debug(f"🌐 Making API request to: {nextdns_api_url}")
-            response = requests.get(nextdns_api_url, headers=headers, params=params)
-
-            if response.status_code == 200:
-                logs = response.json().get("data", [])
-                logger.info(f"🔄 Profile {profile_id}: fetched {len(logs)} DNS logs")
-
-                if not logs:
-                    logger.info(f"✅ Profile {profile_id}: no new records to process")
-                    successful_profiles += 1
-                    continue
-
-                # Process logs with duplicate tracking
-                profile_added = 0
-                profile_skipped = 0
-                latest_timestamp = None
-
-                for log in logs:
-                    # Ensure the log has the profile_id tagged
-                    log["profile_id"] = profile_id
-
-                    record_id, is_new = add_log(log)
-                    if record_id:
-                        if is_new:
-                            profile_added += 1
-                            # Track the latest timestamp for incremental fetching
-                            log_timestamp_str = log.get("timestamp")
-                            if log_timestamp_str:
-                                log_timestamp = datetime.fromisoformat(
-                                    log_timestamp_str.replace("Z", "+00:00")
-                                )
-                                if (
-                                    not latest_timestamp
-                                    or log_timestamp > latest_timestamp
-                                ):
-                                    latest_timestamp = log_timestamp
-                        else:
-                            profile_skipped += 1
-                    else:
-                        logger.warning(
-                            f"⚠️  Profile {profile_id}: failed to process log "
-                            f"for domain: {log.get('domain')}"
-                        )
-
-                # Update fetch status with latest timestamp for this profile
-                if latest_timestamp and profile_added > 0:
-                    update_fetch_status(profile_id, latest_timestamp, profile_added)
-                    logger.debug(f"📅 Profile {profile_id}: updated fetch status")
-
-                # Log profile statistics
-                logger.info(
-                    f"💾 Profile {profile_id}: {profile_added} NEW records added, "
-                    f"{profile_skipped} duplicates skipped"
-                )
+    # Fetch all profiles concurrently; results come back in profile order
+    with ThreadPoolExecutor(
+        max_workers=min(len(profile_ids), FETCH_MAX_WORKERS),
+        thread_name_prefix="nextdns-fetch",
+    ) as pool:
+        results = list(
+            pool.map(
+                lambda pid: _request_profile_logs(pid, api_key, fetch_limit),
+                profile_ids,
+            )
+        )
 
-                total_added += profile_added
-                total_skipped += profile_skipped
-                successful_profiles += 1
+    for profile_id, logs in zip(profile_ids, results):
+        if logs is None:
+            failed_profiles += 1
+            continue
 
-            else:
-                logger.error(
-                    f"⚠️  Profile {profile_id}: API returned status "
-                    f"{response.status_code}: {response.text}"
-                )
-                failed_profiles += 1
+        if not logs:
+            logger.info("✅ Profile %s: no new records to process", profile_id)
+            successful_profiles += 1
+            continue
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"❌ Profile {profile_id}: error fetching logs: {e}")
-            failed_profiles += 1
+        try:
+            profile_added, profile_skipped = _store_profile_logs(profile_id, logs)
+            total_added += profile_added
+            total_skipped += profile_skipped
+            successful_profiles += 1
         except Exception as e:  # pylint: disable=broad-exception-caught
-            logger.error(f"❌ Profile {profile_id}: unexpected error: {e}")
+            logger.error("❌ Profile %s: unexpected error: %s", profile_id, e)
             failed_profiles += 1
 
     # Log comprehensive statistics for all profiles
+    if total_added > 0:
+        invalidate_row_estimate_cache()
     final_count = get_total_record_count()
     logger.info("🏁 Multi-profile fetch completed:")
     logger.info(
-        f"📊 Total: {total_added} NEW records added, {total_skipped} duplicates skipped"
+        "📊 Total: %d NEW records added, %d duplicates skipped",
+        total_added,
+        total_skipped,
     )
     logger.info(
-        f"📊 Profiles: {successful_profiles} successful, {failed_profiles} failed"
+        "📊 Profiles: %d successful, %d failed", successful_profiles, failed_profiles
     )
     logger.info(
-        f"📊 Database now has {final_count:,} total records (+{total_added:,} new this fetch)"
+        "📊 Database now has %d total records (+%d new this fetch)",
+        final_count,
+        total_added,
     )
 
     if total_skipped > 0:
         logger.info("🔄 Duplicate prevention working across all profiles")
 
+    if total_added > 0:
+        invalidate_logs_stats_cache()
+
     # Pre-compute the cheap, fast-moving ranges (1h/6h/24h) after every
     # fetch cycle so dashboard requests for these ranges are served from
     # cache. Heavy ranges (7d/30d) are recomputed by a separate nightly
     # job — recomputing them every cycle was the dominant source of DB
-    # load at 13M+ records (#183).
+    # load at 13M+ records (#183). New logs also retire the memory-only
+    # entries (custom limits, exclusions, per-profile timeseries).
     try:
         from stats_cache import (
+            invalidate_memory_cache,
             precompute_frequent_stats,
         )  # pylint: disable=import-outside-toplevel
 
+        if total_added > 0:
+            invalidate_memory_cache()
         precompute_frequent_stats()
     except Exception as e:  # pylint: disable=broad-exception-caught
         logger.error("❌ Stats pre-computation failed after fetch cycle: %s", e)
 
 
 def precompute_heavy_stats_job():
-    """Nightly job: refresh the expensive 7d/30d stats cache entries."""
+    """Nightly job: refresh the expensive 7d/30d stats cache entries.
+
+    The hourly counters view is refreshed first so the day-granularity
+    timeseries computed here already read yesterday's buckets from it.
+    """
     try:
+        from models import (
+            refresh_hourly_stats_view,
+        )  # pylint: disable=import-outside-toplevel
         from stats_cache import (
             precompute_heavy_stats,
         )  # pylint: disable=import-outside-toplevel
 
+        refresh_hourly_stats_view()
         logger.info("🌙 Running nightly heavy stats pre-computation (7d/30d)")
         precompute_heavy_stats()
     except Exception as e:  # pylint: disable=broad-exception-caught
@@ -217,6 +312,7 @@ def retention_cleanup_job():
         from models import (
             get_retention_days,
             delete_logs_older_than,
+            refresh_hourly_stats_view,
         )  # pylint: disable=import-outside-toplevel
 
         retention = get_retention_days()
@@ -227,41 +323,121 @@ def retention_cleanup_job():
             "🪟 Running nightly retention cleanup (keeping last %d days)",
             retention,
         )
-        delete_logs_older_than(retention)
+        if delete_logs_older_than(retention):
+            # The stats views still count the deleted rows until refreshed
+            refresh_hourly_stats_view()
+        invalidate_row_estimate_cache()
     except Exception as e:  # pylint: disable=broad-exception-caught
         logger.error("❌ Nightly retention cleanup failed: %s", e)
 
 
-# Initialize and start scheduler
-scheduler = BackgroundScheduler()  # pylint: disable=invalid-name
-scheduler.add_job(fetch_logs, "interval", minutes=FETCH_INTERVAL, id="fetch_logs")
-# Nightly retention cleanup at 00:30 UTC. Runs BEFORE the heavy-stats job
-# so the 01:00 precompute reflects the post-cleanup row set immediately.
-# Reads the retention_days setting from the DB on every run, so changes
-# via the UI take effect on the next nightly cycle without a restart.
-scheduler.add_job(
-    retention_cleanup_job,
-    CronTrigger(hour=0, minute=30),
-    id="retention_cleanup",
-    replace_existing=True,
-)
+def partition_maintenance_job():
+    """Nightly job: pre-create the upcoming daily dns_logs partitions."""
+    try:
+        from models import (
+            ensure_dns_logs_partitions,
+        )  # pylint: disable=import-outside-toplevel
 
-# Nightly job: recompute the heavy stats ranges (7d/30d) at 01:00 UTC.
-# Skipping these from every fetch cycle is the biggest single DB win for #183.
-scheduler.add_job(
-    precompute_heavy_stats_job,
-    CronTrigger(hour=1, minute=0),
-    id="precompute_heavy_stats",
-    replace_existing=True,
-)
-scheduler.start()
-logger.info(
-    f"🔄 NextDNS log fetching scheduler started (runs every {FETCH_INTERVAL} minutes)"
-)
-logger.info("🪟 Nightly retention cleanup scheduled for 00:30 UTC")
-logger.info("🌙 Nightly heavy stats pre-computation scheduled for 01:00 UTC")
-logger.info(
-    f"🕰️ Fetch interval configured: {FETCH_INTERVAL} minutes ({FETCH_INTERVAL/60:.1f} hours)"
+        ensure_dns_logs_partitions()
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        logger.error("❌ Nightly partition maintenance failed: %s", e)
+
+
+# Job defaults applied to every job:
+# - coalesce: if several runs were missed (e.g. the process was suspended),
+#   run once instead of back-to-back catch-up runs.
+# - max_instances=1: a fetch cycle that outlives its interval is never
+#   overlapped by the next one.
+# - misfire_grace_time: a run that starts up to 5 minutes late still runs.
+JOB_DEFAULTS = {"coalesce": True, "max_instances": 1, "misfire_grace_time": 300}
+
+scheduler = BackgroundScheduler(  # pylint: disable=invalid-name
+    job_defaults=JOB_DEFAULTS, timezone="UTC"
 )
-logger.info("📊 Fetch limit is read from DB on each fetch cycle")
-logger.info("🧱 API key, profiles and fetch limit are read from DB on each fetch cycle")
+
+
+def _register_jobs():
+    """Add (or replace) every scheduled job on the module scheduler."""
+    scheduler.add_job(
+        fetch_logs,
+        "interval",
+        minutes=FETCH_INTERVAL,
+        id="fetch_logs",
+        replace_existing=True,
+    )
+    # Nightly at 00:15 UTC: create the next week of daily dns_logs partitions
+    # so inserts never fall through to the default partition.
+    scheduler.add_job(
+        partition_maintenance_job,
+        CronTrigger(hour=0, minute=15),
+        id="partition_maintenance",
+        replace_existing=True,
+    )
+    # Nightly retention cleanup at 00:30 UTC. Runs BEFORE the heavy-stats job
+    # so the 01:00 precompute reflects the post-cleanup row set immediately.
+    # Reads the retention_days setting from the DB on every run, so changes
+    # via the UI take effect on the next nightly cycle without a restart.
+    scheduler.add_job(
+        retention_cleanup_job,
+        CronTrigger(hour=0, minute=30),
+        id="retention_cleanup",
+        replace_existing=True,
+    )
+
+    # Nightly job: recompute the heavy stats ranges (7d/30d) at 01:00 UTC.
+    # Skipping these from every fetch cycle is the biggest single DB win for #183.
+    scheduler.add_job(
+        precompute_heavy_stats_job,
+        CronTrigger(hour=1, minute=0),
+        id="precompute_heavy_stats",
+        replace_existing=True,
+    )
+
+
+def start_scheduler():
+    """Register the jobs and start the scheduler (idempotent).
+
+    Called explicitly by the API lifespan and by worker.py — importing this
+    module no longer starts background threads.
+
+    Returns:
+        BackgroundScheduler: The running scheduler.
+    """
+    if scheduler.running:
+        logger.debug("🔄 Scheduler already running — start_scheduler() is a no-op")
+        return scheduler
+
+    # The nightly job may be up to a day away; make sure today's partition
+    # exists before the first fetch cycle inserts into it.
+    partition_maintenance_job()
+    _register_jobs()
+    scheduler.start()
+    logger.info(
+        "🔄 NextDNS log fetching scheduler started (runs every %d minutes)",
+        FETCH_INTERVAL,
+    )
+    logger.info("🗄️ Nightly dns_logs partition maintenance scheduled for 00:15 UTC")
+    logger.info("🪟 Nightly retention cleanup scheduled for 00:30 UTC")
+    logger.info("🌙 Nightly heavy stats pre-computation scheduled for 01:00 UTC")
+    logger.info(
+        "🕰️ Fetch interval configured: %d minutes (%.1f hours)",
+        FETCH_INTERVAL,
+        FETCH_INTERVAL / 60,
+    )
+    logger.info("📊 Fetch limit is read from DB on each fetch cycle")
+    logger.info(
+        "🧱 API key, profiles and fetch limit are read from DB on each fetch cycle"
+    )
+    return scheduler
+
+
+def shutdown_scheduler(wait=True):
+    """Stop the scheduler if it is running.
+
+    Args:
+        wait (bool): Wait for running jobs (e.g. a fetch cycle mid-insert)
+            to finish before returning.
+    """
+    if scheduler.running:
+        scheduler.shutdown(wait=wait)
+        logger.info("🛑 NextDNS log fetching scheduler stopped")
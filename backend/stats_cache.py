@@ -25,13 +25,19 @@ Keys encode all parameters that affect the result:
   "timeseries:profile_abc123:range_7d:gran_day:group_status"
   "domains:profile_all:range_24h:limit_10"
 
-Only "default" requests (no custom exclude/wildcard domain filters) are
-cached; requests with custom filters always run live.
+Only "default" requests (the shapes precompute_stats_for_ranges() refreshes)
+reach the DB cache. Requests with custom exclude lists, non-default limits
+or per-profile timeseries grouping are kept in the memory cache only; an
+exclude list is carried in the key as a fingerprint:
+  "overview:profile_all:range_24h:exclude_3f9a0c1d2b4e5f60"
+The scheduler clears the memory cache after any fetch that stored new logs,
+so these entries never outlive the data they were computed from.
 """
 
 import gc
+import hashlib
 import json
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from cachetools import TTLCache
 
@@ -111,16 +117,36 @@ def make_cache_key(
     return base
 
 
+def exclude_fingerprint(patterns: Iterable[str]) -> str:
+    """Return a short, order-independent hash of an exclude list.
+
+    Used as a cache key component so the same filter set maps to the same
+    key regardless of the order the client sent it in.
+
+    Args:
+        patterns: Domain/device exclude values from the request.
+
+    Returns:
+        16-character hex digest.
+    """
+    normalised = sorted({p.strip() for p in patterns if p and p.strip()})
+    return hashlib.blake2s(
+        "\n".join(normalised).encode("utf-8"), digest_size=8
+    ).hexdigest()
+
+
 # ---------------------------------------------------------------------------
 # Public cache API
 # ---------------------------------------------------------------------------
 
 
-def get_cached(cache_key: str) -> Optional[Any]:
+def get_cached(cache_key: str, persistent: bool = True) -> Optional[Any]:
     """Return a cached value, checking memory then DB.
 
     Args:
         cache_key: The cache key to look up.
+        persistent: Fall back to the DB cache on a memory miss. Pass False
+            for keys that are only ever stored in memory.
 
     Returns:
         Deserialized Python object, or None on cache miss.
@@ -130,6 +156,10 @@ def get_cached(cache_key: str) -> Optional[Any]:
         logger.debug("⚡ Cache L1 hit: %s", cache_key)
         return _MEMORY_CACHE[cache_key]
 
+    if not persistent:
+        logger.debug("❌ Cache miss: %s", cache_key)
+        return None
+
     # Level 2: DB cache
     payload_str = get_db_stats_cache(cache_key)
     if payload_str:
@@ -146,16 +176,21 @@ def get_cached(cache_key: str) -> Optional[Any]:
     return None
 
 
-def store_cached(cache_key: str, value: Any) -> None:
+def store_cached(cache_key: str, value: Any, persistent: bool = True) -> None:
     """Store a value in both the memory cache and the DB cache.
 
     Args:
         cache_key: Cache key string.
         value: JSON-serializable Python object.
+        persistent: Also write the DB cache. Pass False for filtered
+            (custom exclude) results, whose key space is unbounded.
     """
     # Level 1: in-memory
     _MEMORY_CACHE[cache_key] = value
 
+    if not persistent:
+        return
+
     # Level 2: DB cache
     try:
         payload_str = json.dumps(value, default=str)
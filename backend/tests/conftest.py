@@ -7,7 +7,9 @@ Shared test fixtures for the NextDNS Optimized Analytics backend tests.
 
 import os
 import sys
+import time
 from datetime import datetime, timezone, timedelta
+from types import SimpleNamespace
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -17,7 +19,16 @@ from sqlalchemy.pool import StaticPool
 # Add backend directory to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from models import Base, DNSLog  # pylint: disable=wrong-import-position
+from models import (  # pylint: disable=wrong-import-position
+    Base,
+    DNSLog,
+    invalidate_active_profiles_cache,
+    invalidate_database_health_cache,
+    invalidate_logs_stats_cache,
+    invalidate_row_estimate_cache,
+    invalidate_settings_cache,
+)
+from stats_cache import invalidate_memory_cache  # pylint: disable=wrong-import-position
 
 
 @pytest.fixture(scope="function")
@@ -168,6 +179,34 @@ def populated_test_db(test_db):
     yield test_db
 
 
+@pytest.fixture
+def fake_session(monkeypatch):
+    """
+    Replace models.session_factory with a scripted stub session.
+
+    Returns its state: ``result`` is the row value execute() yields,
+    ``delay`` stalls each execute(), ``error`` is raised instead of
+    returning, and ``calls`` records every execute().
+    """
+    state = SimpleNamespace(calls=[], result=None, delay=0, error=None)
+
+    class FakeSession:
+        """Session stub driven by the fixture state."""
+
+        def execute(self, _sql):
+            state.calls.append(1)
+            time.sleep(state.delay)
+            if state.error is not None:
+                raise state.error
+            return SimpleNamespace(fetchone=lambda: (state.result,))
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr("models.session_factory", FakeSession)
+    return state
+
+
 @pytest.fixture
 def api_key():
     """
@@ -209,3 +248,28 @@ def mock_env_vars(monkeypatch):
     monkeypatch.setenv("POSTGRES_PORT", "5432")
     monkeypatch.setenv("POSTGRES_DB", "test_db")
     monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+
+
+# In-process caches whose keys don't include the database: a result cached
+# by one test would otherwise be served to the next.
+_PROCESS_CACHE_INVALIDATORS = (
+    invalidate_logs_stats_cache,
+    invalidate_row_estimate_cache,
+    invalidate_database_health_cache,
+    invalidate_active_profiles_cache,
+    invalidate_memory_cache,
+    invalidate_settings_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_process_caches():
+    """
+    Reset the in-process /logs/stats, /stats/*, row-estimate, DB-health,
+    active-profile and settings caches around every test.
+    """
+    for invalidate in _PROCESS_CACHE_INVALIDATORS:
+        invalidate()
+    yield
+    for invalidate in _PROCESS_CACHE_INVALIDATORS:
+        invalidate()
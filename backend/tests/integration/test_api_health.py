@@ -54,3 +54,122 @@ class TestHealthEndpoints:
             assert "status_db" in data
             assert data["status_api"] == "healthy"
             assert data["healthy"] is True
+
+    def test_backend_stack_is_built_once(self, monkeypatch):
+        """Platform/CPU details are read once per process, not per request."""
+        import main  # pylint: disable=import-outside-toplevel
+
+        calls = []
+        monkeypatch.setattr(
+            main.platform, "system", lambda: calls.append("system") or "Linux"
+        )
+        main._create_backend_stack.cache_clear()  # pylint: disable=protected-access
+        try:
+            first = main._create_backend_stack()  # pylint: disable=protected-access
+            second = main._create_backend_stack()  # pylint: disable=protected-access
+        finally:
+            main._create_backend_stack.cache_clear()  # pylint: disable=protected-access
+
+        assert first is second
+        assert calls == ["system"]
+
+    def test_backend_resources_sample_cpu_without_blocking(self, monkeypatch):
+        """CPU usage is read with interval=None so the handler never sleeps."""
+        import main  # pylint: disable=import-outside-toplevel
+
+        intervals = []
+
+        def fake_cpu_percent(interval=None):
+            intervals.append(interval)
+            return 12.5
+
+        monkeypatch.setattr(
+            main,
+            "_system_usage_cache",
+            {"cpu": 0.0, "memory": None, "disk": None, "sampled_at": 0.0},
+        )
+        monkeypatch.setattr(main.psutil, "cpu_percent", fake_cpu_percent)
+        resources = main._create_backend_resources(  # pylint: disable=protected-access
+            uptime_seconds=1.0
+        )
+
+        assert resources.cpu_percent == 12.5
+        assert intervals == [None]
+
+    def test_health_probes_check_database_off_the_event_loop(
+        self, test_client, monkeypatch
+    ):
+        """/ and /health run their blocking SELECT 1 in a worker thread."""
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        import main  # pylint: disable=import-outside-toplevel
+
+        loop_running = []
+
+        def fake_check_database_health():
+            try:
+                asyncio.get_running_loop()
+                loop_running.append(True)
+            except RuntimeError:
+                loop_running.append(False)
+            return True
+
+        monkeypatch.setattr(main, "check_database_health", fake_check_database_health)
+
+        assert test_client.get("/").status_code == 200
+        assert test_client.get("/health").status_code == 200
+        assert loop_running == [False, False]
+
+    def test_system_samples_are_reused_within_ttl(self, monkeypatch):
+        """Back-to-back health checks share one CPU/memory/disk sample."""
+        import main  # pylint: disable=import-outside-toplevel
+
+        samples = []
+        real_virtual_memory = main.psutil.virtual_memory
+
+        def fake_virtual_memory():
+            samples.append("memory")
+            return real_virtual_memory()
+
+        monkeypatch.setattr(
+            main,
+            "_system_usage_cache",
+            {"cpu": 0.0, "memory": None, "disk": None, "sampled_at": 0.0},
+        )
+        monkeypatch.setattr(
+            main.psutil, "cpu_percent", lambda interval=None: samples.append("cpu")
+        )
+        monkeypatch.setattr(main.psutil, "virtual_memory", fake_virtual_memory)
+        main._sample_system_usage()  # pylint: disable=protected-access
+        main._sample_system_usage()  # pylint: disable=protected-access
+
+        assert samples == ["cpu", "memory"]
+
+    def test_detailed_health_runs_probes_concurrently(self, test_client, monkeypatch):
+        """The four blocking probes overlap instead of running back to back."""
+        import threading  # pylint: disable=import-outside-toplevel
+
+        import main  # pylint: disable=import-outside-toplevel
+
+        # Each probe waits until all four are running; sequential execution
+        # would time out the barrier and fail the request.
+        barrier = threading.Barrier(4, timeout=5)
+        # pylint: disable-next=protected-access
+        real_resources = main._create_backend_resources
+
+        def probe(result):
+            def _probe(*args):
+                barrier.wait()
+                return result(*args) if callable(result) else result
+
+            return _probe
+
+        monkeypatch.setattr(main, "check_database_health", probe(True))
+        monkeypatch.setattr(main, "get_total_record_count", probe(7))
+        monkeypatch.setattr(main, "_create_backend_resources", probe(real_resources))
+        monkeypatch.setattr(main, "_get_database_metrics", probe(None))
+
+        response = test_client.get("/health/detailed")
+
+        assert response.status_code == 200
+        assert response.json()["total_dns_records"] == 7
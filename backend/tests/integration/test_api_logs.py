@@ -155,6 +155,115 @@ def test_get_logs_with_exclude_domains(test_client, populated_test_db, monkeypat
     assert isinstance(data["excluded_domains"], list)
 
 
+@pytest.mark.integration
+def test_get_logs_body_matches_response_model(test_client, monkeypatch):
+    """Test GET /logs bytes still satisfy LogsResponse and stay documented."""
+    import main
+
+    monkeypatch.setenv("AUTH_ENABLED", "false")
+    monkeypatch.setattr(main, "get_logs", lambda **_kwargs: _sample_logs_page())
+
+    response = test_client.get("/logs?exclude=ads.example.com")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/json"
+    body = main.LogsResponse.model_validate_json(response.content)
+    assert body.returned_records == 1
+    assert body.data[0].device == {"id": "d1", "name": "Phone"}
+    assert body.excluded_domains == ["ads.example.com"]
+
+    schema = test_client.get("/openapi.json").json()
+    ok = schema["paths"]["/logs"]["get"]["responses"]["200"]
+    assert ok["content"]["application/json"]["schema"]["$ref"].endswith("/LogsResponse")
+
+
+def _sample_logs_page():
+    """One row in the shape models.get_logs() returns."""
+    return (
+        [
+            {
+                "id": 1,
+                "timestamp": "2026-10-16T10:00:00+00:00",
+                "domain": "www.example.com",
+                "action": "allowed",
+                "device": {"id": "d1", "name": "Phone"},
+                "client_ip": "192.168.1.10",
+                "query_type": "A",
+                "blocked": False,
+                "profile_id": "test",
+                "data": None,
+                "created_at": "2026-10-16T10:00:01+00:00",
+            }
+        ],
+        1,
+    )
+
+
+@pytest.mark.integration
+def test_logs_endpoints_query_off_the_event_loop(test_client, monkeypatch):
+    """Test GET /logs and /logs/stats run their DB calls in a worker thread."""
+    import asyncio
+
+    import main
+
+    monkeypatch.setenv("AUTH_ENABLED", "false")
+    loop_running = []
+
+    def _in_event_loop():
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
+
+    def fake_get_logs(**_kwargs):
+        loop_running.append(_in_event_loop())
+        return [], 0
+
+    def fake_get_logs_stats(**kwargs):
+        loop_running.append(_in_event_loop())
+        return {
+            "total": 0,
+            "blocked": 0,
+            "allowed": 0,
+            "blocked_percentage": 0,
+            "allowed_percentage": 0,
+            "profile_id": kwargs["profile_filter"],
+        }
+
+    monkeypatch.setattr(main, "get_logs", fake_get_logs)
+    monkeypatch.setattr(main, "get_logs_stats", fake_get_logs_stats)
+
+    assert test_client.get("/logs").status_code == status.HTTP_200_OK
+    assert test_client.get("/logs/stats").status_code == status.HTTP_200_OK
+    assert loop_running == [False, False]
+
+
+@pytest.mark.integration
+def test_stream_logs_returns_ndjson(test_client, populated_test_db, monkeypatch):
+    """Test GET /logs/stream writes one JSON log per line, newest first."""
+    import json
+
+    import models
+
+    monkeypatch.setenv("AUTH_ENABLED", "false")
+    monkeypatch.setattr(models, "session_factory", lambda: populated_test_db)
+
+    response = test_client.get("/logs/stream?status_filter=blocked&limit=3")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["domain"] for row in rows] == [
+        "test9.example.com",
+        "test7.example.com",
+        "test5.example.com",
+    ]
+    assert all(row["blocked"] for row in rows)
+    assert rows[0]["device"] == {"name": "Test Device", "id": "device-123"}
+    assert rows[0]["data"] is None
+
+
 @pytest.mark.integration
 def test_get_logs_stats_basic(test_client, populated_test_db, monkeypatch):
     """Test GET /logs/stats returns statistics."""
@@ -56,7 +56,7 @@ class TestApiKeyEndpoints:
 
     def test_put_api_key_invalid_key(self, test_client):
         """Rejects a key that NextDNS API refuses."""
-        with patch("main._validate_nextdns_api_key", return_value=False):
+        with patch("main.validate_api_key", return_value=False):
             response = test_client.put(
                 "/settings/nextdns/api-key",
                 json={"api_key": "bad-key"},
@@ -67,7 +67,7 @@ class TestApiKeyEndpoints:
     def test_put_api_key_valid_key(self, test_client):
         """Accepts and persists a valid key."""
         with (
-            patch("main._validate_nextdns_api_key", return_value=True),
+            patch("main.validate_api_key", return_value=True),
             patch("main.set_nextdns_api_key", return_value=True),
         ):
             response = test_client.put(
@@ -83,7 +83,7 @@ class TestApiKeyEndpoints:
     def test_put_api_key_db_failure(self, test_client):
         """Returns 500 when DB write fails."""
         with (
-            patch("main._validate_nextdns_api_key", return_value=True),
+            patch("main.validate_api_key", return_value=True),
             patch("main.set_nextdns_api_key", return_value=False),
         ):
             response = test_client.put(
@@ -314,3 +314,30 @@ class TestProfileSettingsEndpoints:
             403,
             404,
         ]
+
+
+class TestSystemSettingsEndpoints:
+    """Test PUT /settings/system."""
+
+    def test_fetch_interval_reschedules_running_scheduler(self, test_client):
+        """A new fetch interval is applied to the scheduler held on app.state."""
+        running = MagicMock()
+        test_client.app.state.scheduler = running
+        try:
+            with (
+                patch("main.set_fetch_interval") as mock_set,
+                patch("main.get_fetch_interval", return_value=15),
+            ):
+                response = test_client.put(
+                    "/settings/system",
+                    json={"fetch_interval": 15},
+                    headers={"X-API-Key": "test-api-key-123"},
+                )
+        finally:
+            test_client.app.state.scheduler = None
+
+        assert response.status_code == 200
+        mock_set.assert_called_once_with(15)
+        running.reschedule_job.assert_called_once_with(
+            "fetch_logs", trigger="interval", minutes=15
+        )
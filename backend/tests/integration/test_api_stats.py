@@ -224,3 +224,114 @@ def test_get_stats_endpoint(test_client, populated_test_db, monkeypatch):
     assert "message" in data
     assert isinstance(data["total_records"], int)
     assert isinstance(data["message"], str)
+
+
+@pytest.mark.integration
+def test_custom_limit_stats_are_cached_in_memory_only(
+    test_client, populated_test_db, monkeypatch
+):
+    """Non-default limits are served from memory and never written to the DB cache."""
+    monkeypatch.setenv("AUTH_ENABLED", "false")
+
+    import main
+    from fastapi.testclient import TestClient
+
+    client = TestClient(main.app)
+    calls = []
+    real_top_domains = main.get_db_top_domains
+
+    def counting_top_domains(**kwargs):
+        calls.append(kwargs["limit"])
+        return real_top_domains(**kwargs)
+
+    monkeypatch.setattr(main, "get_db_top_domains", counting_top_domains)
+    monkeypatch.setattr(
+        "stats_cache.upsert_db_stats_cache",
+        lambda *_a: pytest.fail("custom limit written to the DB cache"),
+    )
+    first = client.get("/stats/domains?limit=5")
+    second = client.get("/stats/domains?limit=5")
+
+    assert first.status_code == status.HTTP_200_OK
+    assert second.json() == first.json()
+    assert calls == [5]
+
+
+@pytest.mark.integration
+def test_profile_grouped_timeseries_is_cached(
+    test_client, populated_test_db, monkeypatch
+):
+    """group_by=profile results are reused instead of re-aggregated."""
+    monkeypatch.setenv("AUTH_ENABLED", "false")
+
+    import main
+    from fastapi.testclient import TestClient
+
+    client = TestClient(main.app)
+    calls = []
+    real_timeseries = main.get_db_stats_timeseries
+
+    def counting_timeseries(**kwargs):
+        calls.append(kwargs["group_by"])
+        return real_timeseries(**kwargs)
+
+    monkeypatch.setattr(main, "get_db_stats_timeseries", counting_timeseries)
+    first = client.get("/stats/timeseries?group_by=profile")
+    second = client.get("/stats/timeseries?group_by=profile")
+
+    assert first.status_code == status.HTTP_200_OK
+    assert second.json() == first.json()
+    assert calls == ["profile"]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_concurrent_identical_stats_misses_share_one_run(monkeypatch):
+    """Requests that miss the cache together run the aggregation once."""
+    import asyncio
+    import threading
+
+    import main
+
+    calls = []
+    release = threading.Event()
+
+    def slow_overview(**kwargs):
+        calls.append(kwargs)
+        release.wait(timeout=5)
+        return {"total_queries": 1}
+
+    monkeypatch.setattr(main, "store_cached", lambda *_a, **_kw: None)
+    waiters = [
+        asyncio.ensure_future(
+            main._compute_stat_once(
+                "overview:test", False, slow_overview, time_range="24h"
+            )
+        )
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.05)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert results == [{"total_queries": 1}] * 3
+    assert calls == [{"time_range": "24h"}]
+    assert "overview:test" not in main._STATS_INFLIGHT
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_stats_misses_run_on_the_database_executor(monkeypatch):
+    """DB work uses the dedicated pool, not the default executor."""
+    import threading
+
+    import main
+
+    monkeypatch.setattr(main, "store_cached", lambda *_a, **_kw: None)
+
+    def thread_name(**_kwargs):
+        return threading.current_thread().name
+
+    name = await main._compute_stat_once("overview:thread", False, thread_name)
+
+    assert name.startswith("db-worker")
@@ -163,6 +163,38 @@ def test_authenticate_user_invalid_password(monkeypatch):
     assert result is False
 
 
+@pytest.mark.unit
+def test_authenticate_user_compares_in_constant_time(monkeypatch):
+    """Plain-text credentials are compared as SHA-256 digests in constant time."""
+    monkeypatch.setenv("AUTH_USERNAME", "testuser")
+    monkeypatch.setenv("AUTH_PASSWORD", "pässword")
+
+    import hashlib
+    import hmac
+    import importlib
+    import auth
+
+    importlib.reload(auth)
+    calls = []
+    real_compare = hmac.compare_digest
+
+    def spy(a, b):
+        calls.append((a, b))
+        return real_compare(a, b)
+
+    monkeypatch.setattr(auth.hmac, "compare_digest", spy)
+
+    assert auth.authenticate_user("testuser", "pässword") is True
+    assert auth.authenticate_user("testuser", "pässword-but-longer") is False
+    user_digest = hashlib.sha256(b"testuser").digest()
+    password_digest = hashlib.sha256("pässword".encode()).digest()
+    assert calls[:2] == [
+        (user_digest, user_digest),
+        (password_digest, password_digest),
+    ]
+    assert all(len(a) == len(b) == 32 for a, b in calls)
+
+
 @pytest.mark.unit
 @pytest.mark.skip(reason="bcrypt/passlib compatibility issue with Python 3.14")
 def test_authenticate_user_with_hashed_password(monkeypatch):
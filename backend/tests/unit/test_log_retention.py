@@ -2,6 +2,7 @@
 """Unit tests for the log retention setting + nightly cleanup."""
 
 from datetime import datetime, timezone, timedelta
+from unittest.mock import patch
 
 import pytest
 
@@ -124,3 +125,37 @@ class TestDeleteLogsOlderThan:
 
         assert deleted == 0
         assert test_db.query(DNSLog).count() == 1
+
+
+# ---------------------------------------------------------------------------
+# retention_cleanup_job()
+# ---------------------------------------------------------------------------
+
+
+class TestRetentionCleanupJob:
+    """The nightly job keeps the stats views in step with deleted rows."""
+
+    def test_refreshes_stats_views_after_deleting_rows(self):
+        """Deleted rows stay counted in the stats views until they are refreshed."""
+        from scheduler import retention_cleanup_job
+
+        with (
+            patch("models.get_retention_days", return_value=30),
+            patch("models.delete_logs_older_than", return_value=5),
+            patch("models.refresh_hourly_stats_view") as refresh,
+        ):
+            retention_cleanup_job()
+
+        refresh.assert_called_once_with()
+
+    def test_skips_refresh_when_nothing_was_deleted(self):
+        from scheduler import retention_cleanup_job
+
+        with (
+            patch("models.get_retention_days", return_value=30),
+            patch("models.delete_logs_older_than", return_value=0),
+            patch("models.refresh_hourly_stats_view") as refresh,
+        ):
+            retention_cleanup_job()
+
+        refresh.assert_not_called()
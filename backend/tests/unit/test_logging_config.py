@@ -0,0 +1,74 @@
+# file: backend/tests/unit/test_logging_config.py
+"""Unit tests for logging_config: JSON formatter and runtime level changes."""
+
+import io
+import json
+import logging
+import logging.handlers
+import queue
+
+import pytest
+
+import logging_config
+from logging_config import JsonFormatter, apply_log_level
+
+pytestmark = pytest.mark.unit
+
+
+def test_json_formatter_emits_message_and_extra_fields():
+    """Deferred %-args are rendered and extra= keys become top-level fields."""
+    record = logging.makeLogRecord(
+        {
+            "name": "main",
+            "levelno": logging.INFO,
+            "levelname": "INFO",
+            "msg": "📊 Fetch limit updated to %d",
+            "args": (500,),
+            "fetch_limit": 500,
+        }
+    )
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "main"
+    assert entry["msg"] == "📊 Fetch limit updated to 500"
+    assert entry["fetch_limit"] == 500
+    assert "args" not in entry and "levelno" not in entry
+
+
+def test_queued_exception_keeps_json_exc_info_field():
+    """Records cross the queue unformatted, so the traceback gets its own field."""
+    log_queue = queue.SimpleQueue()
+    stream = io.StringIO()
+    console = logging.StreamHandler(stream)
+    console.setFormatter(JsonFormatter())
+    listener = logging.handlers.QueueListener(log_queue, console)
+    logger = logging.getLogger("test_logging_config.queued")
+    logger.propagate = False
+    # pylint: disable-next=protected-access
+    logger.addHandler(logging_config._RecordQueueHandler(log_queue))
+    listener.start()
+    try:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("❌ Failed for %s", "p1")
+    finally:
+        listener.stop()
+        logger.handlers.clear()
+
+    entry = json.loads(stream.getvalue())
+    assert entry["msg"] == "❌ Failed for p1"
+    assert "ValueError: boom" in entry["exc_info"]
+
+
+def test_apply_log_level_aligns_third_party_loggers():
+    """Runtime level changes reach uvicorn and cap noisy libraries at WARNING."""
+    previous = logging.getLevelName(logging.getLogger().level)
+    try:
+        apply_log_level("error")
+        assert logging.getLogger("uvicorn.access").level == logging.ERROR
+        assert logging.getLogger("urllib3").level == logging.WARNING
+    finally:
+        apply_log_level(previous)
@@ -103,6 +103,34 @@ def test_cors_single_origin(monkeypatch):
             del sys.modules["main"]
 
 
+@pytest.mark.unit
+def test_cors_origins_are_trimmed(monkeypatch):
+    """
+    Test that spaces and empty entries in ALLOWED_ORIGINS are dropped.
+    """
+    # Remove main module if already imported
+    if "main" in sys.modules:
+        del sys.modules["main"]
+
+    monkeypatch.setenv(
+        "ALLOWED_ORIGINS", " https://a.example.com, https://b.example.com,,"
+    )
+    monkeypatch.setenv("LOCAL_API_KEY", "test-key-123")
+    monkeypatch.setenv("AUTH_SECRET_KEY", "test-secret-key-for-testing")
+
+    try:
+        import main
+
+        assert main.ALLOWED_ORIGINS == [
+            "https://a.example.com",
+            "https://b.example.com",
+        ]
+    finally:
+        # Clean up
+        if "main" in sys.modules:
+            del sys.modules["main"]
+
+
 @pytest.mark.unit
 def test_cors_no_wildcard_allowed(monkeypatch):
     """
@@ -6,8 +6,18 @@ Testing our LEGO data blocks - ensuring each piece works perfectly!
 """
 
 from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
 import pytest
-from models import extract_tld, DNSLog, FetchStatus
+import models
+from models import (
+    extract_tld,
+    add_logs_bulk,
+    get_last_fetch_timestamp,
+    update_fetch_status,
+    DNSLog,
+    FetchStatus,
+)
 
 # Mark all tests in this module as unit tests
 pytestmark = pytest.mark.unit
@@ -154,3 +164,105 @@ class TestFetchStatusModel:
         )
         assert retrieved.records_fetched == 0  # Default value
         assert retrieved.last_successful_fetch is not None
+
+    def test_update_fetch_status_upserts(self, test_db, monkeypatch):
+        """First call creates the row; later calls advance it in place."""
+        monkeypatch.setattr(models, "session_factory", lambda: test_db)
+        first = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
+        second = datetime(2026, 1, 1, 11, 0, tzinfo=timezone.utc)
+
+        assert update_fetch_status("p1", first, 10) is True
+        assert update_fetch_status("p1", second, 5) is True
+
+        rows = test_db.query(FetchStatus).filter_by(profile_id="p1").all()
+        assert len(rows) == 1
+        assert rows[0].records_fetched == 15
+        assert get_last_fetch_timestamp("p1").replace(tzinfo=None) == datetime(
+            2026, 1, 1, 11, 0
+        )
+
+
+class TestAddLogsBulk:
+    """Test batched ingestion of NextDNS log entries."""
+
+    @staticmethod
+    def _log(domain, timestamp, client_ip="10.0.0.1", **extra):
+        log = {
+            "timestamp": timestamp,
+            "domain": domain,
+            "status": "default",
+            "clientIp": client_ip,
+            "device": {"id": "d1", "name": "Alice iPhone"},
+            "profile_id": "p1",
+        }
+        log.update(extra)
+        return log
+
+    def test_inserts_batch_and_derives_columns(self, test_db, monkeypatch):
+        """All rows are inserted with tld/device_name/blocked derived."""
+        monkeypatch.setattr(models, "session_factory", lambda: test_db)
+        logs = [
+            self._log("api.example.com", "2026-01-01T10:00:00.000Z"),
+            self._log("ads.tracker.net", "2026-01-01T10:05:00.000Z", status="blocked"),
+        ]
+
+        inserted, skipped, latest = add_logs_bulk(logs)
+
+        assert (inserted, skipped) == (2, 0)
+        assert latest.replace(tzinfo=None) == datetime(2026, 1, 1, 10, 5)
+        blocked_row = test_db.query(DNSLog).filter_by(domain="ads.tracker.net").one()
+        assert blocked_row.blocked is True
+        assert blocked_row.tld == "tracker.net"
+        assert blocked_row.device_name == "Alice iPhone"
+        assert blocked_row.created_at is not None
+
+    def test_skips_duplicates(self, test_db, monkeypatch):
+        """Rows matching the unique constraint are skipped, not re-inserted."""
+        monkeypatch.setattr(models, "session_factory", lambda: test_db)
+        first = self._log("example.com", "2026-01-01T10:00:00.000Z")
+        add_logs_bulk([first])
+
+        inserted, skipped, latest = add_logs_bulk(
+            [
+                self._log("example.com", "2026-01-01T10:00:00.000Z"),
+                self._log("example.com", "2026-01-01T11:00:00.000Z"),
+            ]
+        )
+
+        assert (inserted, skipped) == (1, 1)
+        assert latest.replace(tzinfo=None) == datetime(2026, 1, 1, 11, 0)
+        assert test_db.query(DNSLog).count() == 2
+
+    def test_skips_duplicates_without_client_ip(self, test_db, monkeypatch):
+        """NULL client IPs don't trip the unique constraint, so match them here."""
+        monkeypatch.setattr(models, "session_factory", lambda: test_db)
+        log = self._log("example.com", "2026-01-01T10:00:00.000Z", client_ip=None)
+
+        assert add_logs_bulk([log, dict(log)])[:2] == (1, 1)
+        inserted, skipped, latest = add_logs_bulk([dict(log)])
+
+        assert (inserted, skipped, latest) == (0, 1, None)
+        assert test_db.query(DNSLog).count() == 1
+
+    def test_empty_batch(self):
+        """An empty batch is a no-op."""
+        assert add_logs_bulk([]) == (0, 0, None)
+
+    def test_copy_value_escapes_text_format(self):
+        """COPY text-format special characters are escaped."""
+        assert models._copy_value(None) == "\\N"
+        assert models._copy_value(True) == "t"
+        assert models._copy_value("a\tb\nc\\d") == "a\\tb\\nc\\\\d"
+
+    def test_copy_ingest_uses_async_commit_and_ordered_insert(self):
+        """The PostgreSQL path relaxes commit durability for its own transaction."""
+        session = MagicMock()
+        session.execute.return_value = iter([(datetime(2026, 1, 1),)])
+        row = models._build_log_row(self._log("a.com", "2026-01-01T10:00:00Z"))
+
+        inserted = models._copy_insert_rows(session, [row])
+
+        statements = [str(c.args[0]) for c in session.execute.call_args_list]
+        assert statements[0] == "SET LOCAL synchronous_commit = off"
+        assert "ORDER BY timestamp ON CONFLICT DO NOTHING" in statements[-1]
+        assert inserted == [datetime(2026, 1, 1)]
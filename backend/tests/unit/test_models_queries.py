@@ -5,12 +5,15 @@ Unit tests for database query functions in models.py.
 Tests complex query functions like get_logs, get_stats_overview, etc.
 """
 
-from datetime import datetime, timezone
+import threading
+from datetime import datetime, timedelta, timezone
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import IntegrityError
 
-from models import DNSLog, extract_tld
+import models
+from models import DNSLog, extract_tld, get_logs
 
 
 # Additional extract_tld tests focusing on query-specific scenarios
@@ -164,3 +167,470 @@ def test_dns_log_query_types(test_db):
         retrieved = test_db.query(DNSLog).filter_by(query_type=qtype).first()
         assert retrieved is not None
         assert retrieved.query_type == qtype
+
+
+def _add_log_with_payload(test_db):
+    """Insert one log carrying a raw NextDNS payload."""
+    test_db.add(
+        DNSLog(
+            timestamp=datetime.now(timezone.utc),
+            domain="payload.example.com",
+            action="allowed",
+            client_ip="192.168.1.1",
+            blocked=False,
+            profile_id="test",
+            data='{"domain": "payload.example.com", "status": "default"}',
+        )
+    )
+    test_db.commit()
+
+
+def test_get_logs_omits_raw_payload_by_default(test_db, monkeypatch):
+    """The raw ``data`` column is not loaded unless explicitly requested."""
+    monkeypatch.setattr(models, "session_factory", lambda: test_db)
+    _add_log_with_payload(test_db)
+
+    rows, _ = get_logs(time_range="all", search_query="payload")
+
+    assert len(rows) == 1
+    assert rows[0]["data"] is None
+
+
+def test_get_logs_include_data_returns_raw_payload(test_db, monkeypatch):
+    """``include_data=True`` returns the parsed NextDNS payload."""
+    monkeypatch.setattr(models, "session_factory", lambda: test_db)
+    _add_log_with_payload(test_db)
+
+    rows, _ = get_logs(time_range="all", search_query="payload", include_data=True)
+
+    assert rows[0]["data"] == {"domain": "payload.example.com", "status": "default"}
+
+
+def test_get_logs_decodes_repeated_device_json_once(test_db, monkeypatch):
+    """Identical device strings are decoded once and returned as copies."""
+    monkeypatch.setattr(models, "session_factory", lambda: test_db)
+    now = datetime.now(timezone.utc)
+    for i in range(3):
+        test_db.add(
+            DNSLog(
+                timestamp=now - timedelta(seconds=i),
+                domain=f"device{i}.example.com",
+                action="allowed",
+                device='{"name": "Shared iPad", "id": "ipad-1"}',
+                client_ip="192.168.1.1",
+                blocked=False,
+                profile_id="test",
+                data="{}",
+            )
+        )
+    test_db.commit()
+    models._decode_device_json.cache_clear()
+
+    rows, _ = get_logs(time_range="all", search_query="device")
+
+    assert [row["device"]["name"] for row in rows] == ["Shared iPad"] * 3
+    assert models._decode_device_json.cache_info().misses == 1
+    rows[0]["device"]["name"] = "mutated"
+    assert rows[1]["device"]["name"] == "Shared iPad"
+
+
+def _add_blocked_and_allowed(test_db):
+    """Insert one blocked and one allowed log for profile 'test'."""
+    now = datetime.now(timezone.utc)
+    for i, blocked in enumerate((True, False)):
+        test_db.add(
+            DNSLog(
+                timestamp=now - timedelta(seconds=i),
+                domain=f"stats{i}.example.com",
+                action="blocked" if blocked else "allowed",
+                client_ip="192.168.1.1",
+                blocked=blocked,
+                profile_id="test",
+                data="{}",
+            )
+        )
+    test_db.commit()
+
+
+def test_get_logs_stats_counts_blocked_rows(test_db, monkeypatch):
+    """Blocked rows are counted with a real SQL predicate."""
+    monkeypatch.setattr(models, "session_factory", lambda: test_db)
+    _add_blocked_and_allowed(test_db)
+
+    stats = models.get_logs_stats()
+
+    assert stats["total"] == 2
+    assert stats["blocked"] == 1
+    assert stats["allowed"] == 1
+
+
+def test_get_logs_stats_is_cached_until_invalidated(test_db, monkeypatch):
+    """Repeat calls are served from cache; invalidation forces a recount."""
+    monkeypatch.setattr(models, "session_factory", lambda: test_db)
+    _add_blocked_and_allowed(test_db)
+    first = models.get_logs_stats(profile_filter="test", time_range="24h")
+
+    _add_blocked_and_allowed(test_db)
+    assert models.get_logs_stats(profile_filter="test", time_range="24h") == first
+
+    models.invalidate_logs_stats_cache()
+    assert models.get_logs_stats(profile_filter="test", time_range="24h")["total"] == 4
+
+
+def test_get_logs_stats_with_exclusions_is_not_cached(test_db, monkeypatch):
+    """Requests with custom exclusions always run live."""
+    monkeypatch.setattr(models, "session_factory", lambda: test_db)
+    _add_blocked_and_allowed(test_db)
+    models.get_logs_stats(exclude_domains=["other.com"])
+
+    _add_blocked_and_allowed(test_db)
+
+    assert models.get_logs_stats(exclude_domains=["other.com"])["total"] == 4
+
+
+@pytest.mark.unit
+def test_time_range_filter_is_sargable_inequality():
+    """Time ranges compile to a bare ``timestamp >= :cutoff`` on the column."""
+    now = datetime(2026, 1, 8, 12, 0, tzinfo=timezone.utc)
+
+    predicate = models._time_range_filter("7d", now=now)
+    sql = str(predicate.compile(dialect=postgresql.dialect()))
+
+    assert sql == "dns_logs.timestamp >= %(timestamp_1)s"
+    assert predicate.right.value == now - timedelta(days=7)
+    assert predicate.right.value.tzinfo is not None
+
+
+@pytest.mark.unit
+def test_time_range_filter_all_is_unbounded():
+    """'all' and unknown ranges produce no predicate."""
+    assert models._time_range_filter("all") is None
+    assert models._time_range_filter("bogus") is None
+
+
+def test_lower_stats_view_watermark_moves_back_to_day_start(test_db, monkeypatch):
+    """Late logs pull the watermark back to their UTC day; newer ones don't."""
+    monkeypatch.setattr(models, "session_factory", lambda: test_db)
+    watermark = datetime(2026, 10, 16, tzinfo=timezone.utc)
+    models.set_setting(models.HOURLY_STATS_VIEW_SETTING, watermark.isoformat())
+
+    assert models.lower_stats_view_watermark(watermark + timedelta(hours=3)) is False
+    assert models.lower_stats_view_watermark(
+        datetime(2026, 10, 14, 22, 30, tzinfo=timezone.utc)
+    )
+    assert models.get_setting(models.HOURLY_STATS_VIEW_SETTING) == (
+        datetime(2026, 10, 14, tzinfo=timezone.utc).isoformat()
+    )
+
+
+def test_lower_stats_view_watermark_without_views_is_noop(test_db, monkeypatch):
+    """No watermark stored means no views to correct."""
+    monkeypatch.setattr(models, "session_factory", lambda: test_db)
+    assert not models.lower_stats_view_watermark(datetime.now(timezone.utc))
+    assert models.get_setting(models.HOURLY_STATS_VIEW_SETTING) is None
+
+
+def test_timeseries_reads_completed_days_from_hourly_view(test_db, monkeypatch):
+    """Days before the view watermark come from the view, the rest from dns_logs."""
+    monkeypatch.setattr(models, "session_factory", lambda: test_db)
+    today_start = datetime.now(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    monkeypatch.setattr(
+        models, "_hourly_stats_view_watermark", lambda session: today_start
+    )
+    monkeypatch.setattr(
+        models,
+        "_hourly_stats_view_totals",
+        lambda *args: {5: [10, 4]},
+    )
+    for ts, domain in (
+        (today_start - timedelta(hours=1), "yesterday.example.com"),
+        (datetime.now(timezone.utc), "today.example.com"),
+    ):
+        test_db.add(
+            DNSLog(
+                timestamp=ts,
+                domain=domain,
+                action="blocked",
+                client_ip="192.168.1.1",
+                blocked=True,
+                profile_id="test",
+                data="{}",
+            )
+        )
+    test_db.commit()
+
+    points = models.get_stats_timeseries(time_range="7d")
+
+    assert len(points) == 7
+    # Yesterday: the view's counts, the raw row is not double counted
+    assert points[5]["total_queries"] == 10
+    assert points[5]["blocked_queries"] == 4
+    assert points[5]["allowed_queries"] == 6
+    # Today: past the watermark, counted from dns_logs
+    assert points[6]["total_queries"] == 1
+    assert points[6]["blocked_queries"] == 1
+
+
+def test_timeseries_buckets_rows_in_one_grouped_query(test_db, monkeypatch):
+    """Hourly buckets get per-status and per-profile counts from one query."""
+    monkeypatch.setattr(models, "session_factory", lambda: test_db)
+    now = datetime.now(timezone.utc).replace(minute=35)
+    rows = (
+        (now - timedelta(minutes=10), True, "p1"),
+        (now - timedelta(minutes=20), False, "p2"),
+        (now - timedelta(hours=3, minutes=10), False, "p1"),
+        (now - timedelta(hours=30), True, "p1"),  # outside the 24h window
+    )
+    for i, (ts, blocked, profile_id) in enumerate(rows):
+        test_db.add(
+            DNSLog(
+                timestamp=ts,
+                domain=f"host{i}.example.com",
+                action="blocked" if blocked else "allowed",
+                client_ip="192.168.1.1",
+                blocked=blocked,
+                profile_id=profile_id,
+                data="{}",
+            )
+        )
+    test_db.commit()
+
+    points = models.get_stats_timeseries(time_range="24h", now=now)
+
+    assert len(points) == 24
+    assert sum(p["total_queries"] for p in points) == 3
+    assert points[-1]["total_queries"] == 2
+    assert points[-1]["blocked_queries"] == 1
+    assert points[-1]["allowed_queries"] == 1
+    assert points[-4]["total_queries"] == 1
+    assert points[-4]["blocked_queries"] == 0
+
+    result = models.get_stats_timeseries(time_range="24h", group_by="profile", now=now)
+
+    assert result["data"][-1]["profiles"] == {"p1": 1, "p2": 1}
+    assert result["data"][-4]["profiles"] == {"p1": 1}
+    assert sorted(result["available_profiles"]) == ["p1", "p2"]
+
+
+def test_timeseries_buckets_snap_to_clock_boundaries(test_db, monkeypatch):
+    """Sub-day buckets start on the boundary their label shows."""
+    monkeypatch.setattr(models, "session_factory", lambda: test_db)
+    now = datetime(2026, 3, 4, 14, 37, 12, tzinfo=timezone.utc)
+    test_db.add(
+        DNSLog(
+            timestamp=datetime(2026, 3, 4, 14, 31, tzinfo=timezone.utc),
+            domain="early.example.com",
+            action="allowed",
+            client_ip="192.168.1.1",
+            blocked=False,
+            profile_id="p1",
+            data="{}",
+        )
+    )
+    test_db.commit()
+
+    points = models.get_stats_timeseries(time_range="1h", now=now)
+
+    assert len(points) == 12
+    assert points[0]["timestamp"] == "2026-03-04T13:40:00+00:00"
+    assert points[-1]["timestamp"] == "2026-03-04T14:35:00+00:00"
+    assert points[-2]["total_queries"] == 1
+    assert points[-1]["total_queries"] == 0
+
+
+def test_top_domains_and_tlds_read_complete_days_from_domains_view(
+    test_db, monkeypatch
+):
+    """Whole days come from the view; the partial first day and today from dns_logs."""
+    monkeypatch.setattr(models, "session_factory", lambda: test_db)
+    now = datetime.now(timezone.utc)
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    monkeypatch.setattr(
+        models, "_hourly_stats_view_watermark", lambda session: today_start
+    )
+    models._DOMAINS_DAILY_VIEW.create(test_db.get_bind())
+    view_rows = (
+        (today_start - timedelta(days=2), "ads.tracker.com", "tracker.com", True, 7),
+        (today_start - timedelta(days=2), "www.example.com", "example.com", False, 5),
+        # Older than the 7d window: never read
+        (today_start - timedelta(days=9), "old.example.com", "example.com", False, 50),
+    )
+    test_db.execute(
+        models._DOMAINS_DAILY_VIEW.insert(),
+        [
+            {
+                "bucket": bucket,
+                "profile_id": "p1",
+                "domain": domain,
+                "tld": tld,
+                "blocked": blocked,
+                "query_count": count,
+            }
+            for bucket, domain, tld, blocked, count in view_rows
+        ],
+    )
+    raw_rows = (
+        # Already in the view: must not be counted twice
+        (today_start - timedelta(days=2), "www.example.com", "example.com", False),
+        # Partial first day of the window, before the view's range
+        (
+            now - timedelta(days=7) + timedelta(minutes=1),
+            "ads.tracker.com",
+            "tracker.com",
+            True,
+        ),
+        # Past the watermark
+        (now, "www.example.com", "example.com", False),
+    )
+    for i, (ts, domain, tld, blocked) in enumerate(raw_rows):
+        test_db.add(
+            DNSLog(
+                timestamp=ts,
+                domain=domain,
+                tld=tld,
+                action="blocked" if blocked else "allowed",
+                client_ip=f"192.168.1.{i}",
+                blocked=blocked,
+                profile_id="p1",
+                data="{}",
+            )
+        )
+    test_db.commit()
+
+    domains = models.get_top_domains(time_range="7d")
+
+    assert domains["blocked_domains"] == [
+        {"domain": "ads.tracker.com", "count": 8, "percentage": 57.1}
+    ]
+    assert domains["allowed_domains"] == [
+        {"domain": "www.example.com", "count": 6, "percentage": 42.9}
+    ]
+
+    tlds = models.get_stats_tlds(time_range="7d", exclude_domains=["*.tracker.com"])
+
+    assert tlds["blocked_tlds"] == []
+    assert tlds["allowed_tlds"] == [
+        {"domain": "example.com", "count": 6, "percentage": 100.0}
+    ]
+
+
+def test_blocked_filter_matches_partial_index_predicate(test_db):
+    """Status filters compile to literal ``blocked = true/false`` comparisons."""
+    for status_filter, expected in (
+        ("blocked", "dns_logs.blocked = true"),
+        ("allowed", "dns_logs.blocked = false"),
+    ):
+        query, _ = models._filtered_logs_query(test_db, status_filter=status_filter)
+        sql = str(query.statement.compile(dialect=postgresql.dialect()))
+        assert expected in sql
+
+
+@pytest.mark.unit
+def test_logs_query_shapes_share_compiled_cache_entries(test_db):
+    """Filter values are bound parameters, so repeat shapes reuse compiled SQL."""
+
+    def cache_key(**filters):
+        query, _ = models._filtered_logs_query(test_db, **filters)
+        return query.statement._generate_cache_key().key
+
+    assert cache_key(search_query="apple", profile_filter="p1") == cache_key(
+        search_query="google", profile_filter="p2"
+    )
+    assert cache_key(exclude_domains=["a.com"]) == cache_key(
+        exclude_domains=["b.com", "c.com"]
+    )
+    assert models.engine._compiled_cache.capacity == 1200
+
+
+def test_ranked_counts_shapes_rows_with_percentage():
+    """Ranked domain/TLD rows carry their share of the total, 0 when empty."""
+    rows = [("ads.example.com", 3), ("cdn.example.com", 1)]
+    assert models._ranked_counts(rows, 8) == [
+        {"domain": "ads.example.com", "count": 3, "percentage": 37.5},
+        {"domain": "cdn.example.com", "count": 1, "percentage": 12.5},
+    ]
+    assert models._ranked_counts(rows, 0)[0]["percentage"] == 0
+
+
+def test_filtered_logs_total_comes_with_the_page(test_db, monkeypatch):
+    """Filtered /logs totals use COUNT(*) OVER () on the page query."""
+    monkeypatch.setattr(models, "session_factory", lambda: test_db)
+    _add_blocked_and_allowed(test_db)
+
+    logs, total = get_logs(profile_filter="test", limit=1)
+    assert [log["domain"] for log in logs] == ["stats0.example.com"]
+    assert total == 2
+
+    # Past the last page there is no row to carry the count.
+    logs, total = get_logs(profile_filter="test", limit=1, offset=5)
+    assert logs == []
+    assert total == 2
+
+
+def test_iter_logs_reraises_mid_stream_errors(test_db, monkeypatch):
+    """A failure after some rows were yielded must not end the stream cleanly."""
+    from sqlalchemy.exc import OperationalError
+
+    monkeypatch.setattr(models, "session_factory", lambda: test_db)
+    _add_blocked_and_allowed(test_db)
+    to_dict = models._log_to_dict
+    seen = []
+
+    def failing_to_dict(log, include_data):
+        if seen:
+            raise OperationalError("FETCH", {}, Exception("connection lost"))
+        seen.append(log)
+        return to_dict(log, include_data)
+
+    monkeypatch.setattr(models, "_log_to_dict", failing_to_dict)
+    rows = models.iter_logs(profile_filter="test")
+
+    assert next(rows)["domain"] == "stats0.example.com"
+    with pytest.raises(OperationalError):
+        next(rows)
+
+
+def test_total_record_count_estimate_is_cached(fake_session):
+    """The reltuples estimate is read once per TTL window."""
+    fake_session.result = 1234
+
+    assert models.get_total_record_count() == 1234
+    assert models.get_total_record_count() == 1234
+    assert len(fake_session.calls) == 1
+
+
+def test_total_record_count_miss_queries_once_under_concurrency(fake_session):
+    """Concurrent cache misses share a single pg_class lookup."""
+    fake_session.result = 42
+    fake_session.delay = 0.05
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(models.get_total_record_count()))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [42] * 8
+    assert len(fake_session.calls) == 1
+    models.invalidate_row_estimate_cache()
+    assert models.get_total_record_count() == 42
+    assert len(fake_session.calls) == 2
+
+
+def test_database_health_caches_success_but_not_failure(fake_session):
+    """A successful ping is reused; a failed one is retried on the next probe."""
+    from sqlalchemy.exc import OperationalError
+
+    fake_session.error = OperationalError("SELECT 1", {}, Exception("down"))
+
+    with pytest.raises(OperationalError):
+        models.check_database_health()
+    fake_session.error = None
+    assert models.check_database_health() is True
+    assert models.check_database_health() is True
+    assert len(fake_session.calls) == 2
@@ -0,0 +1,41 @@
+# file: backend/tests/unit/test_performance_middleware.py
+"""Unit tests for the request timing middleware's speed bands."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+import performance_middleware
+from performance_middleware import PerformanceMiddleware
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize(
+    "elapsed_ms, expected",
+    [
+        (0.5, "⚡ Fast"),
+        (99.99, "⚡ Fast"),
+        (100, "✅ Good"),
+        (499.9, "✅ Good"),
+        (500, "⚠️ Slow"),
+        (2000, "🐌 Very Slow"),
+        (15000, "🐌 Very Slow"),
+    ],
+)
+def test_speed_band_boundaries(monkeypatch, elapsed_ms, expected):
+    """Each threshold is exclusive: a request at 100ms is Good, not Fast."""
+    fake_logger = MagicMock()
+    monkeypatch.setattr(performance_middleware, "logger", fake_logger)
+
+    middleware = PerformanceMiddleware(app=MagicMock())
+    middleware._log_request_timing(  # pylint: disable=protected-access
+        method="GET",
+        path="/stats/overview",
+        query_params=None,
+        execution_time_ms=elapsed_ms,
+        status_code=200,
+    )
+
+    message = fake_logger.debug.call_args.args[0]
+    assert message.startswith(f"{expected} |")
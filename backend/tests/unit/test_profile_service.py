@@ -0,0 +1,91 @@
+# file: backend/tests/unit/test_profile_service.py
+"""Unit tests for NextDNS profile API response handling."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from profile_service import _handle_api_response
+
+pytestmark = pytest.mark.unit
+
+
+def _response(status_code, payload=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload or {}
+    response.text = "boom"
+    return response
+
+
+@pytest.mark.parametrize(
+    "status_code, name, error",
+    [
+        (404, "Profile abc123 (Not Found)", "Profile not found"),
+        (403, "Profile abc123 (Access Denied)", "Access denied"),
+        (500, "Profile abc123 (Error)", "HTTP 500"),
+    ],
+)
+def test_error_statuses_map_to_profile_error_info(status_code, name, error):
+    """Known and unknown error statuses produce the matching fallback entry."""
+    info = _handle_api_response(_response(status_code), "abc123")
+
+    assert info == {"id": "abc123", "name": name, "error": error}
+
+
+def test_success_returns_profile_fields():
+    """A 200 response is unpacked from the API's data envelope."""
+    payload = {"data": {"name": "Home", "fingerprint": "fp1"}}
+    info = _handle_api_response(_response(200, payload), "abc123")
+
+    assert info["name"] == "Home"
+    assert info["fingerprint"] == "fp1"
+
+
+def test_multiple_profiles_fetch_once_and_reuse_successes(monkeypatch):
+    """Successful lookups are cached; failed ones are retried next time."""
+    import profile_service  # pylint: disable=import-outside-toplevel
+
+    calls = []
+
+    def fake_get_profile_info(profile_id, api_key=None):
+        calls.append((profile_id, api_key))
+        if profile_id == "bad":
+            return {"id": "bad", "name": "Profile bad (Error)", "error": "HTTP 500"}
+        return {"id": profile_id, "name": f"Name {profile_id}"}
+
+    monkeypatch.setattr(profile_service, "_PROFILE_INFO_CACHE", {})
+    monkeypatch.setattr(profile_service, "get_nextdns_api_key", lambda: "key")
+    monkeypatch.setattr(profile_service, "get_profile_info", fake_get_profile_info)
+
+    first = profile_service.get_multiple_profiles_info(["p1", "bad", "p2"])
+    second = profile_service.get_multiple_profiles_info(["p1", "bad", "p2"])
+
+    assert list(first) == ["p1", "bad", "p2"]
+    assert first == second
+    assert sorted(calls) == [
+        ("bad", "key"),
+        ("bad", "key"),
+        ("p1", "key"),
+        ("p2", "key"),
+    ]
+
+
+def test_validate_api_key_uses_shared_session(monkeypatch):
+    """Key checks go through the pooled session; network errors count as rejected."""
+    import requests  # pylint: disable=import-outside-toplevel
+
+    import profile_service  # pylint: disable=import-outside-toplevel
+
+    session = MagicMock()
+    session.get.return_value = _response(200)
+    monkeypatch.setattr(profile_service, "_session", session)
+
+    assert profile_service.validate_api_key("good-key") is True
+    assert session.get.call_args.kwargs["headers"] == {"X-Api-Key": "good-key"}
+
+    session.get.return_value = _response(403)
+    assert profile_service.validate_api_key("bad-key") is False
+
+    session.get.side_effect = requests.exceptions.ConnectionError("down")
+    assert profile_service.validate_api_key("any-key") is False
@@ -5,6 +5,7 @@
 Testing our LEGO automation scheduler setup!
 """
 
+import io
 import os
 from unittest.mock import patch, MagicMock
 
@@ -14,6 +15,15 @@ import pytest
 pytestmark = pytest.mark.unit
 
 
+def _streamed_response(body, status_code=200):
+    """Build a fake streamed requests.Response usable as a context manager."""
+    response = MagicMock(status_code=status_code)
+    # wraps= keeps the real read() while allowing decode_content to be set
+    response.raw = MagicMock(wraps=io.BytesIO(body))
+    response.__enter__.return_value = response
+    return response
+
+
 class TestSchedulerConfiguration:
     """Test scheduler configuration and initialization."""
 
@@ -129,9 +139,133 @@ class TestSchedulerInitialization:
         """fetch_logs returns early without making any API calls when unconfigured."""
         from scheduler import fetch_logs
 
-        with patch("scheduler.requests") as mock_requests:
+        with patch("scheduler.http_session") as mock_session:
+            fetch_logs()
+            mock_session.get.assert_not_called()
+
+    @patch("scheduler.get_nextdns_api_key", return_value="test-key")
+    @patch("scheduler.get_active_profile_ids", return_value=["abc123", "def456"])
+    @patch("scheduler.get_fetch_limit", return_value=100)
+    @patch("scheduler.get_last_fetch_timestamp", return_value=None)
+    @patch("scheduler.get_total_record_count", return_value=0)
+    def test_fetch_logs_reuses_pooled_session(self, *_mocks):
+        """All profiles are fetched through the shared session with a timeout."""
+        from scheduler import fetch_logs, NEXTDNS_REQUEST_TIMEOUT
+
+        with (
+            patch("scheduler.http_session") as mock_session,
+            patch("stats_cache.precompute_frequent_stats"),
+        ):
+            mock_session.get.side_effect = lambda *a, **kw: _streamed_response(
+                b'{"data": []}'
+            )
             fetch_logs()
-            mock_requests.get.assert_not_called()
+
+        assert mock_session.get.call_count == 2
+        for call in mock_session.get.call_args_list:
+            assert call.kwargs["timeout"] == NEXTDNS_REQUEST_TIMEOUT
+            assert call.kwargs["headers"] == {"X-Api-Key": "test-key"}
+            assert call.kwargs["stream"] is True
+
+    def test_read_logs_payload_parses_streamed_body(self):
+        """Only the data array is decoded from the raw response stream."""
+        from scheduler import _read_logs_payload
+
+        response = _streamed_response(
+            b'{"data": [{"domain": "example.com"}], "meta": {"pagination": {}}}'
+        )
+
+        assert _read_logs_payload(response) == [{"domain": "example.com"}]
+        assert response.raw.decode_content is True
+
+    @patch("scheduler.get_nextdns_api_key", return_value="test-key")
+    @patch("scheduler.get_active_profile_ids", return_value=["ok1", "bad", "ok2"])
+    @patch("scheduler.get_fetch_limit", return_value=100)
+    @patch("scheduler.get_total_record_count", return_value=0)
+    def test_fetch_logs_stores_each_profile_independently(self, *_mocks):
+        """A failed profile request does not prevent storing the others."""
+        from scheduler import fetch_logs
+
+        def fake_request(profile_id, _api_key, _limit):
+            return None if profile_id == "bad" else [{"domain": profile_id}]
+
+        with (
+            patch("scheduler._request_profile_logs", side_effect=fake_request),
+            patch("scheduler._store_profile_logs", return_value=(1, 0)) as mock_store,
+            patch("stats_cache.precompute_frequent_stats"),
+        ):
+            fetch_logs()
+
+        stored = [call.args[0] for call in mock_store.call_args_list]
+        assert stored == ["ok1", "ok2"]
+
+    @patch("scheduler.get_nextdns_api_key", return_value="test-key")
+    @patch("scheduler.get_active_profile_ids", return_value=["abc123"])
+    @patch("scheduler.get_fetch_limit", return_value=100)
+    @patch("scheduler.get_total_record_count", return_value=0)
+    def test_fetch_logs_clears_memory_stats_cache_on_new_logs(self, *_mocks):
+        """Memory-only stats entries are dropped once new logs are stored."""
+        from scheduler import fetch_logs
+
+        with (
+            patch(
+                "scheduler._request_profile_logs", return_value=[{"domain": "a.com"}]
+            ),
+            patch("scheduler._store_profile_logs", return_value=(1, 0)),
+            patch("stats_cache.invalidate_memory_cache") as mock_invalidate,
+            patch("stats_cache.precompute_frequent_stats"),
+        ):
+            fetch_logs()
+
+        mock_invalidate.assert_called_once_with()
+
+    def test_http_session_mounts_retrying_adapter(self):
+        """The shared session retries transient NextDNS failures."""
+        import scheduler
+
+        adapter = scheduler.http_session.get_adapter("https://api.nextdns.io")
+        assert adapter.max_retries.total == 3
+        assert 429 in adapter.max_retries.status_forcelist
+
+
+class TestSchedulerLifecycle:
+    """The scheduler is started explicitly, never as an import side effect."""
+
+    def test_import_does_not_start_scheduler(self):
+        """Importing the module leaves the scheduler stopped."""
+        import importlib
+        import scheduler
+
+        importlib.reload(scheduler)
+
+        assert scheduler.scheduler.running is False
+
+    def test_start_registers_jobs_once_with_safe_defaults(self):
+        """start_scheduler() is idempotent and jobs never overlap or pile up."""
+        import importlib
+        import scheduler
+
+        importlib.reload(scheduler)
+        try:
+            with patch.object(scheduler, "partition_maintenance_job") as ensure:
+                started = scheduler.start_scheduler()
+                assert scheduler.start_scheduler() is started
+            ensure.assert_called_once_with()
+
+            job = started.get_job("fetch_logs")
+            assert job.coalesce is True
+            assert job.max_instances == 1
+            assert job.misfire_grace_time == 300
+            assert {j.id for j in started.get_jobs()} == {
+                "fetch_logs",
+                "partition_maintenance",
+                "retention_cleanup",
+                "precompute_heavy_stats",
+            }
+        finally:
+            scheduler.shutdown_scheduler(wait=False)
+
+        assert scheduler.scheduler.running is False
 
 
 class TestEnvironmentConfiguration:
@@ -145,6 +145,22 @@ class TestGetSetSetting:
             set_setting("update_key", "second")
             assert get_setting("update_key") == "second"
 
+    def test_get_setting_is_cached_until_set(self, test_db):
+        """Repeated reads reuse the cached value; set_setting drops it."""
+        from models import get_setting, set_setting
+
+        with _make_session_patcher(test_db) as mock_factory:
+            set_setting("cached_key", "first")
+            assert get_setting("cached_key") == "first"
+            reads = mock_factory.call_count
+            assert get_setting("cached_key") == "first"
+            assert get_setting("missing_key") is None
+            assert get_setting("missing_key") is None
+            assert mock_factory.call_count == reads + 1
+
+            set_setting("cached_key", "second")
+            assert get_setting("cached_key") == "second"
+
 
 class TestApiKeyHelpers:
     """Test get_nextdns_api_key / set_nextdns_api_key helpers."""
@@ -225,6 +241,26 @@ class TestProfileHelpers:
             assert "p3" in active
             assert "p2" not in active
 
+    def test_get_active_profile_ids_cache_follows_profile_changes(self, test_db):
+        """Cached IDs are dropped whenever a profile is added, toggled or deleted."""
+        from models import (
+            add_profile,
+            delete_profile,
+            update_profile_enabled,
+            get_active_profile_ids,
+        )
+
+        with _make_session_patcher(test_db):
+            add_profile("p1")
+            assert get_active_profile_ids() == ["p1"]
+            add_profile("p2")
+            assert get_active_profile_ids() == ["p1", "p2"]
+            update_profile_enabled("p1", False)
+            assert get_active_profile_ids() == ["p2"]
+            update_profile_enabled("p1", True)
+            delete_profile("p2")
+            assert get_active_profile_ids() == ["p1"]
+
     def test_get_active_profile_ids_falls_back_to_env(self, test_db, monkeypatch):
         """Falls back to PROFILE_IDS env var when DB table is empty."""
         from models import get_active_profile_ids
@@ -8,8 +8,11 @@ real database connection is required.
 
 Coverage targets:
   - make_cache_key: key format, sorting, None profile, extra kwargs
-  - get_cached:     L1 hit, L2 hit + L1 warm, invalid JSON, full miss
-  - store_cached:   L1 write, DB upsert, serialization error, overwrite
+  - exclude_fingerprint: order/duplicate independence
+  - get_cached:     L1 hit, L2 hit + L1 warm, invalid JSON, full miss,
+                    memory-only lookups
+  - store_cached:   L1 write, DB upsert, serialization error, overwrite,
+                    memory-only writes
   - invalidate_memory_cache: clear all, clear by profile, no-op on miss
   - precompute_all_stats: full run, empty profiles, per-stat error isolation,
                            granularity mapping, group_by, exclusion defaults
@@ -28,6 +31,7 @@ from stats_cache import (
     FREQUENT_PRECOMPUTE_RANGES,
     HEAVY_PRECOMPUTE_RANGES,
     PRECOMPUTE_RANGES,
+    exclude_fingerprint,
     get_cached,
     invalidate_memory_cache,
     make_cache_key,
@@ -183,6 +187,27 @@ class TestMakeCacheKey:
         assert key == "timeseries:profile_p1:range_7d:gran_day:group_status"
 
 
+# ---------------------------------------------------------------------------
+# exclude_fingerprint
+# ---------------------------------------------------------------------------
+
+
+class TestExcludeFingerprint:
+    """exclude_fingerprint maps equivalent exclude lists to one key part."""
+
+    def test_order_and_duplicates_do_not_matter(self):
+        """The same set of patterns yields the same fingerprint."""
+        a = exclude_fingerprint(["*.apple.com", "google.com"])
+        b = exclude_fingerprint(["google.com", " *.apple.com", "google.com", ""])
+
+        assert a == b
+        assert len(a) == 16
+
+    def test_different_sets_differ(self):
+        """Different pattern sets produce different fingerprints."""
+        assert exclude_fingerprint(["a.com"]) != exclude_fingerprint(["b.com"])
+
+
 # ---------------------------------------------------------------------------
 # get_cached
 # ---------------------------------------------------------------------------
@@ -265,6 +290,14 @@ class TestGetCached:
 
         assert result == payload
 
+    def test_non_persistent_miss_skips_db(self):
+        """Memory-only lookups never fall through to the DB cache."""
+        with patch("stats_cache.get_db_stats_cache") as mock_db:
+            result = get_cached("filtered:key", persistent=False)
+
+        assert result is None
+        mock_db.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # store_cached
@@ -348,6 +381,14 @@ class TestStoreCached:
         _, payload = mock_upsert.call_args[0]
         assert json.loads(payload) == value
 
+    def test_non_persistent_store_skips_db(self):
+        """Memory-only writes land in L1 without touching the DB cache."""
+        with patch("stats_cache.upsert_db_stats_cache") as mock_upsert:
+            store_cached("filtered:key", {"v": 1}, persistent=False)
+
+        assert stats_cache._MEMORY_CACHE["filtered:key"] == {"v": 1}
+        mock_upsert.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # invalidate_memory_cache
@@ -282,3 +282,17 @@ def test_build_domain_exclusion_filter_returns_none_for_empty():
 
     filter_cond = build_domain_exclusion_filter(DNSLog.domain, None)
     assert filter_cond is None
+
+
+@pytest.mark.unit
+def test_build_domain_exclusion_filter_drops_case_duplicates():
+    """Patterns repeated in a different case are bound only once."""
+    filter_cond = build_domain_exclusion_filter(
+        DNSLog.domain,
+        ["Facebook.com", "facebook.com", "*.Apple.com", "*.apple.com"],
+    )
+    compiled = filter_cond.compile(compile_kwargs={"literal_binds": True})
+    sql = str(compiled).lower()
+
+    assert sql.count("'facebook.com'") == 1
+    assert sql.count("apple.com") == 1
@@ -66,8 +66,9 @@ def main():
     # Import and start the scheduler
     logger.info("🔄 Starting NextDNS log fetch scheduler...")
     try:
-        from scheduler import scheduler  # pylint: disable=unused-import
+        from scheduler import start_scheduler
 
+        start_scheduler()
         logger.info("✅ Scheduler started successfully")
 
         # Log scheduler configuration (reads from DB)
@@ -114,6 +115,9 @@ def main():
             if os.getenv("LOG_LEVEL", "INFO").upper() == "DEBUG":
                 logger.debug("💓 Worker heartbeat: scheduler running")
 
+    from scheduler import shutdown_scheduler
+
+    shutdown_scheduler()
     logger.info("🛑 Worker stopped gracefully")
 
 